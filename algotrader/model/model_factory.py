@@ -192,7 +192,7 @@ class ModelFactory(object):
     def build_time_series(series_id: str, series_cls: str = None, desc: str = None, keys: List[str] = None,
                           inputs: List = None, input_keys: Dict[str, List[str]] = None,
                           default_output_key: str = 'value', missing_value_replace: float = 0.0,
-                          **kwargs) -> TimeSeries:
+                          dtypes: Dict[str, str] = None, **kwargs) -> TimeSeries:
         time_series = TimeSeries()
         time_series.series_id = series_id
         if series_cls:
@@ -208,11 +208,19 @@ class ModelFactory(object):
                 ModelFactory.add_time_series_input(time_series, input_name, input_key)
         time_series.default_output_key = default_output_key
         time_series.missing_value_replace = missing_value_replace
+        if dtypes:
+            time_series.configs["dtypes"] = ",".join("%s:%s" % (key, dtype) for key, dtype in dtypes.items())
 
         for key, value in kwargs.items():
             time_series.configs[key] = str(value)
         return time_series
 
+    @staticmethod
+    def build_time_series_item(timestamp: int, data: Dict[str, float] = None) -> TimeSeriesItem:
+        item = TimeSeriesItem()
+        ModelFactory.update_time_series_item(item, timestamp=timestamp, data=data)
+        return item
+
     @staticmethod
     def add_time_series_item(time_series: TimeSeries, timestamp: int, data: Dict[str, float] = None) -> TimeSeriesItem:
         item = time_series.items.add()
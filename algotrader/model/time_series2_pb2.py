@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: algotrader/model/time_series2.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#algotrader/model/time_series2.proto\x12\x11\x61lgotrader.model2\"Z\n\x10\x44oubleTimeSeries\x12\x11\n\tseries_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\n \x03(\x03\x12\x0e\n\x06values\x18\x0b \x03(\x01\"Y\n\x0fInt32TimeSeries\x12\x11\n\tseries_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\n \x03(\x03\x12\x0e\n\x06values\x18\x0b \x03(\x05\"Y\n\x0fInt64TimeSeries\x12\x11\n\tseries_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\n \x03(\x03\x12\x0e\n\x06values\x18\x0b \x03(\x03\"X\n\x0e\x42oolTimeSeries\x12\x11\n\tseries_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\n \x03(\x03\x12\x0e\n\x06values\x18\x0b \x03(\x08\"Z\n\x10StringTimeSeries\x12\x11\n\tseries_id\x18\x01 \x01(\t\x12\x10\n\x08\x66rame_id\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\n \x03(\x03\x12\x0e\n\x06values\x18\x0b \x03(\t\"\x94\x06\n\tDataFrame\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x03(\x03\x12\x41\n\x0b\x64ouble_data\x18\n \x03(\x0b\x32,.algotrader.model2.DataFrame.DoubleDataEntry\x12;\n\x08int_data\x18\x0b \x03(\x0b\x32).algotrader.model2.DataFrame.IntDataEntry\x12=\n\tlong_data\x18\x0c \x03(\x0b\x32*.algotrader.model2.DataFrame.LongDataEntry\x12=\n\tbool_data\x18\r \x03(\x0b\x32*.algotrader.model2.DataFrame.BoolDataEntry\x12\x41\n\x0bstring_data\x18\x0e \x03(\x0b\x32,.algotrader.model2.DataFrame.StringDataEntry\x1aV\n\x0f\x44oubleDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x32\n\x05value\x18\x02 \x01(\x0b\x32#.algotrader.model2.DoubleTimeSeries:\x02\x38\x01\x1aR\n\x0cIntDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x31\n\x05value\x18\x02 \x01(\x0b\x32\".algotrader.model2.Int32TimeSeries:\x02\x38\x01\x1aS\n\rLongDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x31\n\x05value\x18\x02 \x01(\x0b\x32\".algotrader.model2.Int64TimeSeries:\x02\x38\x01\x1aR\n\rBoolDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x30\n\x05value\x18\x02 \x01(\x0b\x32!.algotrader.model2.BoolTimeSeries:\x02\x38\x01\x1aV\n\x0fStringDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x32\n\x05value\x18\x02 \x01(\x0b\x32#.algotrader.model2.StringTimeSeries:\x02\x38\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'algotrader.model.time_series2_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _DATAFRAME_DOUBLEDATAENTRY._options = None
+  _DATAFRAME_DOUBLEDATAENTRY._serialized_options = b'8\001'
+  _DATAFRAME_INTDATAENTRY._options = None
+  _DATAFRAME_INTDATAENTRY._serialized_options = b'8\001'
+  _DATAFRAME_LONGDATAENTRY._options = None
+  _DATAFRAME_LONGDATAENTRY._serialized_options = b'8\001'
+  _DATAFRAME_BOOLDATAENTRY._options = None
+  _DATAFRAME_BOOLDATAENTRY._serialized_options = b'8\001'
+  _DATAFRAME_STRINGDATAENTRY._options = None
+  _DATAFRAME_STRINGDATAENTRY._serialized_options = b'8\001'
+  _DOUBLETIMESERIES._serialized_start=58
+  _DOUBLETIMESERIES._serialized_end=148
+  _INT32TIMESERIES._serialized_start=150
+  _INT32TIMESERIES._serialized_end=239
+  _INT64TIMESERIES._serialized_start=241
+  _INT64TIMESERIES._serialized_end=330
+  _BOOLTIMESERIES._serialized_start=332
+  _BOOLTIMESERIES._serialized_end=420
+  _STRINGTIMESERIES._serialized_start=422
+  _STRINGTIMESERIES._serialized_end=512
+  _DATAFRAME._serialized_start=515
+  _DATAFRAME._serialized_end=1303
+  _DATAFRAME_DOUBLEDATAENTRY._serialized_start=876
+  _DATAFRAME_DOUBLEDATAENTRY._serialized_end=962
+  _DATAFRAME_INTDATAENTRY._serialized_start=964
+  _DATAFRAME_INTDATAENTRY._serialized_end=1046
+  _DATAFRAME_LONGDATAENTRY._serialized_start=1048
+  _DATAFRAME_LONGDATAENTRY._serialized_end=1131
+  _DATAFRAME_BOOLDATAENTRY._serialized_start=1133
+  _DATAFRAME_BOOLDATAENTRY._serialized_end=1215
+  _DATAFRAME_STRINGDATAENTRY._serialized_start=1217
+  _DATAFRAME_STRINGDATAENTRY._serialized_end=1303
+# @@protoc_insertion_point(module_scope)
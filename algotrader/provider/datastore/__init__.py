@@ -76,6 +76,10 @@ class TimeSeriesDataStore(DataStore, Feed):
     def save_time_series(self, time_series):
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def save_time_series_items(self, series_id, items):
+        raise NotImplementedError()
+
     def unsubscribe_mktdata(self, *sub_keys):
         pass
 
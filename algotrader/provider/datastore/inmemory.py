@@ -28,6 +28,7 @@ class InMemoryDataStore(SimpleDataStore):
         self.trades = self._get_data('trades')
         self.market_depths = self._get_data('market_depths')
         self.time_series = self._get_data('time_series')
+        self.time_series_items = self._get_data('time_series_items')
 
         self.instruments = self._get_data('instruments')
         self.currencies = self._get_data('currencies')
@@ -128,6 +129,11 @@ class InMemoryDataStore(SimpleDataStore):
         id, packed = self._serialize(timeseries)
         self.time_series[id] = packed
 
+    def save_time_series_items(self, series_id, items):
+        if series_id not in self.time_series_items:
+            self.time_series_items[series_id] = []
+        self.time_series_items[series_id].extend([model_to_dict(item) for item in items])
+
     def __matches_data(self, data, inst_id, from_timestamp, to_timestamp):
         return inst_id == data.inst_id and data.timestamp >= from_timestamp and data.timestamp < to_timestamp
 
@@ -110,6 +110,15 @@ class MongoDBDataStore(SimpleDataStore):
     def save_time_series(self, time_series: TimeSeries):
         self.save(time_series)
 
+    def save_time_series_items(self, series_id: str, items):
+        packed_items = []
+        for item in items:
+            packed_item = protobuf_to_dict(item)
+            packed_item['series_id'] = series_id
+            packed_items.append(packed_item)
+        if packed_items:
+            self.db['time_series_items'].insert_many(packed_items)
+
     def save_bar(self, bar: Bar):
         self.save(bar)
 
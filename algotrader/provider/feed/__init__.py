@@ -1,12 +1,13 @@
 import abc
 
+import numpy as np
 import pandas as pd
 
 from algotrader.model.market_data_pb2 import *
 from algotrader.model.model_factory import ModelFactory
 from algotrader.provider import Provider
 from algotrader.utils.date import datestr_to_unixtimemillis, datetime_to_unixtimemillis
-from algotrader.utils.market_data import D1
+from algotrader.utils.market_data import D1, get_bar_series_id
 
 
 class Feed(Provider):
@@ -69,6 +70,26 @@ class PandasDataFeed(Feed):
                 bar = self._build_bar(row, timestamp)
                 self.app_context.event_bus.data_subject.on_next(bar)
 
+    def load_series(self, *sub_reqs):
+        """
+        bulk load the requested history into the bar series of the InstrumentDataManager with one
+        DataSeries.extend per instrument, instead of replaying it bar by bar on the event bus
+        """
+        self._verify_subscription(*sub_reqs)
+        insts = {sub_req.inst_id: self.app_context.ref_data_mgr.get_inst(inst_id=sub_req.inst_id) for sub_req in
+                 sub_reqs}
+        dfs = self._load_dataframes(insts, *sub_reqs)
+        for sub_req, df in zip(sub_reqs, dfs):
+            df = df.sort_index()
+            timestamps = df.index.values.astype('datetime64[ms]').astype(np.int64)
+            from_timestamp = datestr_to_unixtimemillis(str(sub_req.from_date))
+            to_timestamp = datestr_to_unixtimemillis(str(sub_req.to_date))
+            mask = (timestamps >= from_timestamp) & (timestamps < to_timestamp if to_timestamp else True)
+            self.app_context.inst_data_mgr.preload_series(
+                get_bar_series_id(sub_req.inst_id, sub_req.bar_type, sub_req.bar_size), timestamps[mask],
+                {"open": df['Open'].values[mask], "high": df['High'].values[mask], "low": df['Low'].values[mask],
+                 "close": df['Close'].values[mask], "vol": df['Volume'].values[mask]})
+
     def _build_bar(self, row, timestamp) -> Bar:
         return ModelFactory.build_bar(
             inst_id=row['InstId'],
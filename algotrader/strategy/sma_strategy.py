@@ -16,11 +16,9 @@ class SMAStrategy(Strategy):
         self.bar = self.app_context.inst_data_mgr.get_series(
             "Bar.%s.Time.86400" % self.instruments[0])
 
-        self.sma_fast = SMA(self.bar, 'close', 10)
-        self.sma_fast.start(app_context)
-
-        self.sma_slow = SMA(self.bar, 'close', 25)
-        self.sma_slow.start(app_context)
+        graph = self.app_context.inst_data_mgr.graph
+        self.sma_fast = graph.get_or_create(app_context, SMA, inputs=self.bar, input_keys='close', length=10)
+        self.sma_slow = graph.get_or_create(app_context, SMA, inputs=self.bar, input_keys='close', length=25)
 
         super(SMAStrategy, self)._start(app_context)
 
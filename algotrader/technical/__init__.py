@@ -1,15 +1,19 @@
+import json
+from collections import OrderedDict
+
+import numpy as np
 from typing import Dict, List
 
 from algotrader import Context
 from algotrader.model.model_factory import ModelFactory
-from algotrader.model.time_series_pb2 import TimeSeriesUpdateEvent
-from algotrader.trading.data_series import DataSeries
+from algotrader.trading.data_series import DataSeries, TimeSeriesBatchUpdateEvent, TimeSeriesRowEvent
 from algotrader.utils.data_series import build_series_id
 from algotrader.utils.model import get_full_cls_name
 
 
 class Indicator(DataSeries):
     VALUE = 'value'
+    STATE_TIMESTAMP = 'timestamp'
 
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc=None,
                  keys: List[str] = None,
@@ -32,7 +36,6 @@ class Indicator(DataSeries):
         if inputs:
             if not isinstance(inputs, list):
                 return [inputs]
-        else:
             return inputs
         return []
 
@@ -66,19 +69,150 @@ class Indicator(DataSeries):
         self._load_and_subscribe_inputs()
 
     def _load_and_subscribe_inputs(self):
+        restored = self._restore_state()
         for input in self.input_series:
-            for timestamp, data in zip(input.get_timestamp(), input.get_data()):
-                # TODO handle multiple input_series....
-                # if timestamp has been processed, we should skipped the update.....
-                if timestamp not in self.time_list:
-                    # TODO don't think we should put this filter logic here, the logic should be move to `_process_update`
-                    if input.time_series.keys:
-                        filtered_data = {key: data[key] for key in input.time_series.keys}
-                        self._process_update(source=input.id(), timestamp=timestamp, data=filtered_data)
-                    else:
-                        self._process_update(source=input.id(), timestamp=timestamp, data=data)
-
-            input.subject.subscribe(self.on_update)
+            # TODO handle multiple input_series....
+            if restored or not self._backfill(input):
+                # rows up to our own end time have been processed already, resume right after it
+                timestamps = input.get_timestamp()
+                start = self.__get_start(input)
+                if start > 0 and not restored:
+                    self._resume(input, start)
+                for pos in range(start, input.size()):
+                    self._process_update(source=input.id(), timestamp=int(timestamps[pos]), data=input.get_row(pos))
+
+        self.app_context.inst_data_mgr.graph.add(self, self._get_dependencies())
+
+    def _get_dependencies(self) -> List[DataSeries]:
+        """
+        :return: series the indicator reads, it is updated after all of them. Indicators reading other indicators
+        besides their inputs add them
+        """
+        return self.input_series
+
+    def __get_start(self, input: DataSeries) -> int:
+        """
+        :return: position of the first row of input not processed yet
+        """
+        return input.asof_index(self.current_time()) + 1 if self.size() > 0 else 0
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        vectorized implementation of the indicator over the whole history of a single input
+        :param arrays: column of the input for each of its input keys (all keys without input keys)
+        :return: output columns, as long as the input columns. None when there is no vectorized implementation,
+        the rows are then processed one by one
+        """
+        return None
+
+    def _get_batch_keys(self, input: DataSeries) -> List[str]:
+        """
+        :return: keys of input passed to compute_batch
+        """
+        return self.first_input_keys if self.first_input_keys else input.buffer.keys()
+
+    def _backfill(self, input: DataSeries) -> bool:
+        """
+        process the rows of input after the latest processed one with compute_batch, then seed the streaming
+        state from the input history so that the following updates give the very same values as if every row
+        had been processed one by one
+        :return: False when there is no row to process or compute_batch is not available
+        """
+        if len(self.input_series) != 1:
+            return False
+        start = self.__get_start(input)
+        end = input.size()
+        if start >= end:
+            return False
+        outputs = self.compute_batch(
+            {key: input.get_by_idx(slice(0, end), key) for key in self._get_batch_keys(input)})
+        if outputs is None:
+            return False
+        self.extend(timestamps=input.get_timestamp()[start:end],
+                    columns=OrderedDict((key, values[start:]) for key, values in outputs.items()))
+        self._create_kernels()
+        self._resume(input, end)
+        return True
+
+    def _create_kernels(self):
+        """
+        create the streaming state of the indicator, called on start and before it is seeded by _resume
+        """
+        pass
+
+    def _resume(self, input: DataSeries, end: int):
+        """
+        called for an indicator restored with the rows of input before position end already processed,
+        before the rest are replayed. Streaming indicators refill their kernels from those rows
+        """
+        pass
+
+    def get_state(self) -> Dict[str, object]:
+        """
+        :return: streaming state of the indicator after its latest row as JSON serializable values, persisted with
+        the series and restored with set_state on restart. None when the state cannot be persisted, a restored
+        indicator then resumes from its input history
+        """
+        return None
+
+    def set_state(self, state: Dict[str, object]) -> None:
+        """
+        restore the state of get_state, called on start after _create_kernels
+        """
+        pass
+
+    def sync_time_series(self):
+        self.time_series.ClearField('state')
+        state = self.get_state() if getattr(self, 'started', False) and self.size() > 0 else None
+        if state is not None:
+            self.time_series.state[Indicator.STATE_TIMESTAMP] = json.dumps(self.current_time())
+            for key, value in state.items():
+                self.time_series.state[key] = json.dumps(value)
+        return super(Indicator, self).sync_time_series()
+
+    def _restore_state(self) -> bool:
+        """
+        :return: True when the persisted state is the one after the latest row and has been restored
+        """
+        if self.size() == 0 or Indicator.STATE_TIMESTAMP not in self.time_series.state:
+            return False
+        state = {key: json.loads(value) for key, value in self.time_series.state.items()}
+        if state.pop(Indicator.STATE_TIMESTAMP) != self.current_time():
+            return False
+        self.set_state(state)
+        return True
+
+    def _update_kernel(self, kernel, timestamp: int, value: float) -> None:
+        """
+        push value to kernel for a new row, replace its latest value for an update of the latest row
+        """
+        if self.size() > 0 and timestamp == self.current_time():
+            kernel.replace(value)
+        else:
+            kernel.push(value)
+
+    def _get_aligned(self, series: DataSeries, size: int, key: str = None) -> np.ndarray:
+        """
+        values of a series computed from the first input, e.g. a shared node of the graph, at the timestamps of
+        the first size rows of the first input. The series may have been created or restored with another
+        history start or retention, rows it does not have are NaN
+        """
+        timestamps = np.asarray(self.first_input.get_timestamp()[:size], dtype=np.int64)
+        series_timestamps = np.asarray(series.get_timestamp(), dtype=np.int64)
+        if len(series_timestamps) == 0:
+            return np.full(len(timestamps), np.nan)
+        values = np.asarray(series.get_by_idx(slice(None), key if key else Indicator.VALUE), dtype=np.float64)
+        pos = np.minimum(np.searchsorted(series_timestamps, timestamps), len(series_timestamps) - 1)
+        return np.where(series_timestamps[pos] == timestamps, values[pos], np.nan)
+
+    def _get_first_input_key(self) -> str:
+        return self.first_input_keys[0] if self.first_input_keys else self.first_input.time_series.keys[0]
+
+    def _get_first_input_value(self, data: Dict[str, float]) -> float:
+        """
+        :return: value of the first input key in a row of the first input
+        """
+        return data.get(self._get_first_input_key(), self.first_input.time_series.missing_value_replace)
 
     def get_input(self, idx: int) -> str:
         return self.input_series[idx]
@@ -92,13 +226,26 @@ class Indicator(DataSeries):
 
         self.app_context.inst_data_mgr.add_series(self)
 
+        self._create_kernels()
         self._init_inputs()
 
     def _stop(self):
         pass
 
-    def on_update(self, event: TimeSeriesUpdateEvent):
-        self._process_update(event.source, event.item.timestamp, event.item.data)
+    def on_update(self, event: TimeSeriesRowEvent):
+        if isinstance(event, TimeSeriesBatchUpdateEvent):
+            self._process_batch_update(event)
+        else:
+            self._process_update(event.source, event.timestamp, event.data)
+
+    def _process_batch_update(self, event: TimeSeriesBatchUpdateEvent):
+        """
+        handle rows appended by DataSeries.extend, in one compute_batch call when the indicator has one
+        """
+        if self._backfill(self.input_series[self.input_names_pos[event.source]]):
+            return
+        for timestamp, data in event.rows():
+            self._process_update(event.source, timestamp, data)
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         raise NotImplementedError()
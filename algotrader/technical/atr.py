@@ -1,14 +1,71 @@
-from typing import Dict
+import numpy as np
+from typing import Dict, List
 
+from algotrader import Context
 from algotrader.technical import Indicator
 from algotrader.technical.ma import SMA
 
 
+class TrueRange(Indicator):
+    """
+    max(high, previous close) - min(low, previous close), high - low on the first bar
+    """
+    __slots__ = (
+        '__prev_close',
+        '__last_close',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=['high', 'low', 'close'], desc="True Range"):
+        super(TrueRange, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc)
+
+    def _create_kernels(self):
+        self.__prev_close = None
+        self.__last_close = None
+
+    def __get_keys(self) -> List[str]:
+        return self.first_input_keys if self.first_input_keys else ['high', 'low', 'close']
+
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            self.__last_close = input.get_by_idx(end - 1, self.__get_keys()[2])
+
+    def get_state(self):
+        return {'prev_close': self.__prev_close, 'last_close': self.__last_close}
+
+    def set_state(self, state):
+        self.__prev_close = state['prev_close']
+        self.__last_close = state['last_close']
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        high, low, close = [np.asarray(arrays[key], dtype=np.float64) for key in self.__get_keys()]
+        prev_close = np.concatenate(([np.nan], close[:-1]))
+        tr = high - low
+        tr[1:] = np.fmax(np.fmax(tr[1:], np.abs(high[1:] - prev_close[1:])), np.abs(low[1:] - prev_close[1:]))
+        return {Indicator.VALUE: tr}
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        high_key, low_key, close_key = self.__get_keys()
+        if not (self.size() > 0 and timestamp == self.current_time()):
+            self.__prev_close = self.__last_close
+        self.__last_close = data[close_key]
+
+        high = data[high_key]
+        low = data[low_key]
+        if self.__prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self.__prev_close), abs(low - self.__prev_close))
+
+        self.add(timestamp=timestamp, data={Indicator.VALUE: tr})
+
+
 class ATR(Indicator):
+    """
+    SMA of the TrueRange. Both are shared nodes of the indicator graph, an ATR and any other indicator over the
+    same true range or its average reuse them
+    """
     __slots__ = (
         'length',
-        '__prev_close',
-        '__value',
         '__average',
     )
 
@@ -17,30 +74,26 @@ class ATR(Indicator):
         super(ATR, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
                                   length=length)
         self.length = self.get_int_config("length", 14)
-        self.__prev_close = None
-        self.__value = None
-        self.__average = SMA(inputs=inputs, length=self.length)
 
-    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        sma_input = {}
-        high = data['high']
-        low = data['low']
-        close = data['close']
+    def _start(self, app_context: Context) -> None:
+        graph = self.app_context.inst_data_mgr.graph
+        source = self.time_series.inputs[0]
+        true_range = graph.get_or_create(self.app_context, TrueRange, inputs=source.source,
+                                         input_keys=list(source.keys) if source.keys else None)
+        self.__average = graph.get_or_create(self.app_context, SMA, inputs=true_range, length=self.length)
+        super(ATR, self)._start(self.app_context)
 
-        if self.__prev_close is None:
-            tr = high - low
-        else:
-            tr1 = high - low
-            tr2 = abs(high - self.__prev_close)
-            tr3 = abs(low - self.__prev_close)
-            tr = max(max(tr1, tr2), tr3)
+    def _get_dependencies(self):
+        return self.input_series + [self.__average]
 
-        self.__prev_close = close
+    def get_state(self):
+        return {}
 
-        sma_input[Indicator.VALUE] = tr
-        self.__average.add(timestamp=timestamp, data=sma_input)
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        size = len(next(iter(arrays.values())))
+        return {Indicator.VALUE: self._get_aligned(self.__average, size)}
 
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         result = {}
-        # result['timestamp'] = data['timestamp']
-        result[Indicator.VALUE] = self.__average.now(Indicator.VALUE)
+        result[Indicator.VALUE] = self.__average.get_by_time(timestamp, Indicator.VALUE)
         self.add(timestamp=timestamp, data=result)
@@ -1,34 +1,61 @@
 import numpy as np
 from typing import Dict
 
+from algotrader import Context
 from algotrader.technical import Indicator
 from algotrader.technical.ma import SMA
 from algotrader.technical.stats import STD
 
 
 class BB(Indicator):
+    """
+    Bollinger Bands, SMA +/- num_std STD. The SMA and STD are shared nodes of the indicator graph
+    """
     UPPER = 'uppper'
     LOWER = 'lower'
 
     __slots__ = (
         'length',
-        'num_std'
+        'num_std',
         '__sma',
         '__std_dev',
     )
 
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Bollinger Bands", length=14, num_std=3):
-        super(SMA, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length, num_std=num_std)
+        super(BB, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                 keys=[Indicator.VALUE, BB.UPPER, BB.LOWER], length=length, num_std=num_std)
         self.length = self.get_int_config("length", 14)
-        self.num_std = self.get_int_config("num_std", 3)
-        self.__sma = SMA(inputs=inputs, length=self.length)
-        self.__std_dev = STD(inputs=inputs, length=self.length)
+        self.num_std = self.get_float_config("num_std", 3)
+
+    def _start(self, app_context: Context) -> None:
+        graph = self.app_context.inst_data_mgr.graph
+        source = self.time_series.inputs[0]
+        input_keys = list(source.keys) if source.keys else None
+        self.__sma = graph.get_or_create(self.app_context, SMA, inputs=source.source, input_keys=input_keys,
+                                         length=self.length)
+        self.__std_dev = graph.get_or_create(self.app_context, STD, inputs=source.source, input_keys=input_keys,
+                                             length=self.length)
+        super(BB, self)._start(self.app_context)
+
+    def _get_dependencies(self):
+        return self.input_series + [self.__sma, self.__std_dev]
+
+    def get_state(self):
+        return {}
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        size = len(next(iter(arrays.values())))
+        sma = self._get_aligned(self.__sma, size)
+        std = self._get_aligned(self.__std_dev, size)
+        valid = ~np.isnan(sma)
+        return {Indicator.VALUE: sma,
+                BB.UPPER: np.where(valid, sma + std * self.num_std, np.nan),
+                BB.LOWER: np.where(valid, sma - std * self.num_std, np.nan)}
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         result = {}
-        sma = self.__sma.now(self.input_keys[0])
-        std = self.__std_dev.now(self.input_keys[0])
+        sma = self.__sma.get_by_time(timestamp, Indicator.VALUE)
+        std = self.__std_dev.get_by_time(timestamp, Indicator.VALUE)
         if not np.isnan(sma):
             upper = sma + std * self.num_std
             lower = sma - std * self.num_std
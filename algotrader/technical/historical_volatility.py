@@ -4,30 +4,81 @@ import numpy as np
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import RollingSum, batch_rolling, get_kernel_state, set_kernel_state
 
 
 class HistoricalVolatility(Indicator):
+    """
+    sqrt(ann_factor * sum of the squared log returns over the last length values / (length - ddof)).
+    ddof defaults to 0, 1 divides by the number of returns in the window
+    """
     __slots__ = (
-        'length'
-        'ann_factor'
+        'length',
+        'ann_factor',
+        'ddof',
+        '__kernel',
+        '__prev',
+        '__last',
     )
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Historical Volatility", length=0, ann_factor=252):
-        super(HistoricalVolatility, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length,ann_factor=ann_factor)
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Historical Volatility", length=0,
+                 ann_factor=252, **kwargs):
+        super(HistoricalVolatility, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys,
+                                                   desc=desc, length=length, ann_factor=ann_factor, **kwargs)
         self.length = self.get_int_config("length", 0)
         self.ann_factor = self.get_int_config("ann_factor", 252)
+        self.ddof = self.get_int_config("ddof", 0)
+
+    def _create_kernels(self):
+        # squared log returns, a window of length values has length - 1 of them
+        self.__kernel = RollingSum(self.length - 1)
+        self.__prev = None
+        self.__last = None
+
+    def _resume(self, input, end: int):
+        if input is self.first_input and end > 0:
+            # the value before the first return pushed is needed as well
+            for pos in range(self.__kernel.get_history_start(end - 1) if end > 1 else 0, end):
+                self.__push(self._get_first_input_value(input.get_row(pos)))
+
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel), 'prev': self.__prev, 'last': self.__last}
+
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
+        self.__prev = state['prev']
+        self.__last = state['last']
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = np.asarray(arrays[self._get_first_input_key()], dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            squared = np.where((values[1:] > 0) & (values[:-1] > 0), np.log(values[1:] / values[:-1]) ** 2, np.nan)
+        result = np.full(len(values), np.nan)
+        sums = batch_rolling(squared, self.length - 1, lambda windows: windows.sum(axis=1))
+        result[1:] = np.sqrt(self.ann_factor * sums / (self.length - self.ddof))
+        return {Indicator.VALUE: result}
+
+    def __push(self, value: float) -> None:
+        self.__prev = self.__last
+        self.__last = value
+        if self.__prev is not None:
+            self.__kernel.push(self.__squared_return(self.__prev, value))
+
+    def __squared_return(self, prev: float, value: float) -> float:
+        return math.log(value / prev) ** 2 if value > 0 and prev > 0 else np.nan
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        value = self._get_first_input_value(data)
+        if self.size() > 0 and timestamp == self.current_time():
+            self.__last = value
+            if self.__prev is not None:
+                self.__kernel.replace(self.__squared_return(self.__prev, value))
+        else:
+            self.__push(value)
+
         result = {}
-        if self.first_input.size() >= self.length:
-            sum_ret_sq = 0.0
-            for idx in range(self.first_input.size() - self.length + 1, self.first_input.size()):
-                x_t = self.first_input.get_by_idx(idx, self.first_input_keys[0])
-                x_t_1 = self.first_input.get_by_idx(idx - 1, self.first_input_keys[0])
-                ret = math.log(x_t / x_t_1)
-                sum_ret_sq += ret ** 2
-            result[Indicator.VALUE] = math.sqrt(self.ann_factor * sum_ret_sq / self.length)
+        if self.__kernel.is_full():
+            result[Indicator.VALUE] = math.sqrt(self.ann_factor * self.__kernel.get_sum() / (self.length - self.ddof))
         else:
             result[Indicator.VALUE] = np.nan
 
@@ -0,0 +1,784 @@
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+from typing import Dict
+
+
+def get_kernel_state(kernel) -> Dict[str, object]:
+    """
+    :return: the __slots__ of kernel as JSON serializable values
+    """
+    state = {}
+    for cls in type(kernel).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            value = getattr(kernel, slot)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif isinstance(value, (deque, tuple)):
+                value = list(value)
+            state[slot] = value
+    return state
+
+
+def set_kernel_state(kernel, state: Dict[str, object]) -> None:
+    """
+    restore the __slots__ of kernel from get_kernel_state, keeping the container types of the new kernel
+    """
+    for slot, value in state.items():
+        current = getattr(kernel, slot)
+        if isinstance(current, np.ndarray):
+            value = np.asarray(value, dtype=current.dtype)
+        elif isinstance(current, deque):
+            value = deque(value)
+        elif isinstance(current, tuple):
+            value = tuple(value)
+        setattr(kernel, slot, value)
+
+
+def encode_state(state):
+    """
+    :return: state made of arrays, tuples and numbers as JSON serializable values, decoded by decode_state
+    """
+    if isinstance(state, np.ndarray):
+        return {'array': state.tolist(), 'dtype': state.dtype.str}
+    if isinstance(state, tuple):
+        return [encode_state(value) for value in state]
+    return state
+
+
+def decode_state(state):
+    if isinstance(state, dict):
+        return np.asarray(state['array'], dtype=np.dtype(state['dtype']))
+    if isinstance(state, list):
+        return tuple(decode_state(value) for value in state)
+    return state
+
+
+class RollingKernel(object):
+    """
+    Streaming state of an indicator over the trailing `length` values of its input, updated in O(1) per bar.
+    push() appends the value of a new bar, replace() the latest value when the latest bar is updated in place.
+    Kernels keeping running sums set `recompute`, they are recomputed from the window every `length` pushes
+    which evict a value to stop rounding errors from accumulating.
+    """
+    recompute = False
+
+    __slots__ = (
+        'length',
+        'window',
+        'removed',
+    )
+
+    def __init__(self, length: int):
+        assert length > 0
+        self.length = length
+        self.window = deque()
+        self.removed = 0
+
+    def push(self, value: float) -> None:
+        if len(self.window) < self.length:
+            self.window.append(value)
+            self._add(value)
+            return
+        self._remove(self.window.popleft())
+        self.window.append(value)
+        self._add(value)
+        if self.recompute:
+            self.removed += 1
+            if self.removed == self.length:
+                self.removed = 0
+                self._recompute()
+
+    def get_history_start(self, pushes: int) -> int:
+        """
+        :param pushes: number of values of the input
+        :return: position of the first of those values to push to a new kernel, so that it ends up in the very
+        same state as a kernel which got all of them. The state of a kernel with running sums depends on
+        the values since its last recompute
+        """
+        if not self.recompute:
+            return max(0, pushes - self.length)
+        last = pushes - 1
+        if last < 2 * self.length - 1:
+            return 0
+        # pushes at positions length - 1 (mod length) recompute, from 2 * length - 1 on
+        return last - (last - self.length + 1) % self.length - self.length + 1
+
+    def seed(self, values: np.ndarray) -> None:
+        """
+        set the state after the values of a whole column pushed one by one, the kernels depending on the whole
+        history compute it at once
+        """
+        for value in np.asarray(values)[self.get_history_start(len(values)):].tolist():
+            self.push(value)
+
+    def replace(self, value: float) -> None:
+        if not self.window:
+            self.push(value)
+            return
+        self._remove(self.window.pop())
+        self.window.append(value)
+        self._add(value)
+
+    def is_full(self) -> bool:
+        return len(self.window) == self.length
+
+    def _add(self, value: float) -> None:
+        raise NotImplementedError()
+
+    def _remove(self, value: float) -> None:
+        raise NotImplementedError()
+
+    def _recompute(self) -> None:
+        raise NotImplementedError()
+
+
+class RollingSum(RollingKernel):
+    """
+    Running sum, NaN while a NaN is in the window.
+    """
+    recompute = True
+
+    __slots__ = (
+        'sum',
+        'nan_count',
+    )
+
+    def __init__(self, length: int):
+        super(RollingSum, self).__init__(length)
+        self.sum = 0.0
+        self.nan_count = 0
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            self.nan_count += 1
+        else:
+            self.sum += value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            self.nan_count -= 1
+        else:
+            self.sum -= value
+
+    def _recompute(self) -> None:
+        self.sum = 0.0
+        for value in self.window:
+            if value == value:
+                self.sum += value
+
+    def get_sum(self) -> float:
+        return np.nan if self.nan_count else self.sum
+
+    def get_mean(self) -> float:
+        """
+        :return: mean of the window, NaN until it is full
+        """
+        return self.get_sum() / self.length if self.is_full() else np.nan
+
+
+class RollingMoments(RollingKernel):
+    """
+    Welford running mean and sum of squared deviations, NaN values are skipped like np.nanvar does.
+    """
+    recompute = True
+
+    __slots__ = (
+        'count',
+        'mean',
+        'm2',
+    )
+
+    def __init__(self, length: int):
+        super(RollingMoments, self).__init__(length)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+
+    def _recompute(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for value in self.window:
+            self._add(value)
+
+    def get_mean(self) -> float:
+        return self.mean if self.count else np.nan
+
+    def get_var(self, ddof: int = 0) -> float:
+        """
+        :param ddof: 0 for the population variance, 1 for the sample variance
+        """
+        return max(self.m2, 0.0) / (self.count - ddof) if self.count > ddof else np.nan
+
+    def get_std(self, ddof: int = 0) -> float:
+        return np.sqrt(self.get_var(ddof))
+
+
+class RollingExtremum(RollingKernel):
+    """
+    Rolling max (or min) backed by a monotonic deque, amortized O(1) per push. NaN values are skipped like
+    np.nanmax does. Bar numbers and values are kept in two parallel deques so a push allocates no tuple.
+    """
+    __slots__ = (
+        'is_max',
+        'count',
+        'indices',
+        'values',
+    )
+
+    def __init__(self, length: int, is_max: bool = True):
+        super(RollingExtremum, self).__init__(length)
+        self.is_max = is_max
+        self.count = 0
+        self.indices = deque()
+        self.values = deque()
+
+    def replace(self, value: float) -> None:
+        if not self.window:
+            self.push(value)
+            return
+        # values dropped by the latest one may be the extreme again, rebuild from the window
+        self.window[-1] = value
+        self.indices.clear()
+        self.values.clear()
+        start = self.count - len(self.window)
+        for offset, value in enumerate(self.window):
+            self.__insert(start + offset, value)
+
+    def _add(self, value: float) -> None:
+        self.__insert(self.count, value)
+        self.count += 1
+
+    def _remove(self, value: float) -> None:
+        # expired entries are dropped by bar number on insert
+        pass
+
+    def __insert(self, idx: int, value: float) -> None:
+        if self.indices and self.indices[0] <= idx - self.length:
+            self.indices.popleft()
+            self.values.popleft()
+        if value != value:
+            return
+        values = self.values
+        if self.is_max:
+            while values and values[-1] <= value:
+                values.pop()
+                self.indices.pop()
+        else:
+            while values and values[-1] >= value:
+                values.pop()
+                self.indices.pop()
+        values.append(value)
+        self.indices.append(idx)
+
+    def get_value(self) -> float:
+        return self.values[0] if self.values else np.nan
+
+    def get_bars_since(self) -> float:
+        """
+        :return: number of bars since the extreme, 0 when it is the latest bar (the latest of equal extremes counts)
+        """
+        return self.count - 1 - self.indices[0] if self.indices else np.nan
+
+
+class RollingHigherMoments(RollingKernel):
+    """
+    Running sums of the first four powers of the values minus a shift, NaN values are skipped. The shift is
+    the first value of the window as of the last recompute, which keeps the sums small. Skew and kurtosis follow
+    the bias corrected definitions of pandas.
+    """
+    recompute = True
+
+    __slots__ = (
+        'shift',
+        'count',
+        's1',
+        's2',
+        's3',
+        's4',
+    )
+
+    def __init__(self, length: int):
+        super(RollingHigherMoments, self).__init__(length)
+        self.shift = None
+        self.count = 0
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.s3 = 0.0
+        self.s4 = 0.0
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        if self.shift is None:
+            self.shift = value
+        d = value - self.shift
+        d2 = d * d
+        self.count += 1
+        self.s1 += d
+        self.s2 += d2
+        self.s3 += d2 * d
+        self.s4 += d2 * d2
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self.count -= 1
+        if self.count == 0:
+            self.shift = None
+            self.s1 = self.s2 = self.s3 = self.s4 = 0.0
+            return
+        d = value - self.shift
+        d2 = d * d
+        self.s1 -= d
+        self.s2 -= d2
+        self.s3 -= d2 * d
+        self.s4 -= d2 * d2
+
+    def _recompute(self) -> None:
+        self.shift = None
+        self.count = 0
+        self.s1 = self.s2 = self.s3 = self.s4 = 0.0
+        for value in self.window:
+            self._add(value)
+
+    def __central_moments(self):
+        n = self.count
+        mean = self.s1 / n
+        m2 = self.s2 / n - mean * mean
+        m3 = self.s3 / n - 3 * mean * self.s2 / n + 2 * mean ** 3
+        m4 = self.s4 / n - 4 * mean * self.s3 / n + 6 * mean * mean * self.s2 / n - 3 * mean ** 4
+        return m2, m3, m4
+
+    def __is_flat(self, m2: float) -> bool:
+        """
+        :return: True when all the values of the window are equal. Their m2 is only zero up to the rounding
+        errors of the sums, the window is checked when m2 is that small
+        """
+        if m2 > 1e-14 + 1e-10 * self.s2 / self.count:
+            return False
+        values = [value for value in self.window if value == value]
+        return min(values) == max(values)
+
+    def get_skew(self) -> float:
+        """
+        :return: skewness, 0 for equal values and NaN for a variance too small to tell, like pandas
+        """
+        n = self.count
+        if n < 3:
+            return np.nan
+        m2, m3, m4 = self.__central_moments()
+        if self.__is_flat(m2):
+            return 0.0
+        if m2 <= 1e-14:
+            return np.nan
+        return np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+
+    def get_kurt(self) -> float:
+        """
+        :return: excess kurtosis, -3 for equal values and NaN for a variance too small to tell, like pandas
+        """
+        n = self.count
+        if n < 4:
+            return np.nan
+        m2, m3, m4 = self.__central_moments()
+        if self.__is_flat(m2):
+            return -3.0
+        if m2 <= 1e-14:
+            return np.nan
+        return ((n + 1) * (n - 1) * m4 / (m2 * m2) - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+
+
+class RollingQuantile(RollingKernel):
+    """
+    Quantiles of the window kept sorted with bisect, NaN values are skipped. Linear interpolation like
+    np.quantile.
+    """
+    __slots__ = (
+        'sorted',
+    )
+
+    def __init__(self, length: int):
+        super(RollingQuantile, self).__init__(length)
+        self.sorted = []
+
+    def _add(self, value: float) -> None:
+        if value == value:
+            insort(self.sorted, value)
+
+    def _remove(self, value: float) -> None:
+        if value == value:
+            del self.sorted[bisect_left(self.sorted, value)]
+
+    def get_quantile(self, q: float) -> float:
+        if not self.sorted:
+            return np.nan
+        pos = (len(self.sorted) - 1) * q
+        lower = int(pos)
+        if lower + 1 >= len(self.sorted):
+            return self.sorted[lower]
+        return self.sorted[lower] + (self.sorted[lower + 1] - self.sorted[lower]) * (pos - lower)
+
+
+class ExponentialMean(RollingKernel):
+    """
+    Exponentially weighted mean with span `length`, the adjusted form of pandas ewm(span=length).mean().
+    NaN values are skipped but still age the weights. The state depends on the whole history,
+    is_full tells when length values have been pushed. get_sums computes it after each value of a whole column
+    with the very same rounding, seed sets it from there instead of pushing the history again.
+    """
+    __slots__ = (
+        'decay',
+        'count',
+        'numerator',
+        'denominator',
+        'last',
+    )
+
+    def __init__(self, length: int):
+        super(ExponentialMean, self).__init__(length)
+        self.decay = 1.0 - 2.0 / (length + 1)
+        self.count = 0
+        self.numerator = 0.0
+        self.denominator = 0.0
+        self.last = None
+
+    def push(self, value: float) -> None:
+        self.last = (self.numerator, self.denominator)
+        self.count += 1
+        self.numerator *= self.decay
+        self.denominator *= self.decay
+        if value == value:
+            self.numerator += value
+            self.denominator += 1.0
+
+    def replace(self, value: float) -> None:
+        if self.last is None:
+            self.push(value)
+            return
+        self.numerator, self.denominator = self.last
+        self.count -= 1
+        self.push(value)
+
+    def is_full(self) -> bool:
+        return self.count >= self.length
+
+    def get_history_start(self, pushes: int) -> int:
+        # seeded from get_sums, no value is pushed again
+        return pushes
+
+    def get_sums(self, values: np.ndarray):
+        """
+        :return: numerator and denominator arrays, the state after each of the values pushed one by one. lfilter
+        does the very same operations as push
+        """
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        return (lfilter([1.0], [1.0, -self.decay], np.where(valid, values, 0.0)),
+                lfilter([1.0], [1.0, -self.decay], valid.astype(np.float64)))
+
+    def seed(self, values: np.ndarray, sums=None) -> None:
+        """
+        :param sums: get_sums(values) when already computed
+        """
+        end = len(values)
+        if end == 0:
+            return
+        numerators, denominators = sums if sums is not None else self.get_sums(values)
+        self.last = (float(numerators[end - 2]), float(denominators[end - 2])) if end > 1 else (0.0, 0.0)
+        self.count = end
+        self.numerator = float(numerators[end - 1])
+        self.denominator = float(denominators[end - 1])
+
+    def get_mean(self) -> float:
+        return self.numerator / self.denominator if self.denominator else np.nan
+
+
+class WilderAverage(RollingKernel):
+    """
+    Wilder averages of the gains and losses between consecutive values: the mean of the first length changes,
+    smoothed with avg * (length - 1) / length + change / length after. A NaN change counts as neither gain nor
+    loss. The state depends on the whole history, is_full tells when length changes have been pushed.
+    get_averages computes it after each value of a whole column with the very same rounding, seed sets it from
+    there instead of pushing the history again.
+    """
+    __slots__ = (
+        'value',
+        'count',
+        'avg_gain',
+        'avg_loss',
+        'last',
+    )
+
+    def __init__(self, length: int):
+        super(WilderAverage, self).__init__(length)
+        self.value = None
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.last = None
+
+    def push(self, value: float) -> None:
+        self.last = (self.value, self.count, self.avg_gain, self.avg_loss)
+        if self.value is not None:
+            change = value - self.value
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            self.count += 1
+            if self.count <= self.length:
+                # sums of the first length changes, then their mean
+                self.avg_gain += gain
+                self.avg_loss += loss
+                if self.count == self.length:
+                    self.avg_gain /= float(self.length)
+                    self.avg_loss /= float(self.length)
+            else:
+                # same operations as the lfilter of get_averages
+                weight = 1.0 / self.length
+                decay = (self.length - 1) / float(self.length)
+                self.avg_gain = gain * weight + self.avg_gain * decay
+                self.avg_loss = loss * weight + self.avg_loss * decay
+        self.value = value
+
+    def replace(self, value: float) -> None:
+        if self.last is None:
+            self.push(value)
+            return
+        self.value, self.count, self.avg_gain, self.avg_loss = self.last
+        self.push(value)
+
+    def is_full(self) -> bool:
+        return self.count >= self.length
+
+    def get_history_start(self, pushes: int) -> int:
+        # seeded from get_averages, no value is pushed again
+        return pushes
+
+    def get_averages(self, values: np.ndarray):
+        """
+        :return: avg_gain and avg_loss arrays, the state after each of the values pushed one by one
+        """
+        values = np.asarray(values, dtype=np.float64)
+        changes = np.diff(values)
+        gains = np.where(changes > 0, changes, 0.0)
+        losses = np.where(changes < 0, -changes, 0.0)
+        weight = 1.0 / self.length
+        decay = (self.length - 1) / float(self.length)
+        averages = []
+        for moves in (gains, losses):
+            # running sums of the first length changes, summed in order like push does
+            average = np.zeros(len(values))
+            average[1:self.length + 1] = np.cumsum(moves[:self.length])
+            if len(moves) >= self.length:
+                average[self.length] /= float(self.length)
+                average[self.length + 1:] = lfilter([weight], [1.0, -decay], moves[self.length:],
+                                                    zi=[decay * average[self.length]])[0]
+            averages.append(average)
+        return averages
+
+    def seed(self, values: np.ndarray, averages=None) -> None:
+        """
+        set the state after the values pushed one by one
+        :param averages: get_averages(values) when already computed
+        """
+        end = len(values)
+        if end == 0:
+            return
+        avg_gain, avg_loss = averages if averages is not None else self.get_averages(values)
+        if end > 1:
+            self.last = (float(values[end - 2]), end - 2, float(avg_gain[end - 2]), float(avg_loss[end - 2]))
+        else:
+            self.last = (None, 0, 0.0, 0.0)
+        self.value = float(values[end - 1])
+        self.count = end - 1
+        self.avg_gain = float(avg_gain[end - 1])
+        self.avg_loss = float(avg_loss[end - 1])
+
+    def get_rsi(self) -> float:
+        """
+        :return: relative strength index, 100 without any loss, NaN until length changes
+        """
+        if not self.is_full():
+            return np.nan
+        if self.avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+
+class CovarianceKernel(RollingKernel):
+    """
+    Pairwise complete sums over rows of `size` values for the covariance and correlation matrices, updated in
+    O(size^2) per row. For each pair, w and w2 are the sums of the weights and squared weights of the rows
+    where both values are valid, sx the sums of the first value, sxx of its square and sxy of the products.
+    Values are shifted by one of their earlier values to keep the sums small.
+    """
+    __slots__ = (
+        'size',
+        'shift',
+        'w',
+        'w2',
+        'sx',
+        'sxx',
+        'sxy',
+    )
+
+    def __init__(self, length: int, size: int):
+        super(CovarianceKernel, self).__init__(length)
+        self.size = size
+        self.shift = np.full(size, np.nan)
+        self._clear()
+
+    def _clear(self) -> None:
+        self.w = np.zeros((self.size, self.size))
+        self.w2 = np.zeros((self.size, self.size))
+        self.sx = np.zeros((self.size, self.size))
+        self.sxx = np.zeros((self.size, self.size))
+        self.sxy = np.zeros((self.size, self.size))
+
+    def _terms(self, row: np.ndarray):
+        """
+        :return: pairs where both values are valid, and the sums of the row for sx, sxx and sxy
+        """
+        valid = ~np.isnan(row)
+        # a value without any sum yet can be the shift of its input
+        first = valid & np.isnan(self.shift)
+        self.shift[first] = row[first]
+        x = np.where(valid, row - self.shift, 0.0)
+        pairs = np.outer(valid, valid).astype(np.float64)
+        return pairs, np.outer(x, valid), np.outer(x * x, valid), np.outer(x, x)
+
+    def _add(self, row: np.ndarray) -> None:
+        pairs, x, xx, xy = self._terms(row)
+        self.w += pairs
+        self.w2 += pairs
+        self.sx += x
+        self.sxx += xx
+        self.sxy += xy
+
+    def _get_comoment(self) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.sxy - self.sx * self.sx.T / self.w
+
+    def get_cov(self, ddof: int = 1) -> np.ndarray:
+        """
+        :param ddof: 1 for the sample covariance, 0 for the population covariance
+        :return: (size x size) covariance matrix, NaN for the pairs without enough valid rows
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            denominator = self.w - ddof * self.w2 / self.w
+            cov = self._get_comoment() / denominator
+        return np.where(denominator > 0, cov, np.nan)
+
+    def get_corr(self) -> np.ndarray:
+        """
+        :return: (size x size) correlation matrix, NaN for the pairs without enough valid rows or variance
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var = np.maximum(self.sxx - self.sx * self.sx / self.w, 0.0)
+            scale = var * var.T
+            corr = np.clip(self._get_comoment() / np.sqrt(scale), -1.0, 1.0)
+        return np.where((self.w >= 2) & (scale > 0), corr, np.nan)
+
+
+class RollingCovariance(CovarianceKernel):
+    """
+    Covariance and correlation of the rows of the last length pushes, like pd.DataFrame.rolling(length).cov() and
+    corr() with pairwise complete rows. The sums are recomputed from the window every length pushes, shifted by
+    the latest values.
+    """
+    recompute = True
+
+    def _remove(self, row: np.ndarray) -> None:
+        pairs, x, xx, xy = self._terms(row)
+        self.w -= pairs
+        self.w2 -= pairs
+        self.sx -= x
+        self.sxx -= xx
+        self.sxy -= xy
+
+    def _recompute(self) -> None:
+        latest = self.window[-1]
+        self.shift = np.where(np.isnan(latest), self.shift, latest)
+        self._clear()
+        for row in self.window:
+            self._add(row)
+
+
+class ExponentialCovariance(CovarianceKernel):
+    """
+    Exponentially weighted covariance and correlation with span `length`, the adjusted and bias corrected form of
+    pd.DataFrame.ewm(span=length).cov() and corr(). The state depends on the whole history, is_full tells when
+    length rows have been pushed.
+    """
+    __slots__ = (
+        'decay',
+        'count',
+        'last',
+    )
+
+    def __init__(self, length: int, size: int):
+        super(ExponentialCovariance, self).__init__(length, size)
+        self.decay = 1.0 - 2.0 / (length + 1)
+        self.count = 0
+        self.last = None
+
+    def push(self, row: np.ndarray) -> None:
+        self.last = (self.shift.copy(), self.w, self.w2, self.sx, self.sxx, self.sxy)
+        self.count += 1
+        # new arrays, last keeps the previous ones
+        self.w = self.w * self.decay
+        self.w2 = self.w2 * (self.decay * self.decay)
+        self.sx = self.sx * self.decay
+        self.sxx = self.sxx * self.decay
+        self.sxy = self.sxy * self.decay
+        self._add(row)
+
+    def replace(self, row: np.ndarray) -> None:
+        if self.last is None:
+            self.push(row)
+            return
+        self.shift, self.w, self.w2, self.sx, self.sxx, self.sxy = self.last
+        self.count -= 1
+        self.push(row)
+
+    def is_full(self) -> bool:
+        return self.count >= self.length
+
+    def get_history_start(self, pushes: int) -> int:
+        return 0
+
+
+def batch_rolling(values: np.ndarray, length: int, func) -> np.ndarray:
+    """
+    vectorized counterpart of a kernel over a whole column
+    :param func: reduces a (n, length) array of sliding windows along axis 1
+    :return: func of the window ending at each position, NaN for the first length - 1 positions
+    """
+    result = np.full(len(values), np.nan)
+    if len(values) >= length:
+        result[length - 1:] = func(sliding_window_view(np.asarray(values, dtype=np.float64), length))
+    return result
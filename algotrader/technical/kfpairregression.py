@@ -5,59 +5,200 @@ Author = jchan
 __author__ = 'jchan'
 
 import numpy as np
-from pykalman import KalmanFilter
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import get_kernel_state, set_kernel_state
+
+
+class KalmanRegression(object):
+    """
+    Kalman filter of the state (slope, intercept) of y = slope * x + intercept, with an identity transition,
+    transition covariance delta / (1 - delta) * I and observation covariance observation_cov, starting from
+    mean 0 and covariance ones((2, 2)) like the pykalman model it replaces. One predict / update step per
+    observation on plain floats, the symmetric covariance is kept as p00, p01, p11.
+    Observations with a NaN only advance the prediction.
+    """
+    __slots__ = (
+        'q',
+        'r',
+        'state',
+        'prev_state',
+    )
+
+    def __init__(self, delta: float = 1e-5, observation_cov: float = 1.0):
+        self.q = delta / (1 - delta)
+        self.r = observation_cov
+        # slope, intercept, p00, p01, p11, number of steps
+        self.state = (0.0, 0.0, 1.0, 1.0, 1.0, 0)
+        self.prev_state = None
+
+    def update(self, x: float, y: float) -> None:
+        self.prev_state = self.state
+        m0, m1, p00, p01, p11, steps = self.state
+        if steps:
+            # the first observation is filtered against the initial state, without a transition
+            p00 += self.q
+            p11 += self.q
+        if x == x and y == y:
+            ph0 = p00 * x + p01
+            ph1 = p01 * x + p11
+            s = x * ph0 + ph1 + self.r
+            k0 = ph0 / s
+            k1 = ph1 / s
+            e = y - (m0 * x + m1)
+            m0 += k0 * e
+            m1 += k1 * e
+            p00 -= k0 * ph0
+            p01 -= k0 * ph1
+            p11 -= k1 * ph1
+        self.state = (m0, m1, p00, p01, p11, steps + 1)
+
+    def replace(self, x: float, y: float) -> None:
+        """
+        filter the latest observation again with new values
+        """
+        if self.prev_state is not None:
+            self.state = self.prev_state
+        self.update(x, y)
+
+    def get_slope(self) -> float:
+        return self.state[0]
+
+    def get_intercept(self) -> float:
+        return self.state[1]
+
+    def get_steps(self) -> int:
+        return self.state[5]
+
+
+class BatchKalmanRegression(object):
+    """
+    KalmanRegression of n pairs at once, each step is a handful of vectorized operations on arrays of n
+    :param delta: float or array of n
+    :param observation_cov: float or array of n
+    """
+    __slots__ = (
+        'q',
+        'r',
+        'slope',
+        'intercept',
+        'p00',
+        'p01',
+        'p11',
+        'steps',
+        'prev_state',
+    )
+
+    def __init__(self, n: int, delta=1e-5, observation_cov=1.0):
+        delta = np.asarray(delta, dtype=np.float64)
+        self.q = np.broadcast_to(delta / (1 - delta), (n,))
+        self.r = np.broadcast_to(np.asarray(observation_cov, dtype=np.float64), (n,))
+        self.slope = np.zeros(n)
+        self.intercept = np.zeros(n)
+        self.p00 = np.ones(n)
+        self.p01 = np.ones(n)
+        self.p11 = np.ones(n)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.prev_state = None
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        :param x: independent values of the n pairs
+        :param y: dependent values of the n pairs, pairs with a NaN in x or y only advance the prediction
+        """
+        # the arrays are replaced, never written in place
+        self.prev_state = (self.slope, self.intercept, self.p00, self.p01, self.p11, self.steps)
+        q = np.where(self.steps > 0, self.q, 0.0)
+        p00 = self.p00 + q
+        p11 = self.p11 + q
+        p01 = self.p01
+        valid = (x == x) & (y == y)
+        x = np.where(valid, x, 0.0)
+        ph0 = p00 * x + p01
+        ph1 = p01 * x + p11
+        s = x * ph0 + ph1 + self.r
+        k0 = np.where(valid, ph0 / s, 0.0)
+        k1 = np.where(valid, ph1 / s, 0.0)
+        e = np.where(valid, y - (self.slope * x + self.intercept), 0.0)
+        self.slope = self.slope + k0 * e
+        self.intercept = self.intercept + k1 * e
+        self.p00 = p00 - k0 * ph0
+        self.p01 = p01 - k0 * ph1
+        self.p11 = p11 - k1 * ph1
+        self.steps = self.steps + 1
+
+    def replace(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        filter the latest observations again with new values
+        """
+        if self.prev_state is not None:
+            self.slope, self.intercept, self.p00, self.p01, self.p11, self.steps = self.prev_state
+        self.update(x, y)
 
 
 class KalmanFilteringPairRegression(Indicator):
+    """
+    regression of the second input key (dependent) on the first one (independent) of the input,
+    filtered with one KalmanRegression step per bar. Outputs are NaN for the first length - 1 bars
+    """
     SLOPE = 'slope'
     INTERCEPT = 'intercept'
 
     __slots__ = (
-        'length'
+        'length',
+        'delta',
+        '__kernel',
     )
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Kalman Filter Regression", length=10):
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Kalman Filter Regression", length=10,
+                 **kwargs):
         super(KalmanFilteringPairRegression, self).__init__(time_series=time_series, inputs=inputs,
                                                             input_keys=input_keys, desc=desc,
-                                                            keys=['slope', 'intercept'],
-                                                            default_key='slope',
-                                                            length=length)
+                                                            keys=[Indicator.VALUE,
+                                                                  KalmanFilteringPairRegression.SLOPE,
+                                                                  KalmanFilteringPairRegression.INTERCEPT],
+                                                            length=length, **kwargs)
         self.length = self.get_int_config("length", 10)
-        delta = 1e-5
-        self.trans_cov = delta / (1 - delta) * np.eye(2)
-        # super(KalmanFilteringPairRegression, self)._update_from_inputs()
+        self.delta = self.get_float_config("delta", 1e-5)
 
-    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
+    def _create_kernels(self):
+        self.__kernel = KalmanRegression(delta=self.delta)
+
+    def __get_keys(self):
+        return self.first_input_keys if self.first_input_keys else list(self.first_input.time_series.keys)
+
+    def _resume(self, input, end: int):
+        # the state depends on the whole history
+        if input is self.first_input:
+            x_key, y_key = self.__get_keys()[:2]
+            for x, y in zip(input.get_by_idx(slice(0, end), x_key).tolist(),
+                            input.get_by_idx(slice(0, end), y_key).tolist()):
+                self.__kernel.update(x, y)
 
-        if input.size() >= self.length:
-
-            independent_var = self.first_input.get_by_idx_range(key=None, start_idx=0, end_idx=-1)
-            symbol_set = set(self.first_input.keys)
-            depend_symbol = symbol_set.difference(self.first_input.default_key)
-            depend_var = self.first_input.get_by_idx_range(key=depend_symbol, start_idx=0, end_idx=-1)
-
-            obs_mat = np.vstack([independent_var.values, np.ones(independent_var.values.shape)]).T[:, np.newaxis]
-            model = KalmanFilter(n_dim_obs=1, n_dim_state=2,
-                                 initial_state_mean=np.zeros(2),
-                                 initial_state_covariance=np.ones((2, 2)),
-                                 transition_matrices=np.eye(2),
-                                 observation_matrices=obs_mat,
-                                 observation_covariance=1.0,
-                                 transition_covariance=self.trans_cov)
-
-            state_means, state_covs = model.filter(depend_var.values)
-            slope = state_means[:, 0][-1]
-            result[Indicator.VALUE] = slope
-            result[KalmanFilteringPairRegression.SLOPE] = slope
-            result[KalmanFilteringPairRegression.SLOPE] = state_means[:, 1][-1]
-            self.add(timestamp=timestamp, data=result)
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel)}
 
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        x_key, y_key = self.__get_keys()[:2]
+        missing_value = self.first_input.time_series.missing_value_replace
+        x = data.get(x_key, missing_value)
+        y = data.get(y_key, missing_value)
+        if self.size() > 0 and timestamp == self.current_time():
+            self.__kernel.replace(x, y)
+        else:
+            self.__kernel.update(x, y)
+
+        result = {}
+        if self.__kernel.get_steps() >= self.length:
+            result[Indicator.VALUE] = self.__kernel.get_slope()
+            result[KalmanFilteringPairRegression.SLOPE] = self.__kernel.get_slope()
+            result[KalmanFilteringPairRegression.INTERCEPT] = self.__kernel.get_intercept()
         else:
             result[Indicator.VALUE] = np.nan
             result[KalmanFilteringPairRegression.SLOPE] = np.nan
-            result[KalmanFilteringPairRegression.SLOPE] = np.nan
-            self.add(timestamp=timestamp, data=result)
+            result[KalmanFilteringPairRegression.INTERCEPT] = np.nan
+        self.add(timestamp=timestamp, data=result)
@@ -2,12 +2,14 @@ import numpy as np
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import RollingSum, batch_rolling, get_kernel_state, set_kernel_state
 
 
 class SMA(Indicator):
     Length = 10
     __slots__ = (
-        'length'
+        'length',
+        '__kernel',
     )
 
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Simple Moving Average", length=0):
@@ -15,14 +17,30 @@ class SMA(Indicator):
                                   length=length)
         self.length = self.get_int_config("length", SMA.Length)
 
+    def _create_kernels(self):
+        self.__kernel = RollingSum(self.length)
+
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            for pos in range(self.__kernel.get_history_start(end), end):
+                self.__kernel.push(self._get_first_input_value(input.get_row(pos)))
+
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel)}
+
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = batch_rolling(arrays[self._get_first_input_key()], self.length, lambda windows: windows.sum(axis=1))
+        return {Indicator.VALUE: np.round(values / float(self.length), 8)}
+
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        self._update_kernel(self.__kernel, timestamp, self._get_first_input_value(data))
+
         result = {}
-        if self.first_input.size() >= self.length:
-            value = 0.0
-            for idx in range(self.first_input.size() - self.length, self.first_input.size()):
-                value += self.first_input.get_by_idx(idx, self.first_input_keys)
-            value = round(value / float(self.length), 8)
-            result[Indicator.VALUE] = value
+        if self.__kernel.is_full():
+            result[Indicator.VALUE] = round(self.__kernel.get_mean(), 8)
         else:
             result[Indicator.VALUE] = np.nan
 
@@ -0,0 +1,434 @@
+"""
+Panel indicators compute one indicator over N input series (instruments) in a single object:
+
+    sma = PanelSMA(inputs=['Bar.A.Time.86400', 'Bar.B.Time.86400'], input_keys='close', length=10)
+
+The state is kept as (window x instruments) arrays and each timestamp is one vectorized update of all the
+instruments. Output columns are named after the input series. get_series(input) returns a per-instrument
+DataSeries view registered under the id of the single-instrument indicator, e.g.
+SMA(Bar.A.Time.86400[close],length=10), so code reading the per-instrument indicator keeps working.
+"""
+import warnings
+
+import numpy as np
+from typing import Dict
+
+from algotrader.technical import Indicator
+from algotrader.technical.kernel import decode_state, encode_state
+from algotrader.trading.data_series import DataSeries
+from algotrader.utils.data_series import build_series_id, convert_input
+
+
+class PanelIndicator(Indicator):
+    """
+    Rows are synchronized by timestamp: a row is computed once every input has a value at it, or as soon as an
+    input moves to a later timestamp, the missing values are then NaN (flush() does it for the latest row).
+    An update of the latest computed row recomputes it in place.
+    Subclasses implement _update and _compute over the window, and _save / _restore when they keep state
+    besides the window.
+    """
+    # class name of the single-instrument indicator, for the ids of the views
+    view_cls_name = None
+
+    __slots__ = (
+        'length',
+        'input_names',
+        '_window',
+        '_pos',
+        '_count',
+        '__columns',
+        '__pending',
+        '__filled',
+        '__filled_count',
+        '__pending_time',
+        '__snapshot',
+        '__evicted',
+        '__views',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc=None, length=0, **kwargs):
+        super(PanelIndicator, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                             keys=convert_input(inputs) if inputs else None, length=length, **kwargs)
+        self.length = self.get_int_config("length", 0)
+        self.input_names = [time_series_input.source for time_series_input in self.time_series.inputs]
+        self.__views = {}
+
+    def _window_size(self) -> int:
+        return self.length
+
+    def _create_kernels(self):
+        n = len(self.input_names)
+        self._window = np.full((self._window_size(), n), np.nan)
+        self._pos = 0
+        self._count = 0
+        self.__columns = {name: idx for idx, name in enumerate(self.input_names)}
+        self.__pending = np.full(n, np.nan)
+        self.__filled = np.zeros(n, dtype=bool)
+        self.__filled_count = 0
+        self.__pending_time = None
+        self.__snapshot = None
+        self.__evicted = None
+
+    def _update(self, row: np.ndarray, evicted: np.ndarray) -> None:
+        """
+        update the state with a new row, already in the window
+        :param evicted: row which left the window, None until the window is full
+        """
+        pass
+
+    def _compute(self) -> np.ndarray:
+        """
+        :return: output of each instrument for the latest row
+        """
+        raise NotImplementedError()
+
+    def _save(self):
+        """
+        :return: copy of the state besides the window, restored to update the latest row again
+        """
+        return None
+
+    def _restore(self, state) -> None:
+        pass
+
+    def get_state(self):
+        return {'window': self._window.tolist(), 'pos': self._pos, 'count': self._count,
+                'saved': encode_state(self._save()), 'snapshot': encode_state(self.__snapshot),
+                'evicted': encode_state(self.__evicted)}
+
+    def set_state(self, state):
+        self._window = np.asarray(state['window'], dtype=np.float64)
+        self._pos = state['pos']
+        self._count = state['count']
+        if state['saved'] is not None:
+            self._restore(decode_state(state['saved']))
+        self.__snapshot = decode_state(state['snapshot'])
+        self.__evicted = decode_state(state['evicted'])
+
+    def _is_full(self) -> bool:
+        return self._count >= self._window_size()
+
+    def _latest(self, ago: int = 0) -> np.ndarray:
+        """
+        :return: row pushed ago rows before the latest one
+        """
+        return self._window[(self._pos - 1 - ago) % self._window_size()]
+
+    def __get_input_key(self, idx: int) -> str:
+        keys = self.get_input_keys(idx=idx)
+        return keys[0] if keys else self.get_input(idx).time_series.keys[0]
+
+    def _load_and_subscribe_inputs(self):
+        # rows of all the inputs merged by timestamp
+        timestamps = np.unique(np.concatenate([np.asarray(input.get_timestamp(), dtype=np.int64)
+                                               for input in self.input_series] + [np.empty(0, dtype=np.int64)]))
+        values = np.full((len(timestamps), len(self.input_series)), np.nan)
+        for idx, input in enumerate(self.input_series):
+            if input.size() > 0:
+                pos = np.searchsorted(timestamps, np.asarray(input.get_timestamp(), dtype=np.int64))
+                values[pos, idx] = input.get_by_idx(slice(None), self.__get_input_key(idx))
+        start = self.current_time() if self.size() > 0 else None
+        restored = self._restore_state()
+        for timestamp, row in zip(timestamps.tolist(), values):
+            if restored and timestamp <= start:
+                continue
+            output = self.__push(row)
+            if start is None or timestamp > start:
+                self.__add_row(timestamp, output)
+
+        self.app_context.inst_data_mgr.graph.add(self, self._get_dependencies())
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        idx = self.__columns[source]
+        value = data.get(self.__get_input_key(idx), np.nan)
+        if self.__pending_time is not None and timestamp > self.__pending_time:
+            self.flush()
+        if self.__pending_time is None and self.size() > 0 and timestamp == self.current_time():
+            row = self._latest().copy()
+            row[idx] = value
+            self.__add_row(timestamp, self.__replace(row))
+            return
+        if self.__pending_time is None:
+            self.__pending_time = timestamp
+        if not self.__filled[idx]:
+            self.__filled[idx] = True
+            self.__filled_count += 1
+        self.__pending[idx] = value
+        if self.__filled_count == len(self.__filled):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        compute the pending row, NaN for the inputs without a value yet
+        """
+        if self.__pending_time is None:
+            return
+        timestamp = self.__pending_time
+        output = self.__push(self.__pending.copy())
+        self.__pending[:] = np.nan
+        self.__filled[:] = False
+        self.__filled_count = 0
+        self.__pending_time = None
+        self.__add_row(timestamp, output)
+
+    def __push(self, row: np.ndarray) -> np.ndarray:
+        self.__evicted = self._window[self._pos].copy() if self._is_full() else None
+        self.__snapshot = self._save()
+        self._window[self._pos] = row
+        self._pos = (self._pos + 1) % self._window_size()
+        self._count += 1
+        self._update(row, self.__evicted)
+        return self._compute()
+
+    def __replace(self, row: np.ndarray) -> np.ndarray:
+        self._window[(self._pos - 1) % self._window_size()] = row
+        self._restore(self.__snapshot)
+        self._update(row, self.__evicted)
+        return self._compute()
+
+    def __add_row(self, timestamp: int, output: np.ndarray) -> None:
+        values = output.tolist()
+        self.add(timestamp=timestamp, data=dict(zip(self.input_names, values)))
+        for idx, view in self.__views.items():
+            view.add(timestamp=timestamp, data={Indicator.VALUE: values[idx]})
+
+    def _view_kwargs(self) -> Dict:
+        return {'length': self.length}
+
+    def get_series(self, input) -> DataSeries:
+        """
+        :param input: input series, its name or position
+        :return: DataSeries of the output of one instrument, registered under the id of the single-instrument
+        indicator
+        """
+        idx = input if isinstance(input, int) else self.input_names.index(
+            input if isinstance(input, str) else input.name)
+        if idx not in self.__views:
+            inst_data_mgr = self.app_context.inst_data_mgr
+            name = self.input_names[idx]
+            keys = self.get_input_keys(idx=idx)
+            series_id = build_series_id(self.view_cls_name, inputs=name, input_keys=keys, **self._view_kwargs())
+            if inst_data_mgr.has_series(series_id):
+                raise AssertionError("Series [%s] already exist" % series_id)
+            view = inst_data_mgr.get_series(series_id)
+            if self.size() > 0:
+                view.extend(timestamps=self.get_timestamp(), columns={Indicator.VALUE: self.get_by_idx(slice(None), name)})
+            self.__views[idx] = view
+        return self.__views[idx]
+
+    def now_values(self) -> np.ndarray:
+        """
+        :return: latest output of all the instruments, in input order
+        """
+        return np.array([self.now(name) for name in self.input_names], dtype=np.float64)
+
+
+class PanelSMA(PanelIndicator):
+    """
+    SMA of each input, running sums recomputed from the window every length rows
+    """
+    view_cls_name = 'SMA'
+
+    __slots__ = (
+        '__sum',
+        '__nan_count',
+        '__removed',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Simple Moving Average", length=0):
+        super(PanelSMA, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length)
+
+    def _create_kernels(self):
+        super(PanelSMA, self)._create_kernels()
+        n = len(self.input_names)
+        self.__sum = np.zeros(n)
+        self.__nan_count = np.zeros(n, dtype=np.int64)
+        self.__removed = 0
+
+    def _save(self):
+        return self.__sum.copy(), self.__nan_count.copy(), self.__removed
+
+    def _restore(self, state) -> None:
+        self.__sum, self.__nan_count, self.__removed = state[0].copy(), state[1].copy(), state[2]
+
+    def _update(self, row: np.ndarray, evicted: np.ndarray) -> None:
+        self.__sum += np.nan_to_num(row)
+        self.__nan_count += np.isnan(row)
+        if evicted is not None:
+            self.__sum -= np.nan_to_num(evicted)
+            self.__nan_count -= np.isnan(evicted)
+            self.__removed += 1
+            if self.__removed == self.length:
+                self.__removed = 0
+                self.__sum = np.nansum(self._window, axis=0)
+
+    def _compute(self) -> np.ndarray:
+        if not self._is_full():
+            return np.full(len(self.input_names), np.nan)
+        return np.where(self.__nan_count > 0, np.nan, np.round(self.__sum / float(self.length), 8))
+
+
+class PanelVAR(PanelIndicator):
+    """
+    variance of each input over the window, NaN values are skipped. The ddof config picks the variant
+    """
+    view_cls_name = 'VAR'
+
+    __slots__ = (
+        'ddof',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Variance", length=0, **kwargs):
+        super(PanelVAR, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length, **kwargs)
+        self.ddof = self.get_int_config("ddof", 0)
+
+    def _view_kwargs(self) -> Dict:
+        kwargs = super(PanelVAR, self)._view_kwargs()
+        if self.ddof:
+            kwargs['ddof'] = self.ddof
+        return kwargs
+
+    def _compute(self) -> np.ndarray:
+        if not self._is_full():
+            return np.full(len(self.input_names), np.nan)
+        with warnings.catch_warnings():
+            # instruments with fewer than ddof + 1 values are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return self._get_value(np.nanvar(self._window, axis=0, ddof=self.ddof))
+
+    def _get_value(self, var: np.ndarray) -> np.ndarray:
+        return var
+
+
+class PanelSTD(PanelVAR):
+    """
+    standard deviation of each input over the window, NaN values are skipped. The ddof config picks the variant
+    """
+    view_cls_name = 'STD'
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Standard Deviation", length=0,
+                 **kwargs):
+        super(PanelSTD, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length, **kwargs)
+
+    def _get_value(self, var: np.ndarray) -> np.ndarray:
+        return np.sqrt(var)
+
+
+class PanelMAX(PanelIndicator):
+    """
+    maximum of each input over the window, NaN values are skipped
+    """
+    view_cls_name = 'MAX'
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Maximum", length=0):
+        super(PanelMAX, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length)
+
+    def _compute(self) -> np.ndarray:
+        if not self._is_full():
+            return np.full(len(self.input_names), np.nan)
+        with warnings.catch_warnings():
+            # all NaN windows are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return self._reduce(self._window)
+
+    def _reduce(self, window: np.ndarray) -> np.ndarray:
+        return np.nanmax(window, axis=0)
+
+
+class PanelMIN(PanelMAX):
+    """
+    minimum of each input over the window, NaN values are skipped
+    """
+    view_cls_name = 'MIN'
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Minimum", length=0):
+        super(PanelMIN, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length)
+
+    def _reduce(self, window: np.ndarray) -> np.ndarray:
+        return np.nanmin(window, axis=0)
+
+
+class PanelROC(PanelIndicator):
+    """
+    rate of change of each input over length rows
+    """
+    view_cls_name = 'ROC'
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Rate Of Change", length=1):
+        super(PanelROC, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length)
+
+    def _window_size(self) -> int:
+        return self.length + 1
+
+    def _compute(self) -> np.ndarray:
+        if not self._is_full():
+            return np.full(len(self.input_names), np.nan)
+        prev_values = self._latest(self.length)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(prev_values != 0.0, (self._latest() - prev_values) / prev_values, np.nan)
+
+
+class PanelRSI(PanelIndicator):
+    """
+    Wilder RSI of each input: the average gain and loss start as the mean of the first length changes and are
+    smoothed with (avg * (length - 1) + change) / length after, 100 without any loss
+    """
+    view_cls_name = 'RSI'
+
+    __slots__ = (
+        '__avg_gain',
+        '__avg_loss',
+        '__changes',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Panel Relative Strength Indicator",
+                 length=14):
+        super(PanelRSI, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       length=length)
+
+    def _window_size(self) -> int:
+        return 2
+
+    def _create_kernels(self):
+        super(PanelRSI, self)._create_kernels()
+        n = len(self.input_names)
+        self.__avg_gain = np.zeros(n)
+        self.__avg_loss = np.zeros(n)
+        self.__changes = 0
+
+    def _save(self):
+        return self.__avg_gain.copy(), self.__avg_loss.copy(), self.__changes
+
+    def _restore(self, state) -> None:
+        self.__avg_gain, self.__avg_loss, self.__changes = state[0].copy(), state[1].copy(), state[2]
+
+    def _update(self, row: np.ndarray, evicted: np.ndarray) -> None:
+        if self._count < 2:
+            return
+        change = row - self._latest(1)
+        gain = np.where(change > 0, change, 0.0)
+        loss = np.where(change < 0, -change, 0.0)
+        self.__changes += 1
+        if self.__changes <= self.length:
+            # sums of the first length changes, then their mean
+            self.__avg_gain += gain
+            self.__avg_loss += loss
+            if self.__changes == self.length:
+                self.__avg_gain /= float(self.length)
+                self.__avg_loss /= float(self.length)
+        else:
+            self.__avg_gain = (self.__avg_gain * (self.length - 1) + gain) / float(self.length)
+            self.__avg_loss = (self.__avg_loss * (self.length - 1) + loss) / float(self.length)
+
+    def _compute(self) -> np.ndarray:
+        if self.__changes < self.length:
+            return np.full(len(self.input_names), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.__avg_loss == 0, 100.0, 100 - 100 / (1 + self.__avg_gain / self.__avg_loss))
+
@@ -1,5 +1,4 @@
 import numpy as np
-from collections import OrderedDict
 from typing import Dict, List
 
 from algotrader import Context
@@ -7,6 +6,14 @@ from algotrader.technical import Indicator
 
 
 class PipeLine(Indicator):
+    """
+    Indicator over many inputs synchronized by timestamp. cache is a preallocated (inputs x length) float64
+    matrix holding the last length values of each input, oldest first, written in place as the updates come.
+    Inputs which are pipelines themselves hold their flattened output, cache is (inputs x length x width).
+    A fill bitmask tracks the inputs updated at the current timestamp, all_filled and is_full are O(1) checks
+    of counters.
+    """
+
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc=None,
                  keys: List[str] = None, default_output_key: str = 'value', **kwargs):
 
@@ -16,24 +23,41 @@ class PipeLine(Indicator):
         self.length = self.get_int_config("length", 1)
         self.__curr_timestamp = None
 
+    def _create_kernels(self):
+        self.numPipes = len(self.time_series.inputs)
+        # allocated with the first value, its width is only known then for pipeline inputs
+        self.cache = None
+        self.__filled = np.zeros(self.numPipes, dtype=bool)
+        self.__filled_count = 0
+        self.__counts = np.zeros(self.numPipes, dtype=np.int64)
+        self.__full_count = 0
+        self.__curr_timestamp = None
+
     def _start(self, app_context: Context) -> None:
         super(PipeLine, self)._start(self.app_context)
-        self.numPipes = len(self.input_series)
-        self._flush_and_create()
 
     def _stop(self):
         pass
 
     def _flush_and_create(self):
-        self.cache = OrderedDict(zip(list(self.input_names_pos.keys()), [None for _ in range(len(self.input_series))]))
+        """
+        start a new timestamp, no input is filled
+        """
+        self.__filled[:] = False
+        self.__filled_count = 0
 
-    def all_filled(self):
+    def all_filled(self) -> bool:
         """
         PipeLine specify function, check in all input in self.inputs have been updated
         :return:
         """
-        has_none = np.sum(np.array([v is None for v in self.cache.values()]))
-        return False if has_none > 0 else True
+        return self.__filled_count == self.numPipes
+
+    def is_full(self) -> bool:
+        """
+        :return: True when every input has length values in cache
+        """
+        return self.__full_count == self.numPipes
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         if timestamp != self.__curr_timestamp:
@@ -42,9 +66,24 @@ class PipeLine(Indicator):
 
         if source in self.input_names_pos:
             idx = self.input_names_pos[source]
-            self.cache[source] = self.get_input(idx).get_by_idx(
-                keys=self.get_input_keys(idx=idx),
-                idx=slice(-self.length, None, None))
+            keys = self.get_input_keys(idx=idx)
+            value = data.get(keys[0] if keys else self.get_input(idx).time_series.keys[0], np.nan)
+            if self.cache is None:
+                width = () if np.ndim(value) == 0 else (np.size(value),)
+                self.cache = np.full((self.numPipes, self.length) + width, np.nan)
+            slot = self.cache[idx]
+            if self.__filled[idx]:
+                # update of the latest value
+                slot[-1] = np.reshape(value, slot.shape[1:])
+                return
+            slot[:-1] = slot[1:]
+            slot[-1] = np.reshape(value, slot.shape[1:])
+            self.__filled[idx] = True
+            self.__filled_count += 1
+            if self.__counts[idx] < self.length:
+                self.__counts[idx] += 1
+                if self.__counts[idx] == self.length:
+                    self.__full_count += 1
 
     def numPipes(self):
         return self.numPipes
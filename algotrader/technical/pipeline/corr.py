@@ -1,27 +1,55 @@
 import numpy as np
 from typing import Dict
 
+from algotrader.technical.kernel import ExponentialCovariance, RollingCovariance
 from algotrader.technical.pipeline import PipeLine
 
 
 class Corr(PipeLine):
+    """
+    correlation matrix of the inputs over the rows of the last length timestamps, with pairwise complete rows.
+    The span config switches to the exponentially weighted correlation with that span, NaN until length rows.
+    Running sums are updated once per row in O(inputs^2)
+    """
+
     def __init__(self, time_series=None, inputs=None, input_keys='close',
-                 desc="Correlation", length=30):
+                 desc="Correlation", length=30, **kwargs):
         super(Corr, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                   length=length)
+                                   length=length, **kwargs)
+        self.span = self.get_int_config("span", 0)
+
+    def _create_kernels(self):
+        super(Corr, self)._create_kernels()
+        if self.span:
+            self.__kernel = ExponentialCovariance(self.span, self.numPipes)
+        else:
+            self.__kernel = RollingCovariance(self.length, self.numPipes)
+        self.__kernel_time = None
+
+    def _is_ready(self) -> bool:
+        if self.span:
+            return self.__kernel.count >= self.length
+        return self.__kernel.is_full()
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         super(Corr, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
-        if self.inputs[0].size() > self.length:
-            if self.all_filled():
-                result[PipeLine.VALUE] = self.df.corr()
+        if self.all_filled():
+            row = np.array(self.cache[:, -1], dtype=np.float64)
+            if timestamp == self.__kernel_time:
+                self.__kernel.replace(row)
             else:
-                result[PipeLine.VALUE] = self._default_output()
+                self.__kernel.push(row)
+                self.__kernel_time = timestamp
+        if self.all_filled() and self._is_ready():
+            result[PipeLine.VALUE] = self._get_value(self.__kernel)
         else:
             result[PipeLine.VALUE] = self._default_output()
         self.add(timestamp=timestamp, data=result)
 
+    def _get_value(self, kernel) -> np.ndarray:
+        return kernel.get_corr()
+
     def _default_output(self):
         na_array = np.empty(shape=self.shape())
         na_array[:] = np.nan
@@ -29,3 +57,19 @@ class Corr(PipeLine):
 
     def shape(self):
         return np.array([self.numPipes, self.numPipes])
+
+
+class Cov(Corr):
+    """
+    covariance matrix of the inputs, like Corr. The ddof config picks the variant, 1 (default) for the sample
+    covariance, 0 for the population covariance
+    """
+
+    def __init__(self, time_series=None, inputs=None, input_keys='close',
+                 desc="Covariance", length=30, **kwargs):
+        super(Cov, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                  length=length, **kwargs)
+        self.ddof = self.get_int_config("ddof", 1)
+
+    def _get_value(self, kernel) -> np.ndarray:
+        return kernel.get_cov(self.ddof)
@@ -1,9 +1,8 @@
 import numpy as np
-import pandas as pd
 from typing import Dict
 
-from algotrader.model.time_series_pb2 import TimeSeriesUpdateEvent
 from algotrader.technical.pipeline import PipeLine
+from algotrader.technical.pipeline.rank import rank_last
 
 
 # TODO: One output scalar
@@ -17,21 +16,13 @@ class CrossSessionalApply(PipeLine):
                                                   length=length, **kwargs)
         self.np_func = np_func
 
-    def on_update(self, event: TimeSeriesUpdateEvent):
-        super(CrossSessionalApply, self).on_update(event)
-        self._process_update(event.source, event.item.timestamp, event.item.data)
-
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        super(CrossSessionalApply, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
-        if self.inputs[0].size() >= self.length:
+        if self.is_full():
             if self.all_filled():
-                # result[PipeLine.VALUE] = self.np_func(self.df.values)
-                packed_matrix = np.transpose(np.array(self.cache.values()))
-                # TODO review this if this correctly handle higher dimension array stored in cache
-                if len(packed_matrix.shape) == 3:
-                    packed_matrix = packed_matrix[:, 0, :]
-                # TODO what if the cache value is a higher dimension matrix?
-                result[PipeLine.VALUE] = self.np_func(packed_matrix)
+                # (length x inputs), copied as some of the functions update it in place
+                result[PipeLine.VALUE] = self.np_func(np.array(self.cache.T))
             else:
                 result[PipeLine.VALUE] = self._default_output()
         else:
@@ -59,15 +50,10 @@ class CrossSessionalApplyScala(PipeLine):
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         super(CrossSessionalApplyScala, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
-        if self.inputs[0].size() >= self.length:
+        if self.is_full():
             if self.all_filled():
-                packed_matrix = np.transpose(np.array(self.cache.values()))
-                # TODO review this if this correctly handle higher dimension array stored in cache
-                if len(packed_matrix.shape) == 3:
-                    packed_matrix = packed_matrix[:, 0, :]
-                # TODO what if the cache value is a higher dimension matrix?
-                result[PipeLine.VALUE] = self.np_func(packed_matrix)
-                # result[PipeLine.VALUE] = self.np_func(self.df.values)
+                # (length x inputs), copied as some of the functions update it in place
+                result[PipeLine.VALUE] = self.np_func(np.array(self.cache.T))
             else:
                 result[PipeLine.VALUE] = self._default_output()
         else:
@@ -120,8 +106,7 @@ def sign_power(x, e):
 
 
 def timeseries_rank_helper(x, ascending):
-    df = pd.DataFrame(x)
-    return ((df.rank(axis=0, ascending=ascending) - 1) / (df.shape[0] - 1)).tail(1).values
+    return ((rank_last(x, ascending=ascending) - 1) / (x.shape[0] - 1)).reshape(1, -1)
 
 
 class Tail(CrossSessionalApply):
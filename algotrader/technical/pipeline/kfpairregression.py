@@ -0,0 +1,60 @@
+import numpy as np
+from typing import Dict
+
+from algotrader.technical.kfpairregression import BatchKalmanRegression, KalmanFilteringPairRegression
+from algotrader.technical.pipeline import PipeLine
+
+
+class KalmanPairRegression(PipeLine):
+    """
+    KalmanFilteringPairRegression of every pair of the inputs, all the pairs are filtered by one
+    BatchKalmanRegression step per row. Outputs are (inputs x inputs) matrices, [i, j] is the regression of input
+    j (dependent) on input i (independent), NaN for the first length - 1 rows
+    """
+
+    def __init__(self, time_series=None, inputs=None, input_keys='close',
+                 desc="Kalman Filter Pair Regression", length=10, **kwargs):
+        super(KalmanPairRegression, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys,
+                                                   desc=desc,
+                                                   keys=[PipeLine.VALUE,
+                                                         KalmanFilteringPairRegression.SLOPE,
+                                                         KalmanFilteringPairRegression.INTERCEPT],
+                                                   length=length, **kwargs)
+        self.delta = self.get_float_config("delta", 1e-5)
+
+    def _create_kernels(self):
+        super(KalmanPairRegression, self)._create_kernels()
+        self.__kernel = BatchKalmanRegression(self.numPipes * self.numPipes, delta=self.delta)
+        self.__kernel_time = None
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        super(KalmanPairRegression, self)._process_update(source=source, timestamp=timestamp, data=data)
+        if self.all_filled():
+            row = np.array(self.cache[:, -1], dtype=np.float64)
+            x = np.repeat(row, self.numPipes)
+            y = np.tile(row, self.numPipes)
+            if timestamp == self.__kernel_time:
+                self.__kernel.replace(x, y)
+            else:
+                self.__kernel.update(x, y)
+                self.__kernel_time = timestamp
+
+        result = {}
+        if self.all_filled() and self.__kernel.steps[0] >= self.length:
+            slope = self.__kernel.slope.reshape(self.shape())
+            result[PipeLine.VALUE] = slope
+            result[KalmanFilteringPairRegression.SLOPE] = slope
+            result[KalmanFilteringPairRegression.INTERCEPT] = self.__kernel.intercept.reshape(self.shape())
+        else:
+            result[PipeLine.VALUE] = self._default_output()
+            result[KalmanFilteringPairRegression.SLOPE] = self._default_output()
+            result[KalmanFilteringPairRegression.INTERCEPT] = self._default_output()
+        self.add(timestamp=timestamp, data=result)
+
+    def _default_output(self):
+        na_array = np.empty(shape=self.shape())
+        na_array[:] = np.nan
+        return na_array
+
+    def shape(self):
+        return np.array([self.numPipes, self.numPipes])
@@ -13,10 +13,10 @@ class MakeVector(PipeLine):
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         super(MakeVector, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
-        if self.get_input(0).size() >= self.length:
+        if self.is_full():
             if self.all_filled():
-                packed_matrix = np.transpose(np.array(self.cache.values()))
-                result[PipeLine.VALUE] = packed_matrix
+                # a copy, the cache is updated in place
+                result[PipeLine.VALUE] = self.cache.T.copy()
             else:
                 result[PipeLine.VALUE] = self._default_output()
         else:
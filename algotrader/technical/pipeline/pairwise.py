@@ -4,6 +4,7 @@ from typing import Dict
 from algotrader import Context
 from algotrader.technical import DataSeries
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import RollingCovariance
 from algotrader.technical.pipeline import PipeLine
 from algotrader.utils.data_series import get_input_name
 
@@ -20,7 +21,7 @@ class Pairwise(PipeLine):
         input_rhs = self.get_input(1)
         self.lhs_name = get_input_name(input_lhs)
         self.rhs_name = get_input_name(input_rhs)
-        self.is_input_pipeline = True
+        self.is_input_pipeline = False
 
         if isinstance(input_lhs, PipeLine) and not isinstance(input_rhs, PipeLine):
             raise TypeError("input_lhs has to be the same type as input_rhs as Pipeline")
@@ -44,16 +45,15 @@ class Pairwise(PipeLine):
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         super(Pairwise, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
-        if self.get_input(idx=1).size() >= self.length:
+        if self.is_full():
             if self.all_filled():
-                x = self.cache[self.lhs_name][-self.length:] if self.length > 1 else self.cache[self.lhs_name][-1]
-                y = self.cache[self.rhs_name][-self.length:] if self.length > 1 else self.cache[self.rhs_name][-1]
                 if self.is_input_pipeline:
-                    xstk = np.vstack(x)
-                    ystk = np.vstack(y)
-                    result[PipeLine.VALUE] = self.func(xstk, ystk)
+                    # (length x width) rows of the input outputs
+                    result[PipeLine.VALUE] = self.func(self.cache[0], self.cache[1])
+                elif self.length > 1:
+                    result[PipeLine.VALUE] = self.func(self.cache[0], self.cache[1])
                 else:
-                    result[PipeLine.VALUE] = self.func(x, y)
+                    result[PipeLine.VALUE] = self.func(self.cache[0, -1], self.cache[1, -1])
             else:
                 result[PipeLine.VALUE] = self._default_output()
         else:
@@ -133,10 +133,38 @@ class Max(Pairwise):
 
 
 class PairCorrelation(Pairwise):
+    """
+    correlation over the last length values, from running sums updated once per timestamp for plain series
+    """
+
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Pairwise PairCorrelation", length=1):
         super(PairCorrelation, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
                                    func=lambda x, y: np.corrcoef(np.transpose(x), np.transpose(y))[0, 1],length=length)
 
+    def _create_kernels(self):
+        super(PairCorrelation, self)._create_kernels()
+        self.__kernel = RollingCovariance(self.length, 2)
+        self.__kernel_time = None
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        if self.is_input_pipeline:
+            super(PairCorrelation, self)._process_update(source=source, timestamp=timestamp, data=data)
+            return
+        PipeLine._process_update(self, source=source, timestamp=timestamp, data=data)
+        result = {}
+        if self.all_filled():
+            row = np.array(self.cache[:, -1], dtype=np.float64)
+            if timestamp == self.__kernel_time:
+                self.__kernel.replace(row)
+            else:
+                self.__kernel.push(row)
+                self.__kernel_time = timestamp
+        if self.all_filled() and self.__kernel.is_full():
+            result[PipeLine.VALUE] = self.__kernel.get_corr()[0, 1]
+        else:
+            result[PipeLine.VALUE] = self._default_output()
+        self.add(timestamp=timestamp, data=result)
+
 #
 # from jinja2 import Template
 # pairwiseTemplate = Template(
@@ -1,10 +1,45 @@
 import numpy as np
-import pandas as pd
 from typing import Dict
 
 from algotrader.technical.pipeline import PipeLine
 
 
+def rankdata(values: np.ndarray, ascending: bool = True) -> np.ndarray:
+    """
+    ranks from 1 along the last axis with one argsort, ties get the average of their ranks like
+    scipy.stats.rankdata. NaN values are not ranked and stay NaN, like pd.DataFrame.rank
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keys = values if ascending else -values
+    # NaN values are sorted last, each in its own tie group
+    order = np.argsort(keys, axis=-1)
+    ordered = np.take_along_axis(keys, order, axis=-1)
+    size = values.shape[-1]
+    pos = np.broadcast_to(np.arange(size), values.shape)
+    first = np.ones(values.shape, dtype=bool)
+    first[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    last = np.ones(values.shape, dtype=bool)
+    last[..., :-1] = first[..., 1:]
+    start = np.maximum.accumulate(np.where(first, pos, 0), axis=-1)
+    end = np.minimum.accumulate(np.where(last, pos, size - 1)[..., ::-1], axis=-1)[..., ::-1]
+    ranks = np.empty(values.shape)
+    np.put_along_axis(ranks, order, (start + end) / 2.0 + 1, axis=-1)
+    ranks[np.isnan(values)] = np.nan
+    return ranks
+
+
+def rank_last(values: np.ndarray, ascending: bool = True) -> np.ndarray:
+    """
+    :param values: (length x columns)
+    :return: rankdata of the last row of each column within the column, without sorting
+    """
+    values = np.asarray(values, dtype=np.float64)
+    latest = values[-1]
+    before = values < latest if ascending else values > latest
+    ranks = before.sum(axis=0) + ((values == latest).sum(axis=0) + 1) / 2.0
+    return np.where(np.isnan(latest), np.nan, ranks)
+
+
 class Rank(PipeLine):
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Rank", ascending=True):
         super(Rank, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
@@ -16,9 +51,8 @@ class Rank(PipeLine):
         super(Rank, self)._process_update(source=source, timestamp=timestamp, data=data)
         result = {}
         if self.all_filled():
-            df = pd.DataFrame(self.cache)
-            result[PipeLine.VALUE] = ((df.rank(axis=1, ascending=self.ascending) - 1) / (df.shape[1] - 1)).tail(
-                1).values
+            ranks = rankdata(self.cache[:, -1], ascending=self.ascending)
+            result[PipeLine.VALUE] = ((ranks - 1) / (self.numPipes - 1)).reshape(1, self.numPipes)
         else:
             result[PipeLine.VALUE] = self._default_output()
 
@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 from typing import Dict
 
@@ -12,7 +14,8 @@ def roc(prev_value, curr_value):
 
 class ROC(Indicator):
     __slots__ = (
-        'length'
+        'length',
+        '__window',
     )
 
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Rate Of Change", length=1):
@@ -20,12 +23,40 @@ class ROC(Indicator):
                                   length=length)
         self.length = self.get_int_config("length", 1)
 
+    def _create_kernels(self):
+        # the input values of the last length + 1 rows
+        self.__window = deque(maxlen=self.length + 1)
+
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            for pos in range(max(0, end - self.length - 1), end):
+                self.__window.append(self._get_first_input_value(input.get_row(pos)))
+
+    def get_state(self):
+        return {'window': list(self.__window)}
+
+    def set_state(self, state):
+        self.__window.extend(state['window'])
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = np.asarray(arrays[self._get_first_input_key()], dtype=np.float64)
+        result = np.full(len(values), np.nan)
+        prev_values = values[:-self.length]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[self.length:] = np.where(prev_values != 0.0, (values[self.length:] - prev_values) / prev_values,
+                                            np.nan)
+        return {Indicator.VALUE: result}
+
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        value = self._get_first_input_value(data)
+        if self.__window and self.size() > 0 and timestamp == self.current_time():
+            self.__window[-1] = value
+        else:
+            self.__window.append(value)
+
         result = {}
-        if self.first_input.size() > self.length:
-            prev_value = self.first_input.ago(self.length, self.first_input_keys)
-            curr_value = self.first_input.now(self.first_input_keys)
-            result[Indicator.VALUE] = roc(prev_value, curr_value)
+        if len(self.__window) > self.length:
+            result[Indicator.VALUE] = roc(self.__window[0], value)
         else:
             result[Indicator.VALUE] = np.nan
 
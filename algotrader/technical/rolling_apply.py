@@ -1,89 +1,203 @@
+from collections import namedtuple
+
 import numpy as np
 import pandas as pd
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import ExponentialMean, RollingExtremum, RollingHigherMoments, RollingMoments, \
+    RollingQuantile, batch_rolling, get_kernel_state, set_kernel_state
+
+RollingKernelSpec = namedtuple('RollingKernelSpec', ['create', 'get_value', 'compute'])
+
+rolling_kernels = {}
+
+
+def register_rolling_kernel(name: str, create, get_value, compute) -> None:
+    """
+    make an incremental kernel available to RollingApply(kernel=name)
+    :param create: create(indicator) -> RollingKernel
+    :param get_value: get_value(indicator, kernel) -> value of the indicator once the kernel is full
+    :param compute: compute(indicator, values) -> value of the indicator at each position of the values
+    """
+    rolling_kernels[name] = RollingKernelSpec(create, get_value, compute)
+
+
+def _rolling(indicator, values: np.ndarray, min_periods: int = 1):
+    return pd.Series(np.asarray(values, dtype=np.float64)).rolling(indicator.length, min_periods=min_periods)
+
+
+def _rolling_moment(indicator, values: np.ndarray, min_periods: int, name: str, flat_value: float):
+    """
+    :return: rolling skew or kurt, flat_value over windows of equal values like RollingHigherMoments whatever
+    the pandas version
+    """
+    rolling = _rolling(indicator, values, min_periods)
+    result = getattr(rolling, name)().values.copy()
+    result[(rolling.max() == rolling.min()).values] = flat_value
+    return result
+
+
+register_rolling_kernel('mean', lambda ind: RollingMoments(ind.length),
+                        lambda ind, kernel: kernel.get_mean(),
+                        lambda ind, values: _rolling(ind, values).mean().values)
+register_rolling_kernel('std', lambda ind: RollingMoments(ind.length),
+                        lambda ind, kernel: kernel.get_std(),
+                        lambda ind, values: _rolling(ind, values).std(ddof=0).values)
+register_rolling_kernel('var', lambda ind: RollingMoments(ind.length),
+                        lambda ind, kernel: kernel.get_var(),
+                        lambda ind, values: _rolling(ind, values).var(ddof=0).values)
+register_rolling_kernel('skew', lambda ind: RollingHigherMoments(ind.length),
+                        lambda ind, kernel: kernel.get_skew(),
+                        lambda ind, values: _rolling_moment(ind, values, 3, 'skew', 0.0))
+register_rolling_kernel('kurt', lambda ind: RollingHigherMoments(ind.length),
+                        lambda ind, kernel: kernel.get_kurt(),
+                        lambda ind, values: _rolling_moment(ind, values, 4, 'kurt', -3.0))
+register_rolling_kernel('quantile', lambda ind: RollingQuantile(ind.length),
+                        lambda ind, kernel: kernel.get_quantile(ind.q),
+                        lambda ind, values: _rolling(ind, values).quantile(ind.q).values)
+register_rolling_kernel('median', lambda ind: RollingQuantile(ind.length),
+                        lambda ind, kernel: kernel.get_quantile(0.5),
+                        lambda ind, values: _rolling(ind, values).median().values)
+register_rolling_kernel('max', lambda ind: RollingExtremum(ind.length, is_max=True),
+                        lambda ind, kernel: kernel.get_value(),
+                        lambda ind, values: _rolling(ind, values).max().values)
+register_rolling_kernel('min', lambda ind: RollingExtremum(ind.length, is_max=False),
+                        lambda ind, kernel: kernel.get_value(),
+                        lambda ind, values: _rolling(ind, values).min().values)
+def _ewm(indicator, values: np.ndarray) -> np.ndarray:
+    numerators, denominators = ExponentialMean(indicator.length).get_sums(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominators > 0, numerators / denominators, np.nan)
+
+
+register_rolling_kernel('ewm', lambda ind: ExponentialMean(ind.length),
+                        lambda ind, kernel: kernel.get_mean(),
+                        _ewm)
 
 
 class RollingApply(Indicator):
-    _slots__ = (
+    """
+    func of the last length values of the input, NaN until there are length of them.
+
+    A kernel registered with register_rolling_kernel (mean, std, var, skew, kurt, quantile with config q,
+    median, max, min, ewm with span length) is updated in O(1) per bar, NaN values are skipped. Any other func
+    is called on a zero-copy window of the input each bar. The history is computed over sliding_window_view
+    windows, in one call when func takes an axis like the numpy reductions, window by window otherwise.
+    """
+    kernel_name = None
+
+    __slots__ = (
         'length',
-        'func'
+        'func',
+        'q',
+        '__spec',
+        '__kernel',
     )
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Rolling Apply", length=0, func=np.std):
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Rolling Apply", length=0, func=np.std,
+                 **kwargs):
         super(RollingApply, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                           length=length)
+                                           length=length, **kwargs)
         self.func = func
         self.length = self.get_int_config("length", 0)
+        self.q = self.get_float_config("q", 0.5)
+        kernel_name = self.get_config("kernel", self.kernel_name)
+        if kernel_name is not None and kernel_name not in rolling_kernels:
+            raise AssertionError("unknown rolling kernel %s" % kernel_name)
+        self.__spec = rolling_kernels[kernel_name] if kernel_name is not None else None
+
+    def _create_kernels(self):
+        self.__kernel = self.__spec.create(self) if self.__spec else None
+
+    def _resume(self, input, end: int):
+        if self.__kernel is not None and input is self.first_input:
+            self.__kernel.seed(input.get_by_idx(slice(0, end), self._get_first_input_key()))
+
+    def get_state(self):
+        # func is applied to the input window of each bar, there is no state to keep
+        return {'kernel': get_kernel_state(self.__kernel)} if self.__kernel is not None else {}
+
+    def set_state(self, state):
+        if self.__kernel is not None:
+            set_kernel_state(self.__kernel, state['kernel'])
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = arrays[self._get_first_input_key()]
+        if self.__spec:
+            result = np.array(self.__spec.compute(self, values), dtype=np.float64)
+            result[:self.length - 1] = np.nan
+            return {Indicator.VALUE: result}
+        if len(arrays) != 1:
+            return None
+        return {Indicator.VALUE: batch_rolling(values, self.length, self.__apply_windows)}
+
+    def __apply_windows(self, windows: np.ndarray) -> np.ndarray:
+        try:
+            result = np.asarray(self.func(windows, axis=1), dtype=np.float64)
+            if result.shape == (len(windows),):
+                return result
+        except TypeError:
+            pass
+        return np.array([self.func(window) for window in windows], dtype=np.float64)
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
         result = {}
-        if self.first_input.size() >= self.length:
-            sliced = self.first_input.get_by_idx(keys=self.first_input_keys, idx=slice(-self.length, None, None))
-            result[Indicator.VALUE] = self.func(sliced)
+        if self.__kernel is not None:
+            self._update_kernel(self.__kernel, timestamp, self._get_first_input_value(data))
+            if self.__kernel.is_full():
+                result[Indicator.VALUE] = self.__spec.get_value(self, self.__kernel)
+            else:
+                result[Indicator.VALUE] = np.nan
         else:
-            result[Indicator.VALUE] = np.nan
+            end = self.first_input.asof_index(timestamp) + 1
+            if end >= self.length:
+                sliced = self.first_input.get_by_idx(keys=self.first_input_keys, idx=slice(end - self.length, end))
+                result[Indicator.VALUE] = self.func(sliced)
+            else:
+                result[Indicator.VALUE] = np.nan
 
         self.add(timestamp=timestamp, data=result)
 
 
 class StdDev(RollingApply):
+    """
+    population standard deviation, kept on np.std so that it matches it to the last digit
+    """
+
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Rolling Standard Deviation", length=30):
         super(StdDev, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                     length=length, func=lambda x: np.std(x, axis=0))
-
-
-def pd_skew_wrapper(x):
-    ts = pd.Series(x)
-    return ts.skew()
-
-
-def pd_kurtosis_wrapper(x):
-    ts = pd.Series(x)
-    return ts.kurtosis()
-
-
-def pd_kurt_wrapper(x):
-    ts = pd.Series(x)
-    return ts.kurt()
+                                     length=length, func=np.std)
 
 
 class Skew(RollingApply):
+    """
+    bias corrected skew like pd.Series.skew
+    """
+    kernel_name = 'skew'
+
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Rolling Skew", length=30):
         super(Skew, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                   length=length, func=lambda x: pd_skew_wrapper(x))
+                                   length=length)
 
 
 class Kurtosis(RollingApply):
+    """
+    bias corrected excess kurtosis like pd.Series.kurtosis
+    """
+    kernel_name = 'kurt'
+
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Rolling Kurtosis", length=30):
         super(Kurtosis, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                       length=length, func=lambda x: pd_kurtosis_wrapper(x))
+                                       length=length)
 
 
 class Kurt(RollingApply):
+    """
+    same as Kurtosis, like pd.Series.kurt
+    """
+    kernel_name = 'kurt'
+
     def __init__(self, time_series=None, inputs=None, input_keys='close', desc="Rolling Kurt", length=30):
         super(Kurt, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                   length=length, func=lambda x: pd_kurt_wrapper(x))
-
-#
-#
-# from jinja2 import Template
-# rollingTmp = Template("""
-# class {{className}}(RollingApply):
-#     def __init__(self, input, input_key='close', length=30, desc="Rolling {{className}}"):
-#         super({{className}}, self).__init__(input,
-#                                      func={{func}},
-#                                      name=Indicator.get_name({{className}}.__name__, input, input_key, length),
-#                                      length=length,
-#                                      input_key=input_key, desc=desc)
-# """)
-#
-# print rollingTmp.render({"className": "Skew",
-#                          "func" : "lambda x: pd_skew_wrapper(x)"})
-#
-# print rollingTmp.render({"className": "Kurtosis",
-#                          "func" : "lambda x: pd_kurtosis_wrapper(x)"})
-#
-# print rollingTmp.render({"className": "Kurt",
-#                          "func" : "lambda x: pd_kurt_wrapper(x)"})
+                                   length=length)
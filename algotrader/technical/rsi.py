@@ -2,6 +2,7 @@ import numpy as np
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import WilderAverage, get_kernel_state, set_kernel_state
 
 
 def gain_loss(prev_value, next_value):
@@ -49,45 +50,44 @@ def rsi(values, input_key, length):
 
 
 class RSI(Indicator):
+    """
+    Wilder relative strength index, 100 without any loss
+    """
     __slots__ = (
         'length',
-        '__prev_gain',
-        '__prev_loss'
+        '__kernel',
     )
 
     def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Relative Strength Indicator", length=14):
         super(RSI, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
                                   length=length)
         self.length = self.get_int_config("length", 14)
-        self.__prev_gain = None
-        self.__prev_loss = None
         #super(RSI, self)._update_from_inputs()
 
+    def _create_kernels(self):
+        self.__kernel = WilderAverage(self.length)
+
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            self.__kernel.seed(input.get_by_idx(slice(0, end), self._get_first_input_key()))
+
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel)}
+
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        avg_gain, avg_loss = self.__kernel.get_averages(arrays[self._get_first_input_key()])
+        result = np.full(len(avg_gain), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[self.length:] = np.where(avg_loss[self.length:] == 0, 100.0,
+                                            100 - 100 / (1 + avg_gain[self.length:] / avg_loss[self.length:]))
+        return {Indicator.VALUE: result}
+
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
-        if self.first_input.size() > self.length:
-            if self.__prev_gain is None:
-                avg_gain, avg_loss = avg_gain_loss(self.first_input, self.first_input_keys[0], 0, self.first_input.size())
-            else:
-                prev_value = self.first_input.ago(1, self.first_input_keys[0])
-                curr_value = self.first_input.now(self.first_input_keys[0])
-                curr_gain, curr_loss = gain_loss(prev_value, curr_value)
-                avg_gain = (self.__prev_gain * (self.length - 1) + curr_gain) / float(self.length)
-                avg_loss = (self.__prev_loss * (self.length - 1) + curr_loss) / float(self.length)
-
-            if avg_loss == 0:
-                rsi_value = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi_value = 100 - 100 / (1 + rs)
-                self.__prev_gain = avg_gain
-                self.__prev_loss = avg_loss
-
-            result[Indicator.VALUE] = rsi_value
-        else:
-            result[Indicator.VALUE] = np.nan
-
-        self.add(timestamp=timestamp, data=result)
+        self._update_kernel(self.__kernel, timestamp, self._get_first_input_value(data))
+        self.add(timestamp=timestamp, data={Indicator.VALUE: self.__kernel.get_rsi()})
 
 # if __name__ == "__main__":
 #     import datetime
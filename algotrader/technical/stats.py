@@ -1,84 +1,162 @@
+import warnings
+
 import numpy as np
 from typing import Dict
 
 from algotrader.technical import Indicator
+from algotrader.technical.kernel import RollingExtremum, RollingMoments, batch_rolling, get_kernel_state, \
+    set_kernel_state
 
 
 class MAX(Indicator):
+    """
+    rolling maximum over the last length values of the input, NaN values are skipped.
+    ARGMAX holds the number of bars since the maximum, 0 when it is the latest bar
+    """
+    ARGMAX = 'argmax'
+    _is_max = True
+    _arg_key = ARGMAX
+
     __slots__ = (
-        'length'
+        'length',
+        '__kernel',
     )
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Maximum", length=0):
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Maximum", length=0, **kwargs):
         super(MAX, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length)
+                                  length=length, **kwargs)
         self.length = self.get_int_config("length", 0)
 
-    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
-        if self.self.first_input.size() >= self.length:
-            result[Indicator.VALUE] = self.self.first_input.max(-self.length, self.first_input_keys[0])
-        else:
-            result[Indicator.VALUE] = np.nan
+    def _create_kernels(self):
+        self.__kernel = RollingExtremum(self.length, is_max=self._is_max)
 
-        self.add(timestamp=timestamp, data=result)
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            for pos in range(self.__kernel.get_history_start(end), end):
+                self.__kernel.push(self._get_first_input_value(input.get_row(pos)))
 
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel)}
 
-class MIN(Indicator):
-    __slots__ = (
-        'length'
-    )
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Minimum", length=0):
-        super(MIN, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length)
-        self.length = self.get_int_config("length", 0)
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        length = self.length
+        fill = -np.inf if self._is_max else np.inf
+        arg_func = np.argmax if self._is_max else np.argmin
+
+        def bars_since(windows):
+            # the latest of equal extremes counts, search the windows backwards
+            bars = arg_func(np.where(np.isnan(windows), fill, windows)[:, ::-1], axis=1).astype(np.float64)
+            bars[np.isnan(windows).all(axis=1)] = np.nan
+            return bars
+
+        values = arrays[self._get_first_input_key()]
+        bars = batch_rolling(values, length, bars_since)
+        result = np.full(len(values), np.nan)
+        valid = np.flatnonzero(bars == bars)
+        result[valid] = np.asarray(values, dtype=np.float64)[valid - bars[valid].astype(np.int64)]
+        return {Indicator.VALUE: result, self._arg_key: bars}
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        self._update_kernel(self.__kernel, timestamp, self._get_first_input_value(data))
+
         result = {}
-        if self.first_input.size() >= self.length:
-            result[Indicator.VALUE] = self.first_input.min(-self.length, self.first_input_keys[0])
+        if self.__kernel.is_full():
+            result[Indicator.VALUE] = self.__kernel.get_value()
+            result[self._arg_key] = self.__kernel.get_bars_since()
         else:
             result[Indicator.VALUE] = np.nan
+            result[self._arg_key] = np.nan
 
         self.add(timestamp=timestamp, data=result)
 
 
-class STD(Indicator):
-    __slots__ = (
-        'length'
-    )
-
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Standard Deviation", length=0):
-        super(STD, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length)
-        self.length = self.get_int_config("length", 0)
-
-    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
-        if self.first_input.size() >= self.length:
-            result[Indicator.VALUE] = self.first_input.std(-self.length, self.first_input_keys[0])
-        else:
-            result[Indicator.VALUE] = np.nan
+class MIN(MAX):
+    """
+    rolling minimum over the last length values of the input, NaN values are skipped.
+    ARGMIN holds the number of bars since the minimum, 0 when it is the latest bar
+    """
+    ARGMIN = 'argmin'
+    _is_max = False
+    _arg_key = ARGMIN
 
-        self.add(timestamp=timestamp, data=result)
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Minimum", length=0, **kwargs):
+        super(MIN, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                  length=length, **kwargs)
 
 
 class VAR(Indicator):
+    """
+    rolling variance over the last length values of the input, NaN values are skipped.
+    The ddof config picks the variant, 0 (default) for the population variance, 1 for the sample variance
+    """
     __slots__ = (
-        'length'
+        'length',
+        'ddof',
+        '__kernel',
     )
 
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Variance", length=0):
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Variance", length=0, **kwargs):
         super(VAR, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
-                                  length=length)
+                                  length=length, **kwargs)
         self.length = self.get_int_config("length", 0)
+        self.ddof = self.get_int_config("ddof", 0)
+
+    def _create_kernels(self):
+        self.__kernel = RollingMoments(self.length)
+
+    def _resume(self, input, end: int):
+        if input is self.first_input:
+            for pos in range(self.__kernel.get_history_start(end), end):
+                self.__kernel.push(self._get_first_input_value(input.get_row(pos)))
+
+    def get_state(self):
+        return {'kernel': get_kernel_state(self.__kernel)}
+
+    def set_state(self, state):
+        set_kernel_state(self.__kernel, state['kernel'])
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        with warnings.catch_warnings():
+            # windows with fewer than ddof + 1 values are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            var = batch_rolling(arrays[self._get_first_input_key()], self.length,
+                                lambda windows: np.nanvar(windows, axis=1, ddof=self.ddof))
+        return {Indicator.VALUE: self._get_batch_value(var)}
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        self._update_kernel(self.__kernel, timestamp, self._get_first_input_value(data))
+
         result = {}
-        if self.first_input.size() >= self.length:
-            result[Indicator.VALUE] = self.first_input.std(-self.length, self.first_input_keys[0])
+        if self.__kernel.is_full():
+            result[Indicator.VALUE] = self._get_value(self.__kernel)
         else:
             result[Indicator.VALUE] = np.nan
 
         self.add(timestamp=timestamp, data=result)
+
+    def _get_value(self, kernel: RollingMoments) -> float:
+        return kernel.get_var(self.ddof)
+
+    def _get_batch_value(self, var: np.ndarray) -> np.ndarray:
+        return var
+
+
+class STD(VAR):
+    """
+    rolling standard deviation over the last length values of the input, NaN values are skipped.
+    The ddof config picks the variant, 0 (default) for the population standard deviation, 1 for the sample one
+    """
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Standard Deviation", length=0,
+                 **kwargs):
+        super(STD, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                  length=length, **kwargs)
+
+    def _get_value(self, kernel: RollingMoments) -> float:
+        return kernel.get_std(self.ddof)
+
+    def _get_batch_value(self, var: np.ndarray) -> np.ndarray:
+        return np.sqrt(var)
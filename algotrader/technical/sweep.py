@@ -0,0 +1,500 @@
+"""
+Sweep indicators compute one indicator for many lengths over a single input in one pass:
+
+    sma = SweepSMA(inputs='Bar.A.Time.86400', input_keys='close', lengths=[5, 10, 20])
+
+The series id holds the lengths separated by colons, SweepSMA(Bar.A.Time.86400[close],lengths=5:10:20), and
+there is one output column per length named after it. The state of all the lengths is updated together, with
+(lengths) arrays: running sums sharing one window of the largest length for SMA / VAR / STD, the history of SMA
+computed from shared prefix sums restarting every block of rows, one shared recursion for the exponential means.
+get_series(length) returns a DataSeries view registered under the id of the single-length indicator,
+e.g. SMA(Bar.A.Time.86400[close],length=5).
+"""
+import warnings
+
+import numpy as np
+from scipy.signal import lfilter
+from typing import Dict, List
+
+from algotrader.technical import Indicator
+from algotrader.technical.kernel import batch_rolling, decode_state, encode_state
+from algotrader.trading.data_series import DataSeries
+from algotrader.utils.data_series import build_series_id
+
+
+def parse_lengths(lengths) -> List[int]:
+    """
+    :param lengths: lengths as a list or as in the series id, e.g. 5:10:20
+    """
+    if isinstance(lengths, str):
+        lengths = lengths.split(':') if lengths else []
+    elif isinstance(lengths, int):
+        lengths = [lengths]
+    lengths = [int(length) for length in lengths]
+    assert lengths and all(length > 0 for length in lengths), "invalid lengths %s" % lengths
+    return lengths
+
+
+def format_lengths(lengths) -> str:
+    return ':'.join(str(length) for length in parse_lengths(lengths))
+
+
+def iter_window_sums(values: np.ndarray, lengths: np.ndarray, block_size: int = 4096):
+    """
+    sums of the valid values and counts of NaN values over the window of each length ending at each row, of the
+    rows so far until there are length of them. The sums are computed a block of rows at a time from prefix sums
+    restarting at each block, from the largest length rows before it, so that their rounding errors do not grow
+    with the history
+    :return: iterator of start, end, (lengths x (end - start)) sums and NaN counts of the rows from start to end
+    """
+    max_length = int(lengths.max())
+    nans = np.isnan(values)
+    nan_prefix = np.concatenate(([0], np.cumsum(nans)))
+    for start in range(0, len(values), block_size):
+        end = min(start + block_size, len(values))
+        base = max(0, start - max_length)
+        segment = values[base:end]
+        valid = segment[~nans[base:end]]
+        # sums of the values less one of them stay small
+        shift = valid[0] if len(valid) else 0.0
+        prefix = np.zeros(end - base + 1)
+        np.cumsum(np.where(nans[base:end], 0.0, segment - shift), out=prefix[1:])
+        ends = np.arange(start, end) - base + 1
+        begins = np.maximum(ends - lengths[:, None], 0)
+        nan_counts = nan_prefix[ends + base] - nan_prefix[begins + base]
+        sums = prefix[ends] - prefix[begins]
+        sums += (ends - begins - nan_counts) * shift
+        yield start, end, sums, nan_counts
+
+
+class SweepIndicator(Indicator):
+    """
+    An update of the latest row recomputes it in place. Subclasses implement _update and _compute over arrays
+    of the lengths, _save / _restore for their state, and _recompute when they keep running sums, which are
+    then rebuilt from the window every window size rows to stop rounding errors from accumulating.
+    """
+    # class name of the single-length indicator, for the ids of the views
+    view_cls_name = None
+    recompute = False
+
+    __slots__ = (
+        'lengths',
+        '_lengths',
+        '_window',
+        '_pos',
+        '_count',
+        '__snapshot',
+        '__evicted',
+        '__views',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc=None, lengths=None, **kwargs):
+        if lengths is not None:
+            lengths = format_lengths(lengths)
+        super(SweepIndicator, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                             keys=lengths.split(':') if lengths else None, lengths=lengths, **kwargs)
+        self.lengths = parse_lengths(self.get_config("lengths", ""))
+        self._lengths = np.asarray(self.lengths, dtype=np.int64)
+        self.__views = {}
+
+    def _window_size(self) -> int:
+        return max(self.lengths)
+
+    def _create_kernels(self):
+        self._window = np.full(self._window_size(), np.nan)
+        self._pos = 0
+        self._count = 0
+        self.__snapshot = None
+        self.__evicted = None
+
+    def _update(self, value: float, evicted: np.ndarray, leaving: np.ndarray) -> None:
+        """
+        update the state of every length with a new value, already in the window
+        :param evicted: value which left the window of each length
+        :param leaving: True for the lengths with a value in evicted, their window was full
+        """
+        pass
+
+    def _recompute(self) -> None:
+        """
+        rebuild the state from the window, it must not depend on anything else
+        """
+        pass
+
+    def _compute(self) -> np.ndarray:
+        """
+        :return: output of each length for the latest value
+        """
+        raise NotImplementedError()
+
+    def _save(self):
+        """
+        :return: copy of the state besides the window, restored to update the latest row again
+        """
+        return None
+
+    def _restore(self, state) -> None:
+        pass
+
+    def _latest_first(self) -> np.ndarray:
+        """
+        :return: values in the window, the latest first
+        """
+        size = self._window_size()
+        return self._window[(self._pos - 1 - np.arange(min(self._count, size))) % size]
+
+    def _get_batch_states(self, values: np.ndarray):
+        """
+        :return: the states of _save before and after the last of values, computed over all of them at once,
+        None to push the values again instead
+        """
+        return None
+
+    def _resume(self, input, end: int):
+        if input is not self.first_input:
+            return
+        values = np.asarray(input.get_by_idx(slice(0, end), self._get_first_input_key()), dtype=np.float64)
+        size = self._window_size()
+        states = self._get_batch_states(values) if end > 0 else None
+        if states is not None:
+            # the window, position and evicted values of the last push, its state and the one before it
+            for pos in range(max(0, end - size), end):
+                self._window[pos % size] = values[pos]
+            self._pos = end % size
+            self._count = end
+            evicted = end - 1 - self._lengths
+            self.__evicted = np.where(evicted >= 0, values[np.maximum(evicted, 0)], np.nan)
+            self.__snapshot = states[0]
+            self._restore(states[1])
+            return
+        start = (end - 1) // size * size if end > 0 else 0
+        if self.recompute and start >= size:
+            # the state after a recompute only depends on the window, which streaming had in the same state
+            self._window[:] = values[start - size:start]
+            self._pos = 0
+            self._count = start
+            self._recompute()
+        else:
+            start = 0
+        for pos in range(start, end):
+            self.__push(values[pos])
+
+    def get_state(self):
+        return {'window': self._window.tolist(), 'pos': self._pos, 'count': self._count,
+                'saved': encode_state(self._save()), 'snapshot': encode_state(self.__snapshot),
+                'evicted': encode_state(self.__evicted)}
+
+    def set_state(self, state):
+        self._window = np.asarray(state['window'], dtype=np.float64)
+        self._pos = state['pos']
+        self._count = state['count']
+        if state['saved'] is not None:
+            self._restore(decode_state(state['saved']))
+        self.__snapshot = decode_state(state['snapshot'])
+        self.__evicted = decode_state(state['evicted'])
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        value = self._get_first_input_value(data)
+        if self.size() > 0 and timestamp == self.current_time():
+            output = self.__replace(value)
+        else:
+            output = self.__push(value)
+        values = output.tolist()
+        self.add(timestamp=timestamp, data=dict(zip(self.time_series.keys, values)))
+        for idx, view in self.__views.items():
+            view.add(timestamp=timestamp, data={Indicator.VALUE: values[idx]})
+
+    def __push(self, value: float) -> np.ndarray:
+        size = self._window_size()
+        self.__evicted = self._window[(self._pos - self._lengths) % size]
+        self.__snapshot = self._save()
+        self._window[self._pos] = value
+        self._pos = (self._pos + 1) % size
+        self._count += 1
+        self.__update(value)
+        return self._compute()
+
+    def __replace(self, value: float) -> np.ndarray:
+        self._window[(self._pos - 1) % self._window_size()] = value
+        self._restore(self.__snapshot)
+        self.__update(value)
+        return self._compute()
+
+    def __update(self, value: float) -> None:
+        self._update(value, self.__evicted, self._count > self._lengths)
+        if self.recompute and self._count % self._window_size() == 0:
+            self._recompute()
+
+    def _view_kwargs(self, length: int) -> Dict:
+        return {'length': length}
+
+    def get_series(self, length: int) -> DataSeries:
+        """
+        :return: DataSeries of the output of one length, registered under the id of the single-length indicator
+        """
+        idx = self.lengths.index(int(length))
+        if idx not in self.__views:
+            inst_data_mgr = self.app_context.inst_data_mgr
+            series_id = build_series_id(self.view_cls_name, inputs=self.first_input.name,
+                                        input_keys=self.first_input_keys, **self._view_kwargs(self.lengths[idx]))
+            if inst_data_mgr.has_series(series_id):
+                raise AssertionError("Series [%s] already exist" % series_id)
+            view = inst_data_mgr.get_series(series_id)
+            key = self.time_series.keys[idx]
+            if self.size() > 0:
+                view.extend(timestamps=self.get_timestamp(), columns={Indicator.VALUE: self.get_by_idx(slice(None), key)})
+            self.__views[idx] = view
+        return self.__views[idx]
+
+    def now_values(self) -> np.ndarray:
+        """
+        :return: latest output of all the lengths, in order
+        """
+        return np.array([self.now(key) for key in self.time_series.keys], dtype=np.float64)
+
+
+class SweepSMA(SweepIndicator):
+    """
+    SMA of each length, NaN while a NaN is in its window
+    """
+    view_cls_name = 'SMA'
+    recompute = True
+
+    __slots__ = (
+        '__sum',
+        '__nan_count',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Sweep Simple Moving Average",
+                 lengths=None):
+        super(SweepSMA, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       lengths=lengths)
+
+    def _create_kernels(self):
+        super(SweepSMA, self)._create_kernels()
+        self.__sum = np.zeros(len(self.lengths))
+        self.__nan_count = np.zeros(len(self.lengths), dtype=np.int64)
+
+    def _save(self):
+        return self.__sum.copy(), self.__nan_count.copy()
+
+    def _restore(self, state) -> None:
+        self.__sum, self.__nan_count = state[0].copy(), state[1].copy()
+
+    def _update(self, value: float, evicted: np.ndarray, leaving: np.ndarray) -> None:
+        if value == value:
+            self.__sum += value
+        else:
+            self.__nan_count += 1
+        self.__sum -= np.where(leaving, np.nan_to_num(evicted), 0.0)
+        self.__nan_count -= leaving & np.isnan(evicted)
+
+    def _recompute(self) -> None:
+        latest = self._latest_first()
+        ends = np.minimum(self._lengths, len(latest)) - 1
+        self.__sum = np.cumsum(np.nan_to_num(latest))[ends]
+        self.__nan_count = np.cumsum(np.isnan(latest))[ends]
+
+    def _compute(self) -> np.ndarray:
+        valid = (self._count >= self._lengths) & (self.__nan_count == 0)
+        return np.where(valid, np.round(self.__sum / self._lengths, 8), np.nan)
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = np.asarray(arrays[self._get_first_input_key()], dtype=np.float64)
+        result = np.empty((len(self.lengths), len(values)))
+        lengths = self._lengths[:, None]
+        for start, end, sums, nan_counts in iter_window_sums(values, self._lengths):
+            sums /= lengths
+            sums[(nan_counts > 0) | (np.arange(start + 1, end + 1) < lengths)] = np.nan
+            result[:, start:end] = sums
+        np.round(result, 8, out=result)
+        return dict(zip(self.time_series.keys, result))
+
+
+class SweepVAR(SweepIndicator):
+    """
+    variance of each length, NaN values are skipped. The ddof config picks the variant, 0 (default) for the
+    population variance, 1 for the sample variance. Sums of the values less a recent one. Only the streaming
+    path is shared, the history is computed for each length like VAR: differences of prefix sums of squares
+    lose too much precision on short windows
+    """
+    view_cls_name = 'VAR'
+    recompute = True
+
+    __slots__ = (
+        'ddof',
+        '__shift',
+        '__valid',
+        '__s1',
+        '__s2',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Sweep Variance", lengths=None,
+                 **kwargs):
+        super(SweepVAR, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       lengths=lengths, **kwargs)
+        self.ddof = self.get_int_config("ddof", 0)
+
+    def _view_kwargs(self, length: int) -> Dict:
+        kwargs = super(SweepVAR, self)._view_kwargs(length)
+        if self.ddof:
+            kwargs['ddof'] = self.ddof
+        return kwargs
+
+    def _create_kernels(self):
+        super(SweepVAR, self)._create_kernels()
+        self.__shift = None
+        self.__valid = np.zeros(len(self.lengths), dtype=np.int64)
+        self.__s1 = np.zeros(len(self.lengths))
+        self.__s2 = np.zeros(len(self.lengths))
+
+    def _save(self):
+        return self.__shift, self.__valid.copy(), self.__s1.copy(), self.__s2.copy()
+
+    def _restore(self, state) -> None:
+        self.__shift, self.__valid, self.__s1, self.__s2 = state[0], state[1].copy(), state[2].copy(), state[3].copy()
+
+    def _update(self, value: float, evicted: np.ndarray, leaving: np.ndarray) -> None:
+        if value == value:
+            if self.__shift is None:
+                self.__shift = value
+            delta = value - self.__shift
+            self.__s1 += delta
+            self.__s2 += delta * delta
+            self.__valid += 1
+        gone = leaving & ~np.isnan(evicted)
+        if gone.any():
+            delta = np.where(gone, evicted - self.__shift, 0.0)
+            self.__s1 -= delta
+            self.__s2 -= delta * delta
+            self.__valid -= gone
+
+    def _recompute(self) -> None:
+        latest = self._latest_first()
+        nans = np.isnan(latest)
+        valid = latest[~nans]
+        self.__shift = float(valid[0]) if len(valid) else None
+        delta = np.where(nans, 0.0, latest - (self.__shift if self.__shift is not None else 0.0))
+        ends = np.minimum(self._lengths, len(latest)) - 1
+        self.__s1 = np.cumsum(delta)[ends]
+        self.__s2 = np.cumsum(delta * delta)[ends]
+        self.__valid = np.cumsum(~nans)[ends]
+
+    def _compute(self) -> np.ndarray:
+        return self._get_value(self.__var(self.__s1, self.__s2, self.__valid, self._count >= self._lengths))
+
+    def __var(self, s1, s2, valid, full) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var = np.maximum(s2 - s1 * s1 / valid, 0.0) / (valid - self.ddof)
+        return np.where(full & (valid > self.ddof), var, np.nan)
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = arrays[self._get_first_input_key()]
+        result = {}
+        with warnings.catch_warnings():
+            # windows with fewer than ddof + 1 values are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            for key, length in zip(self.time_series.keys, self.lengths):
+                var = batch_rolling(values, length, lambda windows: np.nanvar(windows, axis=1, ddof=self.ddof))
+                result[key] = self._get_value(var)
+        return result
+
+    def _get_value(self, var: np.ndarray) -> np.ndarray:
+        return var
+
+
+class SweepSTD(SweepVAR):
+    """
+    standard deviation of each length, NaN values are skipped. The ddof config picks the variant
+    """
+    view_cls_name = 'STD'
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Sweep Standard Deviation", lengths=None,
+                 **kwargs):
+        super(SweepSTD, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       lengths=lengths, **kwargs)
+
+    def _get_value(self, var: np.ndarray) -> np.ndarray:
+        return np.sqrt(var)
+
+
+class SweepEMA(SweepIndicator):
+    """
+    exponentially weighted mean with a span of each length, the adjusted form of RollingApply(kernel=ewm):
+    one recursion over (lengths) arrays, NaN until length values. NaN values are skipped but still age the weights.
+    The history is one lfilter per length, the state is seeded from its last row
+    """
+    view_cls_name = 'RollingApply'
+
+    __slots__ = (
+        '__decay',
+        '__numerator',
+        '__denominator',
+    )
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Sweep Exponential Moving Average",
+                 lengths=None):
+        super(SweepEMA, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc,
+                                       lengths=lengths)
+
+    def _window_size(self) -> int:
+        # the recursion needs no window
+        return 1
+
+    def _view_kwargs(self, length: int) -> Dict:
+        return {'length': length, 'kernel': 'ewm'}
+
+    def _create_kernels(self):
+        super(SweepEMA, self)._create_kernels()
+        self.__decay = 1.0 - 2.0 / (self._lengths + 1)
+        self.__numerator = np.zeros(len(self.lengths))
+        self.__denominator = np.zeros(len(self.lengths))
+
+    def _save(self):
+        return self.__numerator.copy(), self.__denominator.copy()
+
+    def _restore(self, state) -> None:
+        self.__numerator, self.__denominator = state[0].copy(), state[1].copy()
+
+    def _update(self, value: float, evicted: np.ndarray, leaving: np.ndarray) -> None:
+        self.__numerator *= self.__decay
+        self.__denominator *= self.__decay
+        if value == value:
+            self.__numerator += value
+            self.__denominator += 1.0
+
+    def _compute(self) -> np.ndarray:
+        return self.__mean(self.__numerator, self.__denominator, self._count >= self._lengths)
+
+    def __mean(self, numerator, denominator, full) -> np.ndarray:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = numerator / denominator
+        return np.where(full & (denominator > 0), mean, np.nan)
+
+    def __batch_sums(self, values: np.ndarray):
+        """
+        :return: numerator and denominator of each length after each of the values, lfilter does the very same
+        operations as _update
+        """
+        valid = ~np.isnan(values)
+        weighted = np.where(valid, values, 0.0)
+        weights = valid.astype(np.float64)
+        for decay in self.__decay:
+            yield (lfilter([1.0], [1.0, -decay], weighted), lfilter([1.0], [1.0, -decay], weights))
+
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        values = np.asarray(arrays[self._get_first_input_key()], dtype=np.float64)
+        full = np.arange(1, len(values) + 1) >= self._lengths[:, None]
+        return {key: self.__mean(numerator, denominator, full[idx])
+                for idx, (key, (numerator, denominator)) in
+                enumerate(zip(self.time_series.keys, self.__batch_sums(values)))}
+
+    def _get_batch_states(self, values: np.ndarray):
+        sums = list(self.__batch_sums(values))
+        if len(values) > 1:
+            before = (np.array([numerator[-2] for numerator, _ in sums]),
+                      np.array([denominator[-2] for _, denominator in sums]))
+        else:
+            before = (np.zeros(len(self.lengths)), np.zeros(len(self.lengths)))
+        return before, (np.array([numerator[-1] for numerator, _ in sums]),
+                        np.array([denominator[-1] for _, denominator in sums]))
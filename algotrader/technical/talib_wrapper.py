@@ -1,112 +1,143 @@
-import numpy as np
-import talib
-from typing import Dict
-
-from algotrader.technical import Indicator
-
-
-def ds_to_high_numpy(ds, idx):
-    for k in ds.keys:
-        if k.lower() == 'high':
-            return np.array(ds.get_by_idx(keys=k, idx=idx))
-    return None
-
+"""
+Indicators wrapping the TA-Lib functions, one class per function named after it (SMA, EMA, BBANDS, ATR...),
+generated from TA-Lib's function metadata.
 
-def ds_to_low_numpy(ds, idx):
-    for k in ds.keys:
-        if k.lower() == 'low':
-            return np.array(ds.get_by_idx(keys=k, idx=idx))
-    return None
+    SMA(inputs=bar, input_keys='close', length=10)
+    BBANDS(inputs=bar, input_keys='close', length=20, nbdevup=2.0)
+    ATR(inputs=bar, length=14)
 
+The timeperiod parameter is named length like in the other indicators, the others keep their TA-Lib names.
+Price inputs are taken from input_keys in order, the remaining ones from the input keys matching the TA-Lib
+input names (open, high, low, close, volume). Indicators with one output write it to 'value', the others
+write each output under its TA-Lib name.
+"""
+from collections import OrderedDict
 
-def ds_to_open_list(ds, idx):
-    for k in ds.keys:
-        if k.lower() == 'open':
-            return np.array(ds.get_by_idx(keys=k, idx=idx))
-    return None
-
-
-def ds_to_close_numpy(ds, idx):
-    for k in ds.keys:
-        if k.lower() == 'close':
-            return np.array(ds.get_by_idx(keys=k, idx=idx))
-    return None
+import numpy as np
+import talib
+from talib import abstract, stream
+from typing import Dict, List
 
+from algotrader.technical import Indicator
 
-def ds_to_volume_numpy(ds, idx):
-    for k in ds.keys:
-        if k.lower() == 'volume':
-            return np.array(ds.get_by_idx(keys=k, idx=idx))
-    return None
 
+class TALibIndicator(Indicator):
+    """
+    History is computed in one call of the TA-Lib function (compute_batch). Updates go through the TA-Lib
+    stream object of the function, opened from the input history once it is longer than the TA-Lib lookback,
+    which then takes each bar in O(1) and gives the same values as the function over the whole history.
+    The latest bar is evaluated with stream.peek, so it can be updated in place.
+    """
+    func_name = None
 
-def call_talib_with_hlcv(ds, count, talib_func, *args, **kwargs):
-    idx = slice(-count, None, None)
-    high = ds_to_high_numpy(ds, idx)
-    low = ds_to_low_numpy(ds, idx)
-    close = ds_to_close_numpy(ds, idx)
-    volume = ds_to_volume_numpy(ds, idx)
+    __slots__ = (
+        'params',
+        'lookback',
+        '__output_keys',
+        '__talib_input_keys',
+        '__stream',
+        '__stream_end',
+    )
 
-    if high is None or low is None or low is None or volume is None:
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc=None, **kwargs):
+        info = abstract.Function(self.func_name).info
+        output_keys = [Indicator.VALUE] if len(info['output_names']) == 1 else list(info['output_names'])
+        super(TALibIndicator, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys,
+                                             desc=desc if desc else "TALib %s" % info['display_name'],
+                                             keys=output_keys, default_output_key=output_keys[0], **kwargs)
+        self.__output_keys = output_keys
+        self.params = OrderedDict()
+        for name, default in info['parameters'].items():
+            value = self.get_config('length' if name == 'timeperiod' else name)
+            self.params[name] = type(default)(value) if value is not None else default
+
+    def _create_kernels(self):
+        function = abstract.Function(self.func_name)
+        function.set_parameters(self.params)
+        # number of leading bars without output, it includes the unstable period set with talib.set_unstable_period
+        self.lookback = function.lookback
+        self.__talib_input_keys = None
+        self.__stream = None
+        self.__stream_end = 0
+
+    def _get_talib_input_keys(self) -> List[str]:
+        """
+        :return: key of the first input for each input array of the TA-Lib function
+        """
+        if self.__talib_input_keys is None:
+            given = list(self.first_input_keys) if self.first_input_keys else []
+            keys = []
+            for name, columns in abstract.Function(self.func_name).info['input_names'].items():
+                if isinstance(columns, list):
+                    keys.extend(self.__match_key(column) or column for column in columns)
+                elif given:
+                    keys.append(given.pop(0))
+                else:
+                    keys.append(self.__match_key(columns) or self._get_first_input_key())
+            self.__talib_input_keys = keys
+        return self.__talib_input_keys
+
+    def __match_key(self, column: str) -> str:
+        for key in self.first_input.time_series.keys:
+            if key.lower() == column:
+                return key
         return None
 
-    return talib_func(high, low, close, volume, *args, **kwargs)
+    def _get_batch_keys(self, input) -> List[str]:
+        return self._get_talib_input_keys()
 
+    def compute_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        outputs = getattr(talib, self.func_name)(
+            *[np.asarray(arrays[key], dtype=np.float64) for key in self._get_talib_input_keys()], **self.params)
+        if not isinstance(outputs, tuple):
+            outputs = (outputs,)
+        return OrderedDict(zip(self.__output_keys, outputs))
 
-class SMA(Indicator):
-    __slots__ = (
-        'length'
-    )
-
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="TALib Simple Moving Average", length=0):
-        if time_series:
-            super(SMA, self).__init__(time_series=time_series)
-        else:
-            super(SMA, self).__init__(inputs=inputs, input_keys=input_keys, desc=desc, length=length)
-        self.length = self.get_int_config("length", 0)
+    def __get_window(self, end: int) -> List[np.ndarray]:
+        return [np.asarray(self.first_input.get_by_idx(slice(0, end), key), dtype=np.float64)
+                for key in self._get_talib_input_keys()]
 
     def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
-        if self.first_input.size() >= self.length:
-            value = talib.SMA(
-                np.array(
-                    self.first_input.get_by_idx(keys=self.first_input_keys,
-                                                idx=slice(-self.length, None, None))), timeperiod=self.length)
-
-            result[Indicator.VALUE] = value[-1]
+        pos = self.first_input.asof_index(timestamp)
+        if self.__stream is None and pos > self.lookback:
+            try:
+                self.__stream = getattr(stream, self.func_name)(*self.__get_window(pos), **self.params)
+                self.__stream_end = pos
+            except talib.InsufficientHistory:
+                # leading NaN bars do not count as history
+                pass
+
+        if self.__stream is not None:
+            # rows before the updated one are final, the stream takes them once
+            while self.__stream_end < pos:
+                self.__stream.update(*[self.first_input.get_by_idx(self.__stream_end, key)
+                                       for key in self._get_talib_input_keys()])
+                self.__stream_end += 1
+            missing_value = self.first_input.time_series.missing_value_replace
+            outputs = self.__stream.peek(*[float(data.get(key, missing_value))
+                                           for key in self._get_talib_input_keys()])
+        elif pos < self.lookback:
+            outputs = [np.nan] * len(self.__output_keys)
         else:
-            result[Indicator.VALUE] = np.nan
-
-        self.add(timestamp=timestamp, data=result)
+            outputs = [output[-1] for output in self.compute_batch(
+                dict(zip(self._get_talib_input_keys(), self.__get_window(pos + 1)))).values()]
 
+        if not isinstance(outputs, (tuple, list)):
+            outputs = (outputs,)
+        self.add(timestamp=timestamp, data=dict(zip(self.__output_keys, outputs)))
 
-class EMA(Indicator):
-    __slots__ = (
-        'length'
-    )
-
-    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="TALib Exponential Moving Average",
-                 length=0):
-        if time_series:
-            super(EMA, self).__init__(time_series=time_series)
-        else:
-            super(EMA, self).__init__(inputs=inputs, input_keys=input_keys, desc=desc, length=length)
-        self.length = self.get_int_config("length", 0)
-
-    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
-        result = {}
-        if self.first_input.size() >= self.length:
-            value = talib.EMA(
-                np.array(
-                    self.first_input.get_by_idx(keys=self.first_input_keys,
-                                                idx=slice(-self.length, None, None))), timeperiod=self.length)
-
-            result[Indicator.VALUE] = value[-1]
-        else:
-            result[Indicator.VALUE] = np.nan
 
-        self.add(timestamp=timestamp, data=result)
+def build_talib_indicator(func_name: str) -> type:
+    """
+    :return: TALibIndicator subclass wrapping the TA-Lib function func_name
+    """
+    info = abstract.Function(func_name).info
+    return type(func_name, (TALibIndicator,), {
+        '__module__': __name__,
+        '__doc__': "%s (TA-Lib %s)" % (info['display_name'], info['group']),
+        'func_name': func_name,
+    })
 
 
-single_ds_list = ["APO", "BBANDS", "CMO", "DEMA", "EMA", "HT_DCPERIOD", "HT_DCPHASE", "HT_PHASOR", "HT_SINE",
-                  "HT_TRENDLINE", "HT_TRENDMODE", "KAMA", "LINEARREG", "LINEARREG_ANGLE", "LINEARREG_INTERCEPT"]
+for _func_name in talib.get_functions():
+    globals()[_func_name] = build_talib_indicator(_func_name)
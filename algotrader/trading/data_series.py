@@ -1,33 +1,210 @@
 import datetime
+import numbers
+from collections import OrderedDict, namedtuple
 
 import numpy as np
 import pandas as pd
+from google.protobuf.json_format import MessageToDict, ParseDict
 from rx.subjects import Subject
 from typing import Dict
 
 from algotrader import Startable, Context
 from algotrader.model.model_factory import ModelFactory
-from algotrader.model.time_series_pb2 import TimeSeries
+from algotrader.model.time_series_pb2 import TimeSeries, TimeSeriesUpdateEvent
+from algotrader.trading.series_buffer import ColumnBuffer, MemmapColumnBuffer, RingColumnBuffer, read_only, \
+    to_py_value
+from algotrader.trading.window_stats import WindowStats
 from algotrader.utils.data_series import convert_to_list
 from algotrader.utils.model import add_to_list
 
 
+# columns of the time_series2 DataFrame message and the dtype they are loaded with
+FrameColumns = (
+    ('double_data', np.dtype(np.float64)),
+    ('int_data', np.dtype(np.int32)),
+    ('long_data', np.dtype(np.int64)),
+    ('bool_data', np.dtype(np.bool_)),
+    ('string_data', np.dtype(object)),
+)
+
+
+def get_frame_columns(frame, dtype: np.dtype):
+    """
+    map of the DataFrame message holding the columns of dtype
+    """
+    if dtype.kind == 'f':
+        return frame.double_data
+    if dtype.kind == 'b':
+        return frame.bool_data
+    if dtype.kind == 'i' and dtype.itemsize <= 4 or dtype.kind == 'u' and dtype.itemsize < 4:
+        return frame.int_data
+    if dtype.kind in 'iu':
+        return frame.long_data
+    return frame.string_data
+
+
+def encode_frame_values(values: np.ndarray):
+    """
+    :return: values as a list for the DataFrame message, None for object values other than strings
+    """
+    if values.dtype != object:
+        return values.tolist()
+    result = []
+    for value in values:
+        if isinstance(value, str):
+            result.append(value)
+        elif value is None or isinstance(value, float) and value != value:
+            result.append('')
+        else:
+            return None
+    return result
+
+
+class TimeSeriesRowEvent(namedtuple('TimeSeriesRowEvent', ['source', 'timestamp', 'data'])):
+    """
+    published on DataSeries.subject by add, data is the row as passed to add and must not be modified.
+    Subscribers in the process use it as is, to_proto() builds the TimeSeriesUpdateEvent for those sending it
+    to another process or persisting it
+    """
+    __slots__ = ()
+
+    def to_proto(self) -> TimeSeriesUpdateEvent:
+        # the protobuf event only carries numeric values
+        return ModelFactory.build_time_series_update_event(
+            source=self.source, timestamp=self.timestamp,
+            data={key: value for key, value in self.data.items() if isinstance(value, numbers.Number)})
+
+
+class TimeSeriesBatchUpdateEvent(object):
+    """
+    published on DataSeries.subject by extend, in place of one TimeSeriesRowEvent per appended row
+    """
+    __slots__ = (
+        'source',
+        'timestamps',
+        'data',
+    )
+
+    def __init__(self, source: str, timestamps: np.ndarray, data: Dict[str, np.ndarray]):
+        self.source = source
+        self.timestamps = timestamps
+        self.data = data
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def rows(self):
+        """
+        (timestamp, data) of each row, for subscribers without a bulk code path
+        """
+        for idx, timestamp in enumerate(self.timestamps.tolist()):
+            yield timestamp, {key: to_py_value(value[idx]) for key, value in self.data.items()}
+
+
 class DataSeries(Startable):
     TIMESTAMP = 'timestamp'
 
     def __init__(self, time_series: TimeSeries = None, series_id: str = None):
 
-        self.data_list = []
-        self.time_list = []
-        self.data_time_dict = {}
-        self.last_item = None
         self.subject = Subject()
         self.time_series = time_series if time_series else ModelFactory.build_time_series(series_id=series_id)
         self.name = self.time_series.series_id
+        self.evict_handler = None
+        self.buffer = self.__create_buffer()
+        self.start_time = self.time_series.start_time
+        self.end_time = self.time_series.end_time
+        if self.buffer.size:
+            self.start_time = self.start_time or int(self.buffer.timestamp_view()[0])
+            self.end_time = int(self.buffer.timestamp_view()[-1])
+        elif self.is_memmap():
+            # write the sidecar right away so the new series can be opened by id
+            self.flush()
+        # rows are only encoded into time_series.items by sync_time_series, __synced_time is the last encoded row
+        # and __synced_dirty flags that row as updated in place since
+        self.__synced_time = None
+        self.__synced_dirty = False
+        # trailing window aggregates keyed by (key, window), row_offset is the absolute row number of position 0
+        self.__window_stats = {}
+        self.__row_offset = 0
+        # DataFrames wrapping the buffer, keyed by the tuple of their keys, dropped whenever rows change
+        self.__frames = {}
+
+        if hasattr(time_series, 'frame') and time_series.frame.index:
+            frame = time_series.frame
+            columns = {}
+            for name, dtype in FrameColumns:
+                for key, column in getattr(frame, name).items():
+                    columns[key] = np.array(column.values, dtype=dtype)
+            self.extend(timestamps=np.array(frame.index, dtype=np.int64),
+                        columns=OrderedDict((key, columns[key]) for key in self.time_series.keys if key in columns))
+            # the rows now live in the buffer, they are encoded again on the next sync
+            time_series.ClearField('frame')
 
         if hasattr(time_series, 'items') and time_series.items:
+            self.buffer.reserve(len(time_series.items))
             for item in time_series.items:
                 self.add(timestamp=item.timestamp, data=dict(item.data), init=True)
+            del time_series.items[:]
+
+    def __create_buffer(self):
+        self.max_length = self.get_int_config("max_length", 0)
+        self.max_age = self.get_int_config("max_age", 0)
+        memmap_path = self.get_config("memmap_path")
+        if memmap_path:
+            buffer = MemmapColumnBuffer(memmap_path)
+        elif self.max_length > 0:
+            buffer = RingColumnBuffer(max_length=self.max_length)
+        else:
+            buffer = ColumnBuffer()
+        for key in self.time_series.keys:
+            buffer.add_key(key, self.__dtype(key))
+        return buffer
+
+    def __dtype(self, key: str, default=np.float64) -> np.dtype:
+        """
+        dtype declared for key in the dtypes config ("key:dtype,..."), else the one it was persisted with
+        """
+        dtypes = self.get_config("dtypes")
+        if dtypes:
+            for entry in dtypes.split(","):
+                name, dtype = entry.split(":")
+                if name == key:
+                    return np.dtype(dtype)
+        if hasattr(self.time_series, 'frame'):
+            for name, dtype in FrameColumns:
+                if key in getattr(self.time_series.frame, name):
+                    return dtype
+        return np.dtype(default)
+
+    def dtype(self, key: str) -> np.dtype:
+        return self.buffer.columns[key].dtype
+
+    def set_retention(self, max_length: int = 0, max_age: int = 0, persist_evicted: bool = False) -> None:
+        """
+        bound the rows kept in memory, rows beyond max_length or older than max_age (in the unit of the timestamps)
+        are dropped, persist_evicted asks the InstrumentDataManager to hand them to the DataStore first
+        :param max_length: capacity of the circular buffer backing the series, 0 means unbounded
+        :param max_age: retention time window, 0 means unbounded
+        :param persist_evicted:
+        """
+        if self.is_memmap():
+            raise ValueError("memory mapped series %s keeps all its rows in its files, retention is only supported "
+                             "for in memory series" % self.name)
+        self.time_series.configs["max_length"] = str(max_length)
+        self.time_series.configs["max_age"] = str(max_age)
+        self.time_series.configs["persist_evicted"] = str(persist_evicted)
+
+        old_buffer = self.buffer
+        self.buffer = self.__create_buffer()
+        self.__window_stats.clear()
+        self.__frames.clear()
+        for key in old_buffer.keys():
+            self.buffer.add_key(key, old_buffer.columns[key].dtype)
+        timestamps = old_buffer.timestamp_view()
+        for pos in range(max(0, old_buffer.size - self.max_length) if self.max_length else 0, old_buffer.size):
+            self.buffer.append(timestamps[pos], {key: old_buffer.get(pos, key) for key in old_buffer.keys()})
+        if self.size() and self.max_age > 0:
+            self.__evict(self.time_slice(None, self.current_time() - self.max_age).stop)
 
     def get_config(self, key, default_value=None):
         if hasattr(self.time_series, 'configs') and self.time_series.configs and key in self.time_series.configs:
@@ -63,69 +240,210 @@ class DataSeries(Startable):
 
         if not self.time_series.keys:
             add_to_list(self.time_series.keys, list(data.keys()))
+            for key in self.time_series.keys:
+                self.buffer.add_key(key, self.__dtype(key))
 
-        if not self.time_series.start_time:
-            self.time_series.start_time = timestamp
-
-        enhanced_data = {}
-        if not self.time_series.end_time \
-                or timestamp > self.time_series.end_time \
-                or len(self.data_list) == 0:
-
-            self.time_list.append(timestamp)
-
-            for key in list(self.time_series.keys):
-                value = data.get(key, self.time_series.missing_value_replace)
-                if key not in self.data_time_dict:
-                    self.data_time_dict[key] = {}
-                self.data_time_dict[key][timestamp] = value
-                enhanced_data[key] = value
-
-            if not init:
-                self.last_item = ModelFactory.add_time_series_item(self.time_series, timestamp, enhanced_data)
+        if not self.start_time:
+            self.start_time = timestamp
 
-        elif timestamp == self.time_series.end_time:
+        if self.buffer.size == 0 or timestamp > self.end_time:
+            if self.buffer.is_full():
+                self.__evict(1, init)
+            self.buffer.append(timestamp, data, self.time_series.missing_value_replace)
 
-            enhanced_data = self.data_list.pop()
-            for key in list(self.time_series.keys):
+        elif timestamp == self.end_time:
+            pos = self.buffer.size - 1
+            for key in self.buffer.columns:
                 if key in data:
-                    value = data.get(key)
-                    if key not in self.data_time_dict:
-                        self.data_time_dict[key] = {}
-                    self.data_time_dict[key][timestamp] = value
-                    enhanced_data[key] = value
-            if not init:
-                ModelFactory.update_time_series_item(self.last_item, timestamp, enhanced_data)
+                    self.buffer.set(pos, key, data[key])
+            if timestamp == self.__synced_time:
+                self.__synced_dirty = True
+            self.__window_stats.clear()
         else:
             raise AssertionError(
                 "Time for new Item %s cannot be earlier then previous item %s" % (timestamp, self.current_time()))
 
-        self.time_series.end_time = timestamp
-        self.data_list.append(enhanced_data)
-        self.subject.on_next(
-            ModelFactory.build_time_series_update_event(source=self.name, timestamp=timestamp, data=data))
+        self.end_time = timestamp
+        self.__frames.clear()
+        if self.max_age > 0:
+            self.__evict(self.time_slice(None, timestamp - self.max_age).stop, init)
+        if self.subject.observers:
+            self.subject.on_next(TimeSeriesRowEvent(self.name, timestamp, data))
+
+    def extend(self, timestamps=None, columns=None) -> None:
+        """
+        append a batch of rows in one vectorized step, subscribers get a single TimeSeriesBatchUpdateEvent
+        :param timestamps: strictly increasing, later than current_time(). Defaults to the index when columns is
+        a DataFrame, a DatetimeIndex is converted to unix millis
+        :param columns: dict of key to array like, or a pandas DataFrame
+        """
+        if isinstance(columns, pd.DataFrame):
+            if timestamps is None:
+                timestamps = columns.index.values
+                if timestamps.dtype.kind == 'M':
+                    timestamps = timestamps.astype('datetime64[ms]')
+            columns = {key: columns[key].values for key in columns.columns}
+        timestamps = np.asarray(timestamps).astype(np.int64)
+        columns = {key: np.asarray(value) for key, value in columns.items()}
+        if len(timestamps) == 0:
+            return
+        for key, value in columns.items():
+            if len(value) != len(timestamps):
+                raise AssertionError("Column %s has %s items, expected %s" % (key, len(value), len(timestamps)))
+        if np.any(np.diff(timestamps) <= 0) or (self.size() > 0 and timestamps[0] <= self.end_time):
+            raise AssertionError(
+                "Time for new Items cannot be unordered or earlier then previous item %s" % self.current_time())
+
+        if not self.time_series.keys:
+            add_to_list(self.time_series.keys, list(columns.keys()))
+            for key in self.time_series.keys:
+                # without a declared dtype numeric columns keep the dtype they are given with
+                dtype = columns[key].dtype
+                self.buffer.add_key(key, self.__dtype(key, dtype if dtype.kind in 'biuf' else np.float64))
+
+        if not self.start_time:
+            self.start_time = int(timestamps[0])
+
+        missing_value = self.time_series.missing_value_replace
+        values = {key: columns[key] for key in self.buffer.columns if key in columns}
+
+        if self.max_length:
+            overflow = self.size() + len(timestamps) - self.max_length
+            skipped = overflow - self.size()
+            self.__evict(min(overflow, self.size()))
+            if skipped > 0 and self.evict_handler:
+                # leading rows of the batch which never make it into the buffer
+                self.evict_handler(self, [ModelFactory.build_time_series_item(
+                    int(timestamps[pos]), {key: to_py_value(value[pos]) for key, value in values.items()})
+                    for pos in range(skipped)])
+                self.__row_offset += skipped
+        self.buffer.extend(timestamps, values, missing_value)
+
+        self.end_time = int(timestamps[-1])
+        self.__frames.clear()
+        if self.max_age > 0:
+            self.__evict(self.time_slice(None, self.end_time - self.max_age).stop)
+        if self.subject.observers:
+            self.subject.on_next(TimeSeriesBatchUpdateEvent(source=self.name, timestamps=timestamps, data=columns))
+
+    def __evict(self, count: int, init: bool = False) -> None:
+        if count <= 0:
+            return
+        if self.evict_handler and not init:
+            timestamps = self.buffer.timestamp_view()
+            self.evict_handler(self, [ModelFactory.build_time_series_item(int(timestamps[pos]), self.get_row(pos))
+                                      for pos in range(count)])
+        self.__row_offset += min(count, self.size())
+        self.buffer.drop_front(count)
+
+    @classmethod
+    def open_memmap(cls, path: str):
+        """
+        open a series stored on disk by a memory mapped DataSeries, no row is read until accessed
+        """
+        meta = MemmapColumnBuffer.read_meta(path)
+        if not meta:
+            raise AssertionError("no memory mapped series in %s" % path)
+        time_series = ParseDict(meta['time_series'], TimeSeries())
+        time_series.configs["memmap_path"] = path
+        return cls(time_series=time_series)
+
+    def is_memmap(self) -> bool:
+        return isinstance(self.buffer, MemmapColumnBuffer)
+
+    def flush(self) -> None:
+        """
+        write the pages and the metadata of a memory mapped series to disk, no-op for in memory series
+        """
+        if self.is_memmap():
+            self.time_series.start_time = self.start_time
+            self.time_series.end_time = self.end_time
+            self.buffer.flush({'time_series': MessageToDict(self.time_series)})
+
+    def sync_time_series(self) -> TimeSeries:
+        """
+        bring the protobuf time_series up to date with the buffer before it is persisted. The rows are
+        encoded column by column into time_series.frame with their dtype, only rows appended (or the last
+        row updated) since the previous sync are encoded. Object columns are persisted when they hold strings.
+        The rows of a memory mapped series stay in its files, only the metadata is returned
+        :return: the synced time_series
+        """
+        time_series = self.time_series
+        time_series.start_time = self.start_time
+        time_series.end_time = self.end_time
+        if self.is_memmap():
+            self.flush()
+            return time_series
+
+        frame = time_series.frame
+        frame.id = self.name
+        synced = self.asof_index(self.__synced_time) + 1 if self.__synced_time is not None else 0
+        # rows evicted since the last sync
+        evicted = len(frame.index) - synced
+        if evicted > 0:
+            del frame.index[:evicted]
+            for name, dtype in FrameColumns:
+                for column in getattr(frame, name).values():
+                    del column.values[:evicted]
+
+        frame.index.extend(self.buffer.timestamp_view()[synced:].tolist())
+        for key in self.buffer.keys():
+            view = self.buffer.column_view(key)
+            columns = get_frame_columns(frame, view.dtype)
+            begin = synced
+            if key not in columns:
+                # new column, or its dtype was promoted since the last sync
+                for name, dtype in FrameColumns:
+                    if key in getattr(frame, name):
+                        del getattr(frame, name)[key]
+                begin = 0
+            values = encode_frame_values(view[begin:])
+            if values is None:
+                if key in columns:
+                    del columns[key]
+                continue
+            if begin and self.__synced_dirty:
+                columns[key].values[begin - 1] = encode_frame_values(view[begin - 1:begin])[0]
+            columns[key].values.extend(values)
+
+        self.__synced_time = self.end_time if self.size() else None
+        self.__synced_dirty = False
+        return time_series
 
     def current_time(self):
-        return self.time_series.end_time
+        return self.end_time
 
     def get_data_dict(self, keys=None):
         keys = self._get_key(keys, list(self.time_series.keys))
+        timestamps = self.buffer.timestamp_view().tolist()
         result = {}
         for key in keys:
-            if key in self.data_time_dict:
-                result[key] = self.data_time_dict[key]
+            if self.buffer.has_key(key):
+                result[key] = dict(zip(timestamps, self.__column_values(key)))
         return result if len(keys) > 1 else result[keys[0]]
 
     def get_data(self):
-        return self.data_list
+        keys = self.buffer.keys()
+        columns = [self.__column_values(key) for key in keys]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
 
     def get_timestamp(self):
-        return self.time_list
+        """
+        read only view of the timestamps, see get_by_idx
+        """
+        return read_only(self.buffer.timestamp_view())
 
     def get_data_frame(self, keys=None):
-        df = pd.DataFrame(self.data_list, index=self.time_list)
-        if keys:
-            return df[self._get_key(keys, list(self.time_series.keys))]
+        """
+        DataFrame over read only views of the buffer, no data is copied. It is cached until rows are added,
+        copy() it before modifying
+        """
+        keys = self._get_key(keys, self.buffer.keys())
+        df = self.__frames.get(tuple(keys))
+        if df is None:
+            df = pd.DataFrame({key: read_only(self.buffer.column_view(key)) for key in keys},
+                              index=pd.Index(read_only(self.get_timestamp()), copy=False), columns=keys, copy=False)
+            self.__frames[tuple(keys)] = df
         return df
 
     def get_series(self, keys):
@@ -137,7 +455,7 @@ class DataSeries(Startable):
         return result if len(keys) > 1 else result[keys[0]]
 
     def size(self):
-        return len(self.time_list)
+        return self.buffer.size
 
     def now(self, keys=None):
         return self.get_by_idx(-1, keys)
@@ -146,67 +464,145 @@ class DataSeries(Startable):
         keys = keys if keys else default_keys
         return convert_to_list(keys)
 
+    def __column_values(self, key):
+        return [to_py_value(value) for value in self.buffer.column_view(key)] \
+            if self.buffer.columns[key].dtype == object \
+            else [np.nan if value != value else value for value in self.buffer.column_view(key).tolist()]
+
+    def __column_slice(self, key, idx):
+        if self.buffer.has_key(key):
+            return read_only(self.buffer.column_view(key)[idx])
+        return np.full(len(range(*idx.indices(self.size()))), self.time_series.missing_value_replace)
 
     def get_by_idx(self, idx, keys=None):
-        if (isinstance(idx, int) and (idx >= self.size() or idx < -self.size())) or idx == None:
+        """
+        :param idx: position or slice of positions
+        :return: values of the keys, a slice gives read only views of the buffer instead of copies: they follow
+        later updates of the rows they cover, and with a retention those rows are overwritten once evicted.
+        copy() them to keep the values
+        """
+        if idx is None or (isinstance(idx, numbers.Integral) and (idx >= self.size() or idx < -self.size())):
             return self.time_series.missing_value_replace
         keys = self._get_key(keys, list(self.time_series.keys))
         result = {}
         for key in keys:
-            if isinstance(idx, int):
-                result[key] = self.data_list[idx].get(key, self.time_series.missing_value_replace)
+            if isinstance(idx, numbers.Integral):
+                pos = idx if idx >= 0 else self.size() + idx
+                result[key] = to_py_value(self.buffer.get(pos, key)) if self.buffer.has_key(key) \
+                    else self.time_series.missing_value_replace
             elif isinstance(idx, slice):
-                result[key] = [data.get(key, self.time_series.missing_value_replace) for data in self.data_list[idx]]
+                result[key] = self.__column_slice(key, idx)
             else:
                 raise AssertionError("unknown index type %s" % (idx))
 
         return result if len(keys) > 1 else result[keys[0]]
 
+    def index_of(self, time) -> int:
+        """
+        :return: position of the row stamped exactly at time, -1 if there is none
+        """
+        timestamps = self.buffer.timestamp_view()
+        pos = int(np.searchsorted(timestamps, time, side='left'))
+        if pos < len(timestamps) and timestamps[pos] == time:
+            return pos
+        return -1
+
+    def asof_index(self, time) -> int:
+        """
+        :return: position of the last row stamped at or before time, -1 if time is before the first row
+        """
+        return int(np.searchsorted(self.buffer.timestamp_view(), time, side='right')) - 1
+
+    def time_slice(self, from_time=None, to_time=None) -> slice:
+        """
+        :return: index slice covering rows with from_time <= timestamp < to_time
+        """
+        timestamps = self.buffer.timestamp_view()
+        start = int(np.searchsorted(timestamps, from_time, side='left')) if from_time is not None else 0
+        end = int(np.searchsorted(timestamps, to_time, side='left')) if to_time is not None else len(timestamps)
+        return slice(start, end)
+
+    def get_row(self, idx, keys=None) -> Dict[str, float]:
+        keys = self._get_key(keys, self.buffer.keys())
+        pos = idx if idx >= 0 else self.size() + idx
+        result = {}
+        for key in keys:
+            if self.buffer.has_key(key):
+                result[key] = to_py_value(self.buffer.get(pos, key))
+            else:
+                result[key] = self.time_series.missing_value_replace
+        return result
+
     def get_by_time(self, time, keys=None):
         keys = self._get_key(keys, list(self.time_series.keys))
+        pos = self.index_of(time)
+        if pos < 0:
+            raise KeyError(time)
         result = {}
         for key in keys:
-            if key in self.data_time_dict:
-                result[key] = self.data_time_dict[key][time]
+            if self.buffer.has_key(key):
+                result[key] = to_py_value(self.buffer.get(pos, key))
 
         return result if len(keys) > 1 else result[keys[0]]
 
+    def get_asof(self, time, keys=None):
+        pos = self.asof_index(time)
+        if pos < 0:
+            return self.time_series.missing_value_replace
+        return self.get_by_idx(pos, keys)
+
+    def get_range(self, from_time=None, to_time=None, keys=None):
+        return self.get_by_idx(self.time_slice(from_time, to_time), keys)
+
+    def get_timestamp_range(self, from_time=None, to_time=None):
+        return read_only(self.buffer.timestamp_view()[self.time_slice(from_time, to_time)])
+
     def ago(self, idx=1, keys=None):
         assert idx >= 0
         return self.get_by_idx(-1 - idx, keys)
 
     def std(self, start=None, end=None, keys=None):
-        return self.__call_np(keys, start, end, np.nanstd)
+        return self.__call_np(keys, start, end, np.nanstd, WindowStats.get_std)
 
     def var(self, start=None, end=None, keys=None):
-        return self.__call_np(keys, start, end, np.nanvar)
+        return self.__call_np(keys, start, end, np.nanvar, WindowStats.get_var)
 
     def mean(self, start=None, end=None, keys=None):
-        return self.__call_np(keys, start, end, np.nanmean)
+        return self.__call_np(keys, start, end, np.nanmean, WindowStats.get_mean)
 
     def max(self, start=None, end=None, keys=None):
-        return self.__call_np(keys, start, end, np.nanmax)
+        return self.__call_np(keys, start, end, np.nanmax, WindowStats.get_max)
 
     def min(self, start=None, end=None, keys=None):
-        return self.__call_np(keys, start, end, np.nanmin)
+        return self.__call_np(keys, start, end, np.nanmin, WindowStats.get_min)
 
     def median(self, start=None, end=None, keys=None):
         return self.__call_np(keys, start, end, np.nanmedian)
 
-    def __call_np(self, keys, start, end, np_func):
-
-        def f(idx, key):
-            data = self.get_by_idx(idx, key)
-            return np_func(data)
-
+    def __call_np(self, keys, start, end, np_func, window_func=None):
         idx = self.__create_slice(start, end)
 
         result = {}
         keys = self._get_key(keys, list(self.time_series.keys))
         for key in keys:
-            result[key] = f(idx, key)
+            stats = self.__get_window_stats(key, idx) if window_func else None
+            result[key] = window_func(stats) if stats else np_func(self.__column_slice(key, idx))
         return result if len(keys) > 1 else result[keys[0]]
 
+    def __get_window_stats(self, key, idx):
+        """
+        cached aggregates for a trailing window slice(-n, size()), None for any other slice
+        """
+        if not isinstance(idx.start, numbers.Integral) or idx.start >= 0 or -idx.start > self.size() \
+                or idx.stop != self.size() or idx.step is not None \
+                or not self.buffer.has_key(key) or self.buffer.columns[key].dtype == object:
+            return None
+        stats = self.__window_stats.get((key, -idx.start))
+        if stats is None:
+            stats = self.__window_stats[(key, -idx.start)] = WindowStats(-idx.start)
+        stats.update(self.buffer.column_view(key), self.__row_offset)
+        return stats
+
     def __create_slice(self, start=None, end=None):
         if not end:
             end = self.size()
@@ -230,8 +626,7 @@ class DataSeries(Startable):
         result = {}
         keys = self._get_key(keys, list(self.time_series.keys))
         for key in keys:
-            data = self.get_by_idx(idx, key)
-            result[key] = func(np.array(data), *argv, **kwargs)
+            result[key] = func(self.__column_slice(key, idx), *argv, **kwargs)
         return result if len(keys) > 1 else result[keys[0]]
 
     def __getitem__(self, pos):
@@ -0,0 +1,114 @@
+import heapq
+
+from typing import List
+
+from algotrader.trading.data_series import DataSeries
+from algotrader.utils.indicator import get_or_create_indicator
+from algotrader.utils.logging import logger
+
+
+class IndicatorGraph(object):
+    """
+    Compute graph of the started indicators, owned by the InstrumentDataManager. Nodes are keyed by series_id,
+    get_or_create returns the node already in the graph for an identical indicator.
+
+    The graph subscribes once to each series with dependent indicators. An update is not pushed to the
+    indicators as it comes, it is queued for each of them and the queue is drained in topological order:
+    an indicator only runs once every indicator it depends on has taken the update. Each node then computes
+    once per update and indicators reading several nodes fed by the same series (diamonds) see all of them at
+    the same timestamp.
+    """
+
+    def __init__(self, inst_data_mgr):
+        self.inst_data_mgr = inst_data_mgr
+        self.__nodes = {}
+        self.__ranks = {}
+        self.__children = {}
+        self.__subscriptions = {}
+        self.__pending = {}
+        self.__queue = []
+        self.__seq = 0
+        self.__draining = False
+
+    def add(self, indicator: DataSeries, dependencies: List[DataSeries]) -> DataSeries:
+        """
+        schedule indicator after its dependencies, which are its input series plus the indicators it reads
+        :return: the node registered under the series_id of indicator
+        """
+        node = self.__nodes.setdefault(indicator.id(), indicator)
+        if node is not indicator:
+            logger.warning("[%s] %s is computed twice, create it with get_or_create to share it" % (
+                self.__class__.__name__, indicator.id()))
+        rank = max([self.__ranks.get(dependency, 0) for dependency in dependencies] or [0]) + 1
+        self.__set_rank(indicator, rank)
+        for dependency in dependencies:
+            children = self.__children.setdefault(dependency, [])
+            if indicator not in children:
+                children.append(indicator)
+            self.__subscribe(dependency)
+        return node
+
+    def get_or_create(self, app_context, cls, inputs=None, input_keys=None, **kwargs) -> DataSeries:
+        """
+        :return: the started indicator with the series_id of cls(inputs, input_keys, **kwargs), created if there
+        is none yet
+        """
+        indicator = get_or_create_indicator(self.inst_data_mgr, cls, inputs=inputs, input_keys=input_keys, **kwargs)
+        indicator.start(app_context)
+        return indicator
+
+    def has_node(self, series_id: str) -> bool:
+        return series_id in self.__nodes
+
+    def get_node(self, series_id: str) -> DataSeries:
+        return self.__nodes[series_id]
+
+    def get_rank(self, series: DataSeries) -> int:
+        """
+        :return: depth of series in the graph, 0 for series which are no indicator of the graph
+        """
+        return self.__ranks.get(series, 0)
+
+    def __set_rank(self, series: DataSeries, rank: int) -> None:
+        # a dependency added after its dependents pushes them further down
+        if self.__ranks.get(series, 0) >= rank:
+            return
+        self.__ranks[series] = rank
+        for child in self.__children.get(series, []):
+            self.__set_rank(child, rank + 1)
+
+    def __subscribe(self, series: DataSeries) -> None:
+        if series not in self.__subscriptions:
+            self.__subscriptions[series] = series.subject.subscribe(
+                lambda event: self.__on_event(series, event))
+
+    def __on_event(self, series: DataSeries, event) -> None:
+        for child in self.__children[series]:
+            events = self.__pending.get(child)
+            if events is None:
+                self.__pending[child] = [event]
+                self.__seq += 1
+                heapq.heappush(self.__queue, (self.__ranks[child], self.__seq, child))
+            else:
+                events.append(event)
+        if not self.__draining:
+            self.__drain()
+
+    def __drain(self) -> None:
+        self.__draining = True
+        try:
+            while self.__queue:
+                _, _, indicator = heapq.heappop(self.__queue)
+                for event in self.__pending.pop(indicator):
+                    indicator.on_update(event)
+        except Exception:
+            self.__queue = []
+            self.__pending = {}
+            raise
+        finally:
+            self.__draining = False
+
+    def reset(self) -> None:
+        for subscription in self.__subscriptions.values():
+            subscription.dispose()
+        self.__init__(self.inst_data_mgr)
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 from algotrader import Manager, Context
@@ -5,6 +7,8 @@ from algotrader.model.model_factory import ModelFactory
 from algotrader.provider.datastore import PersistenceMode
 from algotrader.trading.data_series import DataSeries
 from algotrader.trading.event import MarketDataEventHandler
+from algotrader.trading.indicator_graph import IndicatorGraph
+from algotrader.trading.series_buffer import MemmapColumnBuffer
 from algotrader.utils.logging import logger
 from algotrader.utils.market_data import get_series_id
 from algotrader.utils.model import get_full_cls_name, get_cls
@@ -18,10 +22,19 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
         self.__series_dict = {}
         self.subscription = None
         self.store = None
+        self.series_max_length = 0
+        self.series_max_age = 0
+        self.persist_evicted_series = False
+        self.series_memmap_path = None
+        self.graph = IndicatorGraph(self)
 
     def _start(self, app_context: Context) -> None:
         self.store = app_context.get_data_store()
         self.persist_mode = app_context.config.get_app_config("persistenceMode")
+        self.series_max_length = app_context.config.get_app_config("seriesMaxLength", 0)
+        self.series_max_age = app_context.config.get_app_config("seriesMaxAge", 0)
+        self.persist_evicted_series = app_context.config.get_app_config("persistEvictedSeries", False)
+        self.series_memmap_path = app_context.config.get_app_config("seriesMemmapPath", None)
         self.load_all()
         self.subscription = app_context.event_bus.data_subject.subscribe(self.on_market_data_event)
 
@@ -41,6 +54,7 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
                     series = cls(time_series=series_state)
                 else:
                     series = DataSeries(time_series=series_state)
+                self.apply_retention(series)
                 self.__series_dict[series.id()] = series
 
             bars = self.store.load_all('bars')
@@ -56,6 +70,9 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
                 self.__quote_dict[get_series_id(quote)] = quote
 
     def save_all(self):
+        for series in self.__series_dict.values():
+            series.flush()
+
         if self.store:
             if self.persist_mode == PersistenceMode.Batch:
                 for bar in self.__bar_dict.values():
@@ -67,7 +84,25 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
 
             elif self.persist_mode != PersistenceMode.Disable:
                 for series in self.__series_dict.values():
-                    self.store.save_time_series(series.time_series)
+                    self.store.save_time_series(series.sync_time_series())
+
+    def apply_retention(self, series):
+        """
+        apply the application wide seriesMaxLength / seriesMaxAge retention to series without their own,
+        and hook up persistence of evicted rows
+        """
+        if series.is_memmap():
+            return
+        if (self.series_max_length or self.series_max_age) \
+                and not series.get_int_config("max_length", 0) and not series.get_int_config("max_age", 0):
+            series.set_retention(max_length=self.series_max_length, max_age=self.series_max_age,
+                                 persist_evicted=self.persist_evicted_series)
+        if series.get_bool_config("persist_evicted"):
+            series.evict_handler = self.__persist_evicted
+
+    def __persist_evicted(self, series, items):
+        if self.store and self.persist_mode != PersistenceMode.Disable:
+            self.store.save_time_series_items(series.id(), items)
 
     def _is_realtime_persist(self):
         return self.store and self.persist_mode == PersistenceMode.RealTime
@@ -130,20 +165,49 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
             return self.__bar_dict[inst_id].close
         return None
 
-    def get_series(self, key, create_if_missing=True, cls=DataSeries, desc=None, missing_value=np.nan):
+    def get_series(self, key, create_if_missing=True, cls=DataSeries, desc=None, missing_value=np.nan,
+                   memmap=False):
+        """
+        :param memmap: create the series as memory mapped files under seriesMemmapPath. Series already stored
+        there are always opened from disk, whatever the flag
+        """
         if type(key) == str:
             if key not in self.__series_dict:
-                self.__series_dict[key] = cls(
-                    time_series=ModelFactory.build_time_series(series_id=key, series_cls=get_full_cls_name(cls), desc=desc,
-                                                               missing_value_replace=missing_value))
+                memmap_path = os.path.join(self.series_memmap_path, key) if self.series_memmap_path else None
+                if memmap_path and MemmapColumnBuffer.read_meta(memmap_path):
+                    self.__series_dict[key] = self.__open_memmap(memmap_path, cls)
+                else:
+                    if memmap and not memmap_path:
+                        raise AssertionError("seriesMemmapPath is not configured")
+                    configs = {"memmap_path": memmap_path} if memmap else {}
+                    self.__series_dict[key] = cls(
+                        time_series=ModelFactory.build_time_series(series_id=key, series_cls=get_full_cls_name(cls),
+                                                                   desc=desc, missing_value_replace=missing_value,
+                                                                   **configs))
+                self.apply_retention(self.__series_dict[key])
             return self.__series_dict[key]
         raise AssertionError()
 
+    def __open_memmap(self, path, cls):
+        meta = MemmapColumnBuffer.read_meta(path)
+        series_cls = meta['time_series'].get('seriesCls')
+        return (get_cls(series_cls) if series_cls else cls).open_memmap(path)
+
+    def preload_series(self, key, timestamps=None, columns=None, cls=DataSeries):
+        """
+        warm up the series with history in one DataSeries.extend call
+        :param columns: dict of key to array like, or a pandas DataFrame
+        """
+        series = self.get_series(key, cls=cls)
+        series.extend(timestamps=timestamps, columns=columns)
+        return series
+
     def add_series(self, series, raise_if_duplicate=False):
         if series.name not in self.__series_dict:
+            self.apply_retention(series)
             self.__series_dict[series.name] = series
             if self._is_realtime_persist():
-                self.store.save_time_series(series.time_series)
+                self.store.save_time_series(series.sync_time_series())
         elif raise_if_duplicate and self.__series_dict[series.name] != series:
             raise AssertionError("Series [%s] already exist" % series.name)
 
@@ -155,6 +219,7 @@ class InstrumentDataManager(MarketDataEventHandler, Manager):
         self.__quote_dict = {}
         self.__trade_dict = {}
         self.__series_dict = {}
+        self.graph.reset()
 
     def id(self):
         return "InstrumentDataManager"
@@ -29,6 +29,9 @@ class Portfolio(HasPositions, Startable, HasId):
     def _start(self, app_context: Context) -> None:
         self.app_context.portf_mgr.add(self)
 
+        for analyzer in self.__analyzers:
+            self.app_context.inst_data_mgr.apply_retention(analyzer.series)
+
         self.event_subscription = app_context.event_bus.data_subject.subscribe(self.on_market_data_event)
 
         for order_req in self.app_context.order_mgr.get_portf_order_reqs(self.id()):
@@ -40,6 +43,14 @@ class Portfolio(HasPositions, Startable, HasId):
     def id(self) -> str:
         return self.__state.portf_id
 
+    def sync_state(self) -> PortfolioState:
+        """
+        encode the analyzer series rows not persisted yet into the state before it is saved
+        """
+        for analyzer in self.__analyzers:
+            analyzer.series.sync_time_series()
+        return self.__state
+
     # def on_bar(self, bar):
     #     super(Portfolio, self).on_bar(bar)
     #     self.__update_equity(bar.timestamp, bar.inst_id, bar.close)
@@ -111,8 +122,7 @@ class Portfolio(HasPositions, Startable, HasId):
         self.total_equity = self.__state.stock_value + self.__state.cash
 
     def get_return(self) -> float:
-        equity = self.performance.get_series("total_equity")
-        equity.name = 'equity'
+        equity = self.performance.get_series("total_equity").rename('equity')
         rets = equity.pct_change().dropna()
         # rets.index = rets.index.tz_localize("UTC")
         return rets
@@ -181,12 +191,12 @@ class PortfolioManager(SimpleManager):
     def save_all(self) -> None:
         if self.store and self.persist_mode != PersistenceMode.Disable:
             for portfolio in self.all_items():
-                self.store.save_portfolio(portfolio.state)
+                self.store.save_portfolio(portfolio.sync_state())
 
     def add(self, portfolio: Portfolio) -> None:
         super(PortfolioManager, self).add(portfolio)
         if self.store and self.persist_mode == PersistenceMode.RealTime:
-            self.store.save_portfolio(portfolio.state)
+            self.store.save_portfolio(portfolio.sync_state())
 
     def id(self) -> str:
         return "PortfolioManager"
@@ -0,0 +1,414 @@
+import json
+import numbers
+import os
+from collections import OrderedDict
+
+import numpy as np
+from typing import Dict, List
+
+
+def to_py_value(value):
+    """
+    convert a numpy scalar read from a column back into a plain python value,
+    NaN is always returned as the np.nan singleton so materialized rows compare equal to dicts holding np.nan
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return np.nan
+    return value
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def fill_value(dtype):
+    """
+    value of the unused slots of a column, also used for missing values in int and bool columns
+    """
+    kind = np.dtype(dtype).kind
+    if kind == 'f':
+        return np.nan
+    if kind == 'b':
+        return False
+    if kind in 'iu':
+        return 0
+    return None
+
+
+def new_column(capacity: int, dtype=np.float64) -> np.ndarray:
+    dtype = np.dtype(dtype)
+    if dtype == object:
+        return np.empty(capacity, dtype=object)
+    return np.full(capacity, fill_value(dtype), dtype=dtype)
+
+
+def promoted_dtype(dtype: np.dtype, value):
+    """
+    dtype a column has to be promoted to before value can be written into it, None when it fits as is
+    """
+    kind = dtype.kind
+    if kind == 'O' or isinstance(value, (bool, np.bool_)) and kind in 'biuf':
+        return None
+    if isinstance(value, numbers.Integral) and kind != 'b':
+        if kind == 'f':
+            return None
+        info = np.iinfo(dtype)
+        if info.min <= value <= info.max:
+            return None
+        info = np.iinfo(np.int64)
+        return np.dtype(np.int64) if info.min <= value <= info.max else np.dtype(np.float64)
+    if isinstance(value, numbers.Real):
+        return None if kind == 'f' else np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def promoted_array_dtype(dtype: np.dtype, values: np.ndarray):
+    """
+    same as promoted_dtype for a whole array of values
+    """
+    if dtype.kind == 'O' or np.can_cast(values.dtype, dtype, 'safe'):
+        return None
+    if values.dtype.kind not in 'biuf':
+        return np.dtype(object)
+    return np.result_type(dtype, values.dtype)
+
+
+class ColumnBuffer(object):
+    """
+    Columnar storage backing DataSeries: one int64 timestamp array plus one growable array per key.
+    Columns are float64 unless created with another dtype (int32, int64, bool, object for strings).
+    A column is promoted the first time a value it cannot hold is written into it: int or bool to float64
+    for fractional or NaN values, any numeric to object for non numeric values (e.g. a pipeline ndarray output).
+    Capacity grows by doubling so appends are amortized O(1), all views returned are zero-copy.
+    Logical position 0 is at physical index `start`, rows dropped from the front only move `start`.
+    """
+    InitialCapacity = 16
+
+    __slots__ = (
+        'size',
+        'start',
+        'capacity',
+        'timestamps',
+        'columns',
+    )
+
+    def __init__(self, keys: List[str] = None, capacity: int = 0):
+        self.size = 0
+        self.start = 0
+        self.capacity = 0
+        self.timestamps = np.empty(0, dtype=np.int64)
+        self.columns = OrderedDict()
+        if keys:
+            for key in keys:
+                self.add_key(key)
+        if capacity:
+            self.reserve(capacity)
+
+    def keys(self) -> List[str]:
+        return list(self.columns.keys())
+
+    def has_key(self, key: str) -> bool:
+        return key in self.columns
+
+    def add_key(self, key: str, dtype=np.float64) -> None:
+        if key not in self.columns:
+            self.columns[key] = new_column(len(self.timestamps), dtype)
+
+    def missing_value(self, key: str, missing_value=np.nan):
+        """
+        missing_value for float and object columns, the fill value of the dtype for int and bool ones
+        """
+        dtype = self.columns[key].dtype
+        return missing_value if dtype.kind in 'fO' else fill_value(dtype)
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity and self.start == 0:
+            return
+        capacity = max(capacity, self.size)
+        end = self.start + self.size
+        timestamps = np.zeros(capacity, dtype=np.int64)
+        timestamps[:self.size] = self.timestamps[self.start:end]
+        self.timestamps = timestamps
+        for key, column in self.columns.items():
+            resized = new_column(capacity, column.dtype)
+            resized[:self.size] = column[self.start:end]
+            self.columns[key] = resized
+        self.start = 0
+        self.capacity = capacity
+
+    def _ensure_capacity(self, required: int) -> None:
+        if self.start + required > self.capacity:
+            capacity = max(self.capacity, ColumnBuffer.InitialCapacity)
+            # when compacting rows dropped from the front keep at least half of the buffer free,
+            # so the copy is amortized over the appends that follow
+            while capacity < required or (self.start > 0 and capacity < 2 * required):
+                capacity *= 2
+            self.reserve(capacity)
+
+    def is_full(self) -> bool:
+        return False
+
+    def append(self, timestamp: int, values: Dict[str, float], missing_value=np.nan) -> int:
+        self._ensure_capacity(self.size + 1)
+        pos = self.size
+        self.timestamps[self.start + pos] = timestamp
+        for key in self.columns:
+            self.set(pos, key, values[key] if key in values else self.missing_value(key, missing_value))
+        self.size += 1
+        return pos
+
+    def extend(self, timestamps: np.ndarray, values: Dict[str, np.ndarray], missing_value=np.nan) -> None:
+        """
+        vectorized append of len(timestamps) rows, keys missing from values are filled with missing_value
+        """
+        count = len(timestamps)
+        self._ensure_capacity(self.size + count)
+        begin = self.start + self.size
+        self.timestamps[begin:begin + count] = timestamps
+        for key in self.columns:
+            self._set_range(begin, key, values.get(key), count, missing_value)
+        self.size += count
+
+    def _set_range(self, begin: int, key: str, values, count: int, missing_value=np.nan) -> None:
+        if values is None:
+            values = self.missing_value(key, missing_value)
+        values = np.asarray(values)
+        dtype = promoted_array_dtype(self.columns[key].dtype, values) if values.ndim \
+            else promoted_dtype(self.columns[key].dtype, values.item())
+        column = self._promote(key, dtype) if dtype is not None else self.columns[key]
+        column[begin:begin + count] = values
+
+    def drop_front(self, count: int) -> None:
+        count = min(count, self.size)
+        self.start += count
+        self.size -= count
+
+    def _promote(self, key: str, dtype) -> np.ndarray:
+        column = self.columns[key].astype(dtype)
+        self.columns[key] = column
+        return column
+
+    def _fit(self, key: str, value) -> np.ndarray:
+        column = self.columns[key]
+        dtype = promoted_dtype(column.dtype, value)
+        return column if dtype is None else self._promote(key, dtype)
+
+    def set(self, pos: int, key: str, value) -> None:
+        self._fit(key, value)[self.start + pos] = value
+
+    def get(self, pos: int, key: str):
+        return self.columns[key][self.start + pos]
+
+    def timestamp_view(self) -> np.ndarray:
+        return self.timestamps[self.start:self.start + self.size]
+
+    def column_view(self, key: str) -> np.ndarray:
+        return self.columns[key][self.start:self.start + self.size]
+
+
+class RingColumnBuffer(ColumnBuffer):
+    """
+    Fixed capacity circular ColumnBuffer used for bounded retention, appends never reallocate.
+    Every row is written twice, at slot i and i + capacity, so the retained tail is always one
+    contiguous [start, start + size) range of the 2 * capacity arrays and views stay zero-copy.
+    Appending to a full buffer drops the oldest row.
+    """
+
+    __slots__ = (
+        'max_length',
+    )
+
+    def __init__(self, keys: List[str] = None, max_length: int = 1):
+        assert max_length > 0
+        super(RingColumnBuffer, self).__init__()
+        self.max_length = max_length
+        self.capacity = max_length
+        self.start = max_length
+        self.timestamps = np.zeros(2 * max_length, dtype=np.int64)
+        if keys:
+            for key in keys:
+                self.add_key(key)
+
+    def reserve(self, capacity: int) -> None:
+        pass
+
+    def is_full(self) -> bool:
+        return self.size >= self.max_length
+
+    def __mirror(self, idx: int) -> int:
+        return idx - self.max_length if idx >= self.max_length else idx + self.max_length
+
+    def append(self, timestamp: int, values: Dict[str, float], missing_value=np.nan) -> int:
+        if self.is_full():
+            self.drop_front(1)
+        end = self.start + self.size
+        if end == 2 * self.max_length:
+            # the retained rows are mirrored in the lower half, continue from there
+            self.start -= self.max_length
+            end -= self.max_length
+        self.timestamps[end] = timestamp
+        self.timestamps[self.__mirror(end)] = timestamp
+        pos = self.size
+        self.size += 1
+        for key in self.columns:
+            self.set(pos, key, values[key] if key in values else self.missing_value(key, missing_value))
+        return pos
+
+    def extend(self, timestamps: np.ndarray, values: Dict[str, np.ndarray], missing_value=np.nan) -> None:
+        """
+        vectorized append, only the last max_length rows of the batch are written when it overflows the buffer
+        """
+        skip = max(0, len(timestamps) - self.max_length)
+        timestamps = timestamps[skip:]
+        values = {key: np.asarray(value)[skip:] for key, value in values.items()}
+        count = len(timestamps)
+        if self.size + count > self.max_length:
+            self.drop_front(self.size + count - self.max_length)
+        # rows are mirrored in both halves, so the batch is written into each half at the same ring offsets,
+        # split in two where it wraps around the end of the ring
+        offset = (self.start + self.size) % self.max_length
+        first = min(count, self.max_length - offset)
+        for begin, lo, hi in ((offset, 0, first), (0, first, count)):
+            if lo == hi:
+                continue
+            for half in (begin, begin + self.max_length):
+                self.timestamps[half:half + hi - lo] = timestamps[lo:hi]
+                for key in self.columns:
+                    value = values.get(key)
+                    self._set_range(half, key, value[lo:hi] if value is not None else None, hi - lo, missing_value)
+        self.start %= self.max_length
+        self.size += count
+
+    def set(self, pos: int, key: str, value) -> None:
+        column = self._fit(key, value)
+        idx = self.start + pos
+        column[idx] = value
+        column[self.__mirror(idx)] = value
+
+
+class MemmapColumnBuffer(ColumnBuffer):
+    """
+    ColumnBuffer whose arrays are np.memmap files in the directory `path`, one per column plus one for the
+    timestamps. Row count and column dtypes are kept in a json sidecar together with the TimeSeries metadata,
+    written by flush. Opening maps the files without reading them, the OS only loads the pages touched.
+    Appends write to the end of the files, which grow by doubling. Rows dropped from the front stay on disk.
+    Object columns (strings) have no fixed size layout and are rejected with a TypeError.
+    """
+    Sidecar = 'series.json'
+
+    __slots__ = (
+        'path',
+    )
+
+    def __init__(self, path: str, keys: List[str] = None):
+        super(MemmapColumnBuffer, self).__init__()
+        self.path = path
+        meta = MemmapColumnBuffer.read_meta(path)
+        if meta:
+            self.size = meta['size']
+            self.start = meta['start']
+            self.capacity = meta['capacity']
+            self.timestamps = self.__map('timestamp', np.int64, self.capacity)
+            for key, dtype in meta['columns'].items():
+                self.columns[key] = self.__map(key, dtype, self.capacity)
+        else:
+            os.makedirs(path, exist_ok=True)
+        if keys:
+            for key in keys:
+                self.add_key(key)
+
+    @staticmethod
+    def read_meta(path: str):
+        file = os.path.join(path, MemmapColumnBuffer.Sidecar)
+        if not os.path.exists(file):
+            return None
+        with open(file) as f:
+            return json.load(f)
+
+    def __file(self, name: str) -> str:
+        return os.path.join(self.path, '%s.bin' % name)
+
+    def __map(self, name: str, dtype, capacity: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        if not capacity:
+            return np.empty(0, dtype=dtype)
+        file = self.__file(name)
+        mapped = os.path.getsize(file) // dtype.itemsize if os.path.exists(file) else 0
+        if mapped < capacity:
+            with open(file, 'ab') as f:
+                f.truncate(capacity * dtype.itemsize)
+        array = np.memmap(file, dtype=dtype, mode='r+', shape=(capacity,))
+        if mapped < capacity and dtype.kind == 'f':
+            array[mapped:] = fill_value(dtype)
+        return array
+
+    def add_key(self, key: str, dtype=np.float64) -> None:
+        if key not in self.columns:
+            if np.dtype(dtype) == object:
+                raise TypeError("column %s of %s values cannot be memory mapped, only numeric and bool columns have a "
+                                "fixed size binary layout" % (key, np.dtype(dtype)))
+            if os.path.exists(self.__file(key)):
+                os.remove(self.__file(key))
+            self.columns[key] = self.__map(key, dtype, self.capacity)
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+        self.flush()
+        self.timestamps = self.__map('timestamp', np.int64, capacity)
+        for key, column in self.columns.items():
+            self.columns[key] = self.__map(key, column.dtype, capacity)
+        self.capacity = capacity
+
+    def _ensure_capacity(self, required: int) -> None:
+        # rows are never moved on disk, rows dropped from the front keep their slots
+        if self.start + required > self.capacity:
+            capacity = max(self.capacity, ColumnBuffer.InitialCapacity)
+            while capacity < self.start + required:
+                capacity *= 2
+            self.reserve(capacity)
+
+    def _promote(self, key: str, dtype) -> np.ndarray:
+        """
+        numeric promotions rewrite the column into a new file with the promoted dtype, which replaces the old one
+        """
+        dtype = np.dtype(dtype)
+        column = self.columns[key]
+        if dtype == object:
+            raise TypeError("memory mapped column %s of %s values cannot store non numeric values"
+                            % (key, column.dtype))
+        name = '%s.promoted' % key
+        if os.path.exists(self.__file(name)):
+            os.remove(self.__file(name))
+        promoted = self.__map(name, dtype, self.capacity)
+        end = self.start + self.size
+        promoted[:end] = column[:end]
+        if isinstance(promoted, np.memmap):
+            promoted.flush()
+            del promoted, column
+            self.columns[key] = None
+            os.replace(self.__file(name), self.__file(key))
+            promoted = self.__map(key, dtype, self.capacity)
+        self.columns[key] = promoted
+        return promoted
+
+    def flush(self, meta: Dict = None) -> None:
+        """
+        flush the mapped pages and, when meta is given, rewrite the sidecar
+        :param meta: extra entries for the sidecar, e.g. the TimeSeries metadata
+        """
+        for array in [self.timestamps] + list(self.columns.values()):
+            if isinstance(array, np.memmap):
+                array.flush()
+        if meta is not None:
+            sidecar = dict(meta)
+            sidecar.update(size=self.size, start=self.start, capacity=self.capacity,
+                           columns=OrderedDict((key, column.dtype.str) for key, column in self.columns.items()))
+            file = os.path.join(self.path, MemmapColumnBuffer.Sidecar)
+            with open(file + '.tmp', 'w') as f:
+                json.dump(sidecar, f)
+            os.replace(file + '.tmp', file)
@@ -0,0 +1,110 @@
+from collections import deque
+
+import numpy as np
+
+
+class WindowStats(object):
+    """
+    Sliding aggregates over the trailing `window` rows of one float DataSeries column, NaN rows are skipped
+    like the np.nan* functions do. Running count / mean / sum of squared deviations back mean, var and std,
+    monotonic deques of (row, value) back max and min.
+    Rows are identified by their absolute row number, so the stats keep working while the series evicts rows.
+    The sums are rebuilt from the column every `window` removals to stop rounding errors from accumulating.
+    """
+
+    __slots__ = (
+        'window',
+        'end',
+        'count',
+        'mean',
+        'm2',
+        'removed',
+        'max_deque',
+        'min_deque',
+    )
+
+    def __init__(self, window: int):
+        assert window > 0
+        self.window = window
+        self.end = None
+
+    def update(self, column: np.ndarray, row_offset: int) -> None:
+        """
+        catch up with the rows appended since the last update
+        :param column: the column view of the series
+        :param row_offset: absolute row number of column[0]
+        """
+        end = row_offset + len(column)
+        if self.end == end:
+            return
+        if self.end is None or end - self.end >= self.window or self.end - self.window < row_offset \
+                or self.removed >= self.window:
+            self.__rebuild(column[-self.window:], end)
+            return
+        for row in range(self.end, end):
+            self.__push(row, column[row - row_offset])
+            self.__pop(column[row - self.window - row_offset])
+        self.end = end
+
+    def __rebuild(self, values: np.ndarray, end: int) -> None:
+        valid = values[values == values]
+        self.count = len(valid)
+        self.mean = float(np.mean(valid)) if self.count else 0.0
+        self.m2 = float(np.sum((valid - self.mean) ** 2)) if self.count else 0.0
+        self.removed = 0
+        self.max_deque = deque()
+        self.min_deque = deque()
+        self.end = end - len(values)
+        for value in values.tolist():
+            self.__push_extremes(self.end, value)
+            self.end += 1
+
+    def __push(self, row: int, value: float) -> None:
+        if value == value:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+        self.__push_extremes(row, value)
+
+    def __push_extremes(self, row: int, value: float) -> None:
+        start = row - self.window + 1
+        for window_deque in (self.max_deque, self.min_deque):
+            while window_deque and window_deque[0][0] < start:
+                window_deque.popleft()
+        if value != value:
+            return
+        while self.max_deque and self.max_deque[-1][1] <= value:
+            self.max_deque.pop()
+        self.max_deque.append((row, value))
+        while self.min_deque and self.min_deque[-1][1] >= value:
+            self.min_deque.pop()
+        self.min_deque.append((row, value))
+
+    def __pop(self, value: float) -> None:
+        self.removed += 1
+        if value != value:
+            return
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+
+    def get_mean(self) -> float:
+        return self.mean if self.count else np.nan
+
+    def get_var(self) -> float:
+        return max(self.m2, 0.0) / self.count if self.count else np.nan
+
+    def get_std(self) -> float:
+        return np.sqrt(self.get_var())
+
+    def get_max(self) -> float:
+        return self.max_deque[0][1] if self.max_deque else np.nan
+
+    def get_min(self) -> float:
+        return self.min_deque[0][1] if self.min_deque else np.nan
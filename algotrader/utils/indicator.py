@@ -1,63 +1,173 @@
-import re
+import importlib
+import inspect
+from collections import OrderedDict, namedtuple
 
 from algotrader.utils.data_series import build_series_id
 from algotrader.utils.model import get_cls
 
+# native indicators take their class names before the TA-Lib wrappers of the same name
+INDICATOR_MODULES = [
+    'algotrader.technical.ma',
+    'algotrader.technical.stats',
+    'algotrader.technical.atr',
+    'algotrader.technical.bb',
+    'algotrader.technical.roc',
+    'algotrader.technical.rsi',
+    'algotrader.technical.historical_volatility',
+    'algotrader.technical.rolling_apply',
+    'algotrader.technical.kfpairregression',
+    'algotrader.technical.panel',
+    'algotrader.technical.sweep',
+    'algotrader.technical.pipeline.corr',
+    'algotrader.technical.pipeline.cross_sessional_apply',
+    'algotrader.technical.pipeline.make_vector',
+    'algotrader.technical.pipeline.pairwise',
+    'algotrader.technical.pipeline.rank',
+    'algotrader.technical.talib_wrapper',
+]
+
+indicator_classes = {}
+
+# cls_name(inputs..., kwargs...), inputs are (SeriesExpression or series name, input keys or None)
+SeriesExpression = namedtuple('SeriesExpression', ['cls_name', 'inputs', 'kwargs'])
+
+
+def register_indicator(cls, name: str = None) -> None:
+    """
+    make cls available to series expressions as name, its class name by default
+    """
+    indicator_classes[name if name else cls.__name__] = cls
+
+
+def get_indicator_cls(name: str) -> type:
+    """
+    :param name: class name of an indicator of INDICATOR_MODULES or a registered one, or a full class name
+    """
+    if not indicator_classes:
+        from algotrader.technical import Indicator
+        for mod_name in INDICATOR_MODULES:
+            mod = importlib.import_module(mod_name)
+            for cls in vars(mod).values():
+                if inspect.isclass(cls) and issubclass(cls, Indicator) and cls.__module__ == mod_name:
+                    indicator_classes.setdefault(cls.__name__, cls)
+    if name in indicator_classes:
+        return indicator_classes[name]
+    if '.' in name:
+        return get_cls(name)
+    raise AssertionError("unknown indicator %s" % name)
+
+
+def split_args(text: str):
+    """
+    :return: the comma separated parts of text outside of parentheses and brackets
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for idx, c in enumerate(text):
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+            assert depth >= 0, "invalid syntax, unbalanced %s in %s" % (c, text)
+        elif c == ',' and depth == 0:
+            parts.append(text[start:idx].strip())
+            start = idx + 1
+    assert depth == 0, "invalid syntax, unbalanced parentheses in %s" % text
+    if text.strip():
+        parts.append(text[start:].strip())
+    assert all(parts), "invalid syntax, empty argument in %s" % text
+    return parts
+
+
+def parse_inner(inner_str):
+    """
+    :return: inputs as (expression, input keys or None) and the kwargs of the arguments of a series expression
+    """
+    inputs = []
+    kwargs = OrderedDict()
+    for inner in split_args(inner_str):
+        eq_idx = inner.find('=')
+        if eq_idx > 0 and all(c not in inner[:eq_idx] for c in '(['):
+            kwargs[inner[:eq_idx].strip()] = inner[eq_idx + 1:].strip()
+            continue
+        assert not kwargs, "invalid syntax, input %s after keyword arguments" % inner
+        keys = None
+        if inner.endswith(']'):
+            lidx = inner.rfind('[')
+            assert lidx > 0 and ')' not in inner[lidx:], "invalid syntax, cannot parse %s" % inner
+            keys = [key.strip() for key in inner[lidx + 1:-1].split(',')]
+            inner = inner[:lidx].strip()
+        inputs.append((parse_expression(inner), keys))
+    return inputs, kwargs
+
+
+def parse_expression(name: str):
+    """
+    :return: SeriesExpression of name, or name itself for a series which is no indicator
+    """
+    name = name.strip()
+    lidx = name.find("(")
+    if lidx < 0:
+        assert name and all(c not in name for c in ')[],='), "invalid syntax, cannot parse %s" % name
+        return name
+    assert name.endswith(")"), "invalid syntax, cannot parse %s" % name
+    cls_name = name[0:lidx].strip()
+    assert cls_name, "invalid syntax, cannot parse %s" % name
+    inputs, kwargs = parse_inner(name[lidx + 1:-1])
+    return SeriesExpression(cls_name, inputs, kwargs)
+
+
+def compile_series(inst_data_mgr, expression, app_context=None):
+    """
+    build the series of a parsed expression, inputs first. Every sub-expression is rebuilt under its canonical
+    series_id and an existing series with that id is reused, so shared sub-expressions are computed once
+    :param app_context: indicators are created started in the indicator graph when given
+    """
+    if not isinstance(expression, SeriesExpression):
+        return inst_data_mgr.get_series(expression)
 
-def parse_inner(inner_str, level):
-    #print(level, inner_str)
     inputs = []
     input_keys = {}
-    kwargs = {}
-    while "(" in inner_str:
-        lidx = inner_str.find("(")
-        ridx = inner_str.rfind(")")
-        assert lidx > -1
-        assert ridx > -1
-        nested = inner_str[0:ridx]
-
-        inner_str = inner_str[ridx+1:]
-
-
-    for inner in inner_str.split(','):
-        if '=' in inner:
-            idx = inner.find("=")
-            k = inner[0:idx]
-            v = inner[idx + 1:]
-            kwargs[k] = v
-        elif '[' in inner:
-            assert inner.endswith("]")
-            idx = inner.find("[")
-            input = inner[0:idx]
-            keys = re.split('; |, ', inner[idx + 1: -1])
-            inputs.append(input)
-            input_keys[input] = keys
-        else:
-            inputs.append(inner)
-
-    return inputs, input_keys, kwargs
-
-
-def parse_series(inst_data_mgr, name):
-    if not inst_data_mgr.has_series(name):
-        lidx = name.find("(")
-        assert name.endswith(")"), "invalid syntax, cannot parse %s" % name
-        assert lidx > -1, "invalid syntax, cannot parse %s" % name
-        cls_str = name[0:lidx]
-        inner_str = name[lidx + 1:-1]
+    for input_expression, keys in expression.inputs:
+        input = compile_series(inst_data_mgr, input_expression, app_context)
+        inputs.append(input)
+        if keys:
+            input_keys[input.name] = keys
+
+    cls = get_indicator_cls(expression.cls_name)
+    if app_context:
+        return inst_data_mgr.graph.get_or_create(app_context, cls, inputs=inputs,
+                                                 input_keys=input_keys if input_keys else None,
+                                                 **expression.kwargs)
+    return get_or_create_indicator(inst_data_mgr, cls, inputs=inputs, input_keys=input_keys if input_keys else None,
+                                   **expression.kwargs)
+
+
+def parse_series(inst_data_mgr, name, app_context=None):
+    """
+    :param name: series expression in the series_id syntax, e.g. SMA(STD(Bar.X.Time.86400[close],length=20),length=5)
+    :param app_context: indicators are created started in the indicator graph when given
+    :return: the series, reusing the existing ones for name and any of its sub-expressions
+    """
+    if inst_data_mgr.has_series(name):
+        return inst_data_mgr.get_series(name)
+    return compile_series(inst_data_mgr, parse_expression(name), app_context)
 
-        inputs, input_keys, kwargs = parse_inner(inner_str)
-        cls = globals()[cls_str]
-        return cls(inputs=inputs, input_keys=input_keys, **kwargs)
 
-    return inst_data_mgr.get_series(name)
+def parse_all_series(inst_data_mgr, names, app_context=None):
+    """
+    compile many series expressions into one graph
+    :return: dict of expression to series
+    """
+    return OrderedDict((name, parse_series(inst_data_mgr, name, app_context)) for name in names)
 
 
 def get_or_create_indicator(inst_data_mgr, cls, inputs=None, input_keys=None, **kwargs):
     cls = get_cls(cls)
     name = build_series_id(cls.__name__, inputs=inputs, input_keys=input_keys, **kwargs)
     if not inst_data_mgr.has_series(name):
-        obj =  cls(inputs=inputs, input_keys=input_keys, **kwargs)
+        obj = cls(inputs=inputs, input_keys=input_keys, **kwargs)
         inst_data_mgr.add_series(obj)
         return obj
     return inst_data_mgr.get_series(name, create_if_missing=False)
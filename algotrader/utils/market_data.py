@@ -105,9 +105,13 @@ def get_quote_mid(quote: Quote) -> float:
     return quote.ask
 
 
+def get_bar_series_id(inst_id, type: Bar.Type, size: int) -> str:
+    return "Bar.%s.%s.%s" % (inst_id, get_bar_type_name(type), size)
+
+
 def get_series_id(item) -> str:
     if isinstance(item, Bar):
-        return "Bar.%s.%s.%s" % (item.inst_id, get_bar_type_name(item.type), item.size)
+        return get_bar_series_id(item.inst_id, item.type, item.size)
     if isinstance(item, Trade):
         return "Trade.%s" % (item.inst_id)
     if isinstance(item, Quote):
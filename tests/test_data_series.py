@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import numpy as np
 import pandas as pd
 from unittest import TestCase
@@ -182,6 +185,21 @@ class DataSeriesTest(TestCase):
         self.assertTrue(df1.equals(close.get_data_frame('v1')))
         self.assertTrue(df2.equals(close.get_data_frame(['v1', 'v2'])))
 
+    def test_data_frame_view(self):
+        series = self.create_series_by_list(range(5))
+        df = series.get_data_frame("v1")
+        self.assertTrue(np.shares_memory(df["v1"].values, series.get_by_idx(slice(None), "v1")))
+        self.assertIs(df, series.get_data_frame("v1"))
+
+        self.assertFalse(df["v1"].values.flags.writeable)
+        series.add(timestamp=12, data={"v1": 40})
+        self.assertEqual(40, df["v1"][12])
+
+        series.add(timestamp=15, data={"v1": 5})
+        df = series.get_data_frame("v1")
+        self.assertEqual(6, len(df))
+        self.assertEqual(5, series.get_series("v1")[15])
+
     def test_size(self):
         ts = DataSeriesTest.factory.build_time_series(series_id="test")
 
@@ -286,6 +304,279 @@ class DataSeriesTest(TestCase):
         self.assertEqual({"timestamp": 0, "v1": 2, "v2": 0.0}, series.get_by_time(time=0))
         self.assertEqual({"timestamp": 1, "v1": 2.4, "v2": 3.0}, series.get_by_time(time=1))
 
+    def test_index_of(self):
+        series = self.create_series_by_list(range(10))
+
+        self.assertEqual(0, series.index_of(0))
+        self.assertEqual(3, series.index_of(9))
+        self.assertEqual(-1, series.index_of(10))
+        self.assertEqual(-1, series.index_of(100))
+
+    def test_get_asof(self):
+        series = self.create_series_by_list(range(10))
+
+        self.assertEqual(0.0, series.get_asof(-1, "v1"))
+        self.assertEqual(0, series.get_asof(0, "v1"))
+        self.assertEqual(0, series.get_asof(2, "v1"))
+        self.assertEqual(1, series.get_asof(3, "v1"))
+        self.assertEqual(9, series.get_asof(1000, "v1"))
+
+    def test_get_range(self):
+        series = self.create_series_by_list(range(10))
+
+        np.testing.assert_array_equal([1, 2, 3], series.get_range(3, 12, "v1"))
+        np.testing.assert_array_equal([1, 2, 3], series.get_range(2, 10, "v1"))
+        np.testing.assert_array_equal([0, 1], series.get_range(None, 6, "v1"))
+        np.testing.assert_array_equal([8, 9], series.get_range(24, None, "v1"))
+        self.assertEqual(0, len(series.get_range(100, 200, "v1")))
+        np.testing.assert_array_equal([3, 6, 9], series.get_timestamp_range(3, 12))
+
+    def test_max_length(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test", max_length=3)
+        series = DataSeries(time_series=ts)
+
+        for t in range(10):
+            series.add(timestamp=t, data={"v1": t * 1.0})
+            self.assertEqual(min(t + 1, 3), series.size())
+            self.assertEqual(t, series.now("v1"))
+
+        self.assertEqual(8, series.ago(1, "v1"))
+        self.assertEqual(7, series.ago(2, "v1"))
+        self.assertEqual(0.0, series.ago(3, "v1"))
+        self.assertEqual(7, series.get_by_idx(0, "v1"))
+        self.assertEqual(7, series.get_by_time(7, "v1"))
+        np.testing.assert_array_equal([7, 8, 9], series.get_by_idx(slice(-3, None), "v1"))
+        np.testing.assert_array_equal([7, 8, 9], series.get_timestamp())
+        self.assertEqual([7, 8, 9], list(series.sync_time_series().frame.index))
+
+        series.add(timestamp=9, data={"v1": 99})
+        self.assertEqual(99, series.now("v1"))
+        self.assertEqual(99, series.get_by_time(9, "v1"))
+
+    def test_max_age(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test")
+        series = DataSeries(time_series=ts)
+        series.set_retention(max_age=10)
+
+        for t in range(0, 50, 3):
+            series.add(timestamp=t, data={"v1": t})
+
+        np.testing.assert_array_equal([39, 42, 45, 48], series.get_timestamp())
+        self.assertEqual(48, series.now("v1"))
+        self.assertEqual(39, series.get_by_idx(0, "v1"))
+
+    def test_evict_handler(self):
+        series = self.create_series_by_list(range(5))
+        series.set_retention(max_length=3)
+        np.testing.assert_array_equal([2, 3, 4], series.get_by_idx(slice(None), "v1"))
+
+        evicted = []
+        series.evict_handler = lambda s, items: evicted.extend(items)
+        series.add(timestamp=15, data={"v1": 5})
+        series.add(timestamp=18, data={"v1": 6})
+
+        self.assertEqual([6, 9], [item.timestamp for item in evicted])
+        self.assertEqual([2, 3], [item.data["v1"] for item in evicted])
+        np.testing.assert_array_equal([4, 5, 6], series.get_by_idx(slice(None), "v1"))
+
+    def test_sync_time_series(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test")
+        series = DataSeries(time_series=ts)
+        series.add(timestamp=1, data={"v1": 1})
+        series.add(timestamp=2, data={"v1": 2})
+        self.assertEqual(0, len(ts.frame.index))
+
+        series.sync_time_series()
+        self.assertEqual([1, 2], list(ts.frame.index))
+        self.assertEqual([1, 2], list(ts.frame.double_data["v1"].values))
+        self.assertEqual(2, ts.end_time)
+
+        series.add(timestamp=2, data={"v1": 20})
+        series.add(timestamp=3, data={"v1": 3})
+        series.sync_time_series()
+        self.assertEqual([1, 2, 3], list(ts.frame.index))
+        self.assertEqual([1, 20, 3], list(ts.frame.double_data["v1"].values))
+
+        series.set_retention(max_length=2)
+        series.add(timestamp=4, data={"v1": 4})
+        series.sync_time_series()
+        self.assertEqual([3, 4], list(ts.frame.index))
+        self.assertEqual([3, 4], list(ts.frame.double_data["v1"].values))
+
+        reloaded = DataSeries(time_series=ts)
+        self.assertEqual(0, len(ts.frame.index))
+        np.testing.assert_array_equal([3, 4], reloaded.get_by_idx(slice(None), "v1"))
+        self.assertEqual([3, 4], list(reloaded.sync_time_series().frame.index))
+
+    def test_sync_legacy_items(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test", keys=["v1"])
+        DataSeriesTest.factory.add_time_series_item(ts, 1, {"v1": 1.0})
+        DataSeriesTest.factory.add_time_series_item(ts, 2, {"v1": 2.0})
+
+        series = DataSeries(time_series=ts)
+        np.testing.assert_array_equal([1, 2], series.get_by_idx(slice(None), "v1"))
+        series.sync_time_series()
+        self.assertEqual(0, len(ts.items))
+        self.assertEqual([1, 2], list(ts.frame.index))
+
+    def test_typed_columns(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test", keys=["close", "vol", "flag", "sym"],
+                                                      dtypes={"vol": "int64", "flag": "bool", "sym": "object"})
+        series = DataSeries(time_series=ts)
+        series.add(timestamp=1, data={"close": 1.5, "vol": 10, "flag": True, "sym": "HSI"})
+        series.add(timestamp=2, data={"close": 2.5, "vol": 20, "flag": False, "sym": "SPX"})
+
+        self.assertEqual(np.float64, series.dtype("close"))
+        self.assertEqual(np.int64, series.dtype("vol"))
+        self.assertEqual(np.bool_, series.dtype("flag"))
+        self.assertEqual(object, series.dtype("sym"))
+        self.assertEqual(20, series.now("vol"))
+        self.assertEqual("SPX", series.now("sym"))
+
+        series.sync_time_series()
+        self.assertEqual([1.5, 2.5], list(ts.frame.double_data["close"].values))
+        self.assertEqual([10, 20], list(ts.frame.long_data["vol"].values))
+        self.assertEqual([True, False], list(ts.frame.bool_data["flag"].values))
+        self.assertEqual(["HSI", "SPX"], list(ts.frame.string_data["sym"].values))
+
+        reloaded = DataSeries(time_series=ts)
+        self.assertEqual(np.int64, reloaded.dtype("vol"))
+        self.assertEqual(np.bool_, reloaded.dtype("flag"))
+        np.testing.assert_array_equal([10, 20], reloaded.get_by_idx(slice(None), "vol"))
+        np.testing.assert_array_equal(["HSI", "SPX"], reloaded.get_by_idx(slice(None), "sym"))
+
+    def test_typed_column_promotion(self):
+        ts = DataSeriesTest.factory.build_time_series(series_id="test", keys=["vol"], dtypes={"vol": "int32"})
+        series = DataSeries(time_series=ts)
+        series.add(timestamp=1, data={"vol": 10})
+        series.sync_time_series()
+        self.assertEqual([10], list(ts.frame.int_data["vol"].values))
+
+        series.add(timestamp=2, data={"vol": 2.5})
+        self.assertEqual(np.float64, series.dtype("vol"))
+        np.testing.assert_array_equal([10, 2.5], series.get_by_idx(slice(None), "vol"))
+
+        series.sync_time_series()
+        self.assertNotIn("vol", ts.frame.int_data)
+        self.assertEqual([10, 2.5], list(ts.frame.double_data["vol"].values))
+
+    def test_update_event(self):
+        series = DataSeries(time_series=DataSeriesTest.factory.build_time_series(series_id="test"))
+        series.add(timestamp=1, data={"v1": 1.0, "sym": "HSI"})
+
+        events = []
+        series.subject.subscribe(events.append)
+        series.add(timestamp=2, data={"v1": 2.0, "sym": "SPX"})
+        self.assertEqual([("test", 2, {"v1": 2.0, "sym": "SPX"})], events)
+
+        event = events[0].to_proto()
+        self.assertEqual("test", event.source)
+        self.assertEqual(2, event.item.timestamp)
+        self.assertEqual({"v1": 2.0}, dict(event.item.data))
+
+    def test_extend(self):
+        series = self.create_series_by_list(range(3))
+        events = []
+        series.subject.subscribe(events.append)
+
+        series.extend(timestamps=[9, 12, 15], columns={"v1": np.array([3.0, 4.0, 5.0])})
+        self.assertEqual(1, len(events))
+        self.assertEqual(3, len(events[0]))
+        self.assertEqual([(12, {"v1": 4.0})], list(events[0].rows())[1:2])
+        np.testing.assert_array_equal([0, 3, 6, 9, 12, 15], series.get_timestamp())
+        np.testing.assert_array_equal(range(6), series.get_by_idx(slice(None), "v1"))
+        self.assertEqual(15, series.current_time())
+
+        series.add(timestamp=18, data={"v1": 6})
+        self.assertEqual(6, series.now("v1"))
+        self.assertRaises(AssertionError, series.extend, [18, 21], {"v1": [1, 2]})
+        self.assertRaises(AssertionError, series.extend, [24, 21], {"v1": [1, 2]})
+
+    def test_extend_w_data_frame(self):
+        series = DataSeries(time_series=TimeSeries())
+        df = pd.DataFrame({"close": [1.0, 2.0, 3.0], "vol": [10, 20, 30]},
+                          index=pd.to_datetime(["1970-01-01", "1970-01-02", "1970-01-03"]))
+        series.extend(columns=df)
+
+        np.testing.assert_array_equal([0, 86400000, 172800000], series.get_timestamp())
+        self.assertEqual(["close", "vol"], list(series.time_series.keys))
+        self.assertEqual(30, series.now("vol"))
+        self.assertEqual([0, 86400000, 172800000], list(series.sync_time_series().frame.index))
+
+    def test_extend_w_max_length(self):
+        series = self.create_series_by_list(range(3))
+        series.set_retention(max_length=4)
+        evicted = []
+        series.evict_handler = lambda s, items: evicted.extend(items)
+
+        series.extend(timestamps=[9, 12, 15], columns={"v1": [3, 4, 5]})
+        np.testing.assert_array_equal([2, 3, 4, 5], series.get_by_idx(slice(None), "v1"))
+        series.extend(timestamps=range(18, 36, 3), columns={"v1": range(6, 12)})
+        np.testing.assert_array_equal([8, 9, 10, 11], series.get_by_idx(slice(None), "v1"))
+        np.testing.assert_array_equal([24, 27, 30, 33], series.get_timestamp())
+        self.assertEqual([0, 3, 6, 9, 12, 15, 18, 21], [item.timestamp for item in evicted])
+
+        series.add(timestamp=36, data={"v1": 12})
+        np.testing.assert_array_equal([9, 10, 11, 12], series.get_by_idx(slice(None), "v1"))
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "Trade.1")
+            ts = DataSeriesTest.factory.build_time_series(series_id="Trade.1", memmap_path=path)
+            series = DataSeries(time_series=ts)
+            self.assertTrue(series.is_memmap())
+            for t in range(20):
+                series.add(timestamp=t, data={"price": 20.0 + t, "size": 100})
+            series.extend(timestamps=range(20, 40), columns={"price": np.arange(40.0, 60.0)})
+            series.add(timestamp=39, data={"size": 300})
+            series.flush()
+
+            reopened = DataSeries.open_memmap(path)
+            self.assertIsInstance(reopened.get_by_idx(slice(None), "price"), np.memmap)
+            self.assertEqual(40, reopened.size())
+            self.assertEqual(39, reopened.current_time())
+            self.assertEqual(["price", "size"], list(reopened.time_series.keys))
+            np.testing.assert_array_equal(np.arange(20.0, 60.0), reopened.get_by_idx(slice(None), "price"))
+            self.assertEqual(100, reopened.get_by_time(19, "size"))
+            self.assertEqual(0, reopened.get_by_time(20, "size"))
+            self.assertEqual(300, reopened.now("size"))
+            self.assertEqual(0, len(reopened.sync_time_series().frame.index))
+
+            reopened.add(timestamp=40, data={"price": 60.0, "size": 1})
+            reopened.flush()
+            np.testing.assert_array_equal(range(41), DataSeries.open_memmap(path).get_timestamp())
+
+    def test_memmap_promotion(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "Trade.1")
+            ts = DataSeriesTest.factory.build_time_series(series_id="Trade.1", keys=["price", "size"],
+                                                          dtypes={"size": "int64"}, memmap_path=path)
+            series = DataSeries(time_series=ts)
+            for t in range(20):
+                series.add(timestamp=t, data={"price": 20.0 + t, "size": 100 + t})
+            self.assertEqual(np.int64, series.get_by_idx(slice(None), "size").dtype)
+
+            # the int column is rewritten as float64 to hold the NaN
+            series.add(timestamp=20, data={"price": 40.0, "size": np.nan})
+            series.add(timestamp=21, data={"price": 41.0, "size": 2.5})
+            series.flush()
+            reopened = DataSeries.open_memmap(path)
+            sizes = reopened.get_by_idx(slice(None), "size")
+            self.assertIsInstance(sizes, np.memmap)
+            self.assertEqual(np.float64, sizes.dtype)
+            np.testing.assert_array_equal(list(range(100, 120)) + [np.nan, 2.5], sizes)
+            self.assertFalse(os.path.exists(os.path.join(path, "size.promoted.bin")))
+
+            with self.assertRaises(TypeError):
+                reopened.add(timestamp=22, data={"price": 42.0, "size": "big"})
+            with self.assertRaises(ValueError):
+                reopened.set_retention(max_length=10)
+
+            ts = DataSeriesTest.factory.build_time_series(series_id="Trade.2", keys=["sym"], dtypes={"sym": "object"},
+                                                          memmap_path=os.path.join(root, "Trade.2"))
+            with self.assertRaises(TypeError):
+                DataSeries(time_series=ts)
+
     def test_override_w_same_time(self):
         ts = DataSeriesTest.factory.build_time_series(series_id="test", keys=["timestamp", "v1", "v2", "v3"])
 
@@ -327,13 +618,44 @@ class DataSeriesTest(TestCase):
 
     def test_subscript(self):
         close = self.__create_series()
-        self.assertEquals([np.nan, np.nan], close[0:2, "v1"])
-        self.assertEquals({"v1": [np.nan, np.nan, 44.34, 44.09], "v2": [np.nan, np.nan, 44.34, 44.09]},
-                          close[0:4, ["v1", "v2"]])
+        np.testing.assert_array_equal([np.nan, np.nan], close[0:2, "v1"])
+        result = close[0:4, ["v1", "v2"]]
+        np.testing.assert_array_equal([np.nan, np.nan, 44.34, 44.09], result["v1"])
+        np.testing.assert_array_equal([np.nan, np.nan, 44.34, 44.09], result["v2"])
 
-        self.assertEquals([np.nan, np.nan, 44.34, 44.09], close[0:4, "v1"])
-        self.assertEquals([np.nan, np.nan, 44.34, 44.09, 44.15, 43.61, 44.33, 44.83], close[0:8, "v1"])
-        self.assertEquals([45.84, 46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.0], close[-8:, "v1"])
+        np.testing.assert_array_equal([np.nan, np.nan, 44.34, 44.09], close[0:4, "v1"])
+        np.testing.assert_array_equal([np.nan, np.nan, 44.34, 44.09, 44.15, 43.61, 44.33, 44.83], close[0:8, "v1"])
+        np.testing.assert_array_equal([45.84, 46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.0], close[-8:, "v1"])
+
+    def test_slice_is_view(self):
+        close = self.__create_series()
+        sliced = close.get_by_idx(slice(-4, None), "v1")
+        self.assertIsInstance(sliced, np.ndarray)
+        self.assertEqual(np.float64, sliced.dtype)
+        self.assertFalse(sliced.flags.owndata)
+        self.assertFalse(sliced.flags.writeable)
+        self.assertFalse(close.get_timestamp().flags.writeable)
+        with self.assertRaises(ValueError):
+            sliced[0] = 1.0
+
+        # the views follow the ring buffer, copies keep the values
+        ts = DataSeriesTest.factory.build_time_series(series_id="test", max_length=3)
+        series = DataSeries(time_series=ts)
+        for t in range(3):
+            series.add(timestamp=t, data={"v1": t * 1.0})
+        view = series.get_by_idx(slice(0, 3), "v1")
+        copy = view.copy()
+        series.add(timestamp=3, data={"v1": 3.0})
+        np.testing.assert_array_equal([0.0, 1.0, 2.0], copy)
+        self.assertEqual(3.0, view[0])
+
+    def test_grow_beyond_initial_capacity(self):
+        series = self.create_series_by_list(range(1000))
+        self.assertEqual(1000, series.size())
+        self.assertEqual(999, series.now("v1"))
+        self.assertEqual(0, series.get_by_idx(0, "v1"))
+        self.assertEqual(500, series.get_by_time(1500, "v1"))
+        np.testing.assert_array_equal(np.arange(990, 1000), series.get_by_idx(slice(-10, None), "v1"))
 
     def test_mean(self):
         close = self.__create_series()
@@ -374,6 +696,37 @@ class DataSeriesTest(TestCase):
         self.assertAlmostEqual(0.015625, close.var(start=0, end=4, keys="v1"))
         self.assertAlmostEqual(0.07231875, close.var(start=0, end=6, keys="v1"))
 
+    def test_window_stats(self):
+        values = np.random.normal(100, 5, 300)
+        values[[3, 50, 51, 52, 53, 54, 200]] = np.nan
+        series = DataSeries(time_series=TimeSeries())
+        series.set_retention(max_length=120)
+
+        for t, value in enumerate(values):
+            series.add(timestamp=t, data={"v1": value})
+            if t % 7 == 0:
+                # update in place
+                series.add(timestamp=t, data={"v1": value + 1})
+                values[t] = value + 1
+            if t >= 20:
+                window = values[max(0, t - 119):t + 1][-20:]
+                self.assertAlmostEqual(np.nanmean(window), series.mean(-20, keys="v1"))
+                self.assertAlmostEqual(np.nanstd(window), series.std(-20, keys="v1"))
+                self.assertAlmostEqual(np.nanvar(window), series.var(-20, keys="v1"))
+                self.assertEqual(np.nanmax(window), series.max(-20, keys="v1"))
+                self.assertEqual(np.nanmin(window), series.min(-20, keys="v1"))
+            if t % 50 == 0:
+                window = values[max(0, t - 119):t + 1][-5:]
+                self.assertAlmostEqual(np.nanmean(window), series.mean(-5, keys="v1"))
+
+        series.extend(timestamps=range(300, 310), columns={"v1": np.full(10, np.nan)})
+        self.assertTrue(np.isnan(series.mean(-10, keys="v1")))
+        self.assertTrue(np.isnan(series.max(-10, keys="v1")))
+        series.extend(timestamps=range(310, 315), columns={"v1": range(5)})
+        self.assertEqual(2.0, series.mean(-10, keys="v1"))
+        self.assertEqual(4.0, series.max(-15, keys="v1"))
+        self.assertEqual(0.0, series.min(-15, keys="v1"))
+
     def test_apply(self):
         r = [x for x in range(20) if x % 2 == 0]
 
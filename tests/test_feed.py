@@ -1,8 +1,16 @@
+import numpy as np
+import pandas as pd
 from nose_parameterized import parameterized, param
 from unittest import TestCase
 
+from algotrader.model.model_factory import ModelFactory
+from algotrader.model.ref_data_pb2 import Instrument
+from algotrader.provider.feed import Feed
+from algotrader.provider.feed.pandas_memory import PandasMemoryDataFeed
 from algotrader.trading.context import ApplicationContext
+from algotrader.trading.data_series import TimeSeriesBatchUpdateEvent
 from algotrader.trading.event import EventLogger
+from algotrader.utils.date import datestr_to_unixtimemillis
 from algotrader.utils.market_data import *
 from tests import config
 
@@ -36,3 +44,35 @@ class FeedTest(TestCase):
         self.assertTrue(eventLogger.count[Bar] > 0)
         self.assertTrue(eventLogger.count[Trade] == 0)
         self.assertTrue(eventLogger.count[Quote] == 0)
+
+
+class PandasMemoryFeedTest(TestCase):
+    def test_load_series(self):
+        app_context = ApplicationContext()
+        feed = PandasMemoryDataFeed()
+        feed.start(app_context)
+        df = pd.DataFrame({"Open": [10.0, 11.0, 12.0, 13.0], "High": [10.5, 11.5, 12.5, 13.5],
+                           "Low": [9.5, 10.5, 11.5, 12.5], "Close": [10.2, 11.2, 12.2, 13.2],
+                           "Volume": [100, 200, 300, 400]},
+                          index=pd.to_datetime(["2016-12-30", "2017-01-04", "2017-01-03", "2017-01-05"]))
+        feed.set_data_frame({"SPY@NYSEARCA": df})
+
+        series_id = get_bar_series_id("SPY@NYSEARCA", Bar.Time, D1)
+        self.assertEqual("Bar.SPY@NYSEARCA.Time.86400", series_id)
+        series = app_context.inst_data_mgr.get_series(series_id)
+        events = []
+        series.subject.subscribe(events.append)
+
+        instruments = [ModelFactory.build_instrument(symbol="SPY", type=Instrument.STK, primary_exch_id="NYSEARCA",
+                                                     ccy_id="USD")]
+        feed.load_series(*build_subscription_requests(Feed.PandasMemory, instruments, ['Bar.Yahoo.Time.D1'],
+                                                      20170101, 20170105))
+
+        self.assertEqual(1, len(events))
+        self.assertIsInstance(events[0], TimeSeriesBatchUpdateEvent)
+        self.assertEqual(2, series.size())
+        np.testing.assert_array_equal([datestr_to_unixtimemillis("20170103"), datestr_to_unixtimemillis("20170104")],
+                                      series.get_timestamp())
+        np.testing.assert_array_equal([12.0, 11.0], series.get_by_idx(slice(None), "open"))
+        np.testing.assert_array_equal([12.2, 11.2], series.get_by_idx(slice(None), "close"))
+        np.testing.assert_array_equal([300, 200], series.get_by_idx(slice(None), "vol"))
@@ -1,8 +1,16 @@
+import numpy as np
 from unittest import TestCase
 
-from algotrader.trading.context import ApplicationContext
-from algotrader.utils.indicator import parse_series, get_or_create_indicator
+from algotrader.model.time_series_pb2 import TimeSeries
+
+from algotrader.technical.historical_volatility import HistoricalVolatility
 from algotrader.technical.ma import SMA
+from algotrader.technical.roc import ROC
+from algotrader.technical.rsi import RSI
+from algotrader.technical.rolling_apply import Kurt, RollingApply, Skew, StdDev
+from algotrader.technical.stats import MAX, MIN, STD, VAR
+from algotrader.trading.context import ApplicationContext
+from algotrader.utils.indicator import get_or_create_indicator, parse_all_series, parse_series
 
 class IndicatorTest(TestCase):
     def setUp(self):
@@ -34,31 +42,263 @@ class IndicatorTest(TestCase):
 
         self.assertEquals(sma4.input_series[0], sma3)
 
-    # def test_parse(self):
-    #     bar = parse_series(self.app_context.inst_data_mgr, "bar")
-    #     bar.start(self.app_context)
-    #
-    #     sma1 = parse_series(self.app_context.inst_data_mgr, "SMA(bar[close],length=3)")
-    #     sma1.start(self.app_context)
-    #
-    #     sma2 = parse_series(self.app_context.inst_data_mgr, "SMA(SMA(bar[close],length=3)[value],length=10)")
-    #     sma2.start(self.app_context)
-    #
-    #     rsi = parse_series(self.app_context.inst_data_mgr, "RSI(SMA(SMA('bar',close,3),value,10),value,14, 9)")
-    #     rsi.start(self.app_context)
-    #
-    #     self.assertEquals(sma1.input, bar)
-    #     self.assertEquals(3, sma1.length)
-    #
-    #     self.assertEquals(sma2.input, sma1)
-    #     self.assertEquals(10, sma2.length)
-    #
-    #     self.assertEquals(rsi.input, sma2)
-    #     self.assertEquals(14, rsi.length)
-    #
-    # def test_fail_parse(self):
-    #     with self.assertRaises(AssertionError):
-    #         parse_series(self.app_context.inst_data_mgr, "SMA('Bar.Close',3")
-    #
-    #     with self.assertRaises(AssertionError):
-    #         parse_series(self.app_context.inst_data_mgr, "RSI(SMA(SMA('Bar.Close',3,10),14)")
+    def test_backfill(self):
+        closes = np.random.RandomState(0).uniform(50, 150, 300)
+        closes[[20, 21, 150]] = np.nan
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        history.extend(timestamps=np.arange(250), columns={"close": closes[:250]})
+        streamed = self.app_context.inst_data_mgr.get_series("streamed")
+        streamed.start(self.app_context)
+
+        pairs = []
+        for cls, kwargs in [(SMA, {}), (STD, {}), (VAR, {"ddof": 1}), (MAX, {}), (MIN, {}),
+                            (HistoricalVolatility, {}), (ROC, {"length": 3}), (RSI, {}), (StdDev, {}), (Skew, {}),
+                            (Kurt, {}), (RollingApply, {"kernel": "quantile", "q": 0.3}),
+                            (RollingApply, {"kernel": "ewm"}), (RollingApply, {"func": np.nanmax})]:
+            kwargs.setdefault("length", 7)
+            batch = cls(inputs=history, input_keys='close', **kwargs)
+            batch.start(self.app_context)
+            stream = cls(inputs=streamed, input_keys='close', **kwargs)
+            stream.start(self.app_context)
+            pairs.append((batch, stream))
+
+        for t in range(250):
+            streamed.add(timestamp=t, data={"close": closes[t]})
+        for batch, stream in pairs:
+            self.assertEqual(250, batch.size())
+            for key in batch.time_series.keys:
+                np.testing.assert_almost_equal(stream.get_by_idx(slice(None), key),
+                                               batch.get_by_idx(slice(None), key))
+
+        for t in range(250, 275):
+            history.add(timestamp=t, data={"close": closes[t]})
+            streamed.add(timestamp=t, data={"close": closes[t]})
+        for batch, stream in pairs:
+            # identical going forward, the streaming state is seeded from the history
+            for key in batch.time_series.keys:
+                np.testing.assert_array_equal(stream.get_by_idx(slice(250, None), key),
+                                              batch.get_by_idx(slice(250, None), key))
+
+        history.extend(timestamps=np.arange(275, 290), columns={"close": closes[275:290]})
+        for t in range(275, 300):
+            if t >= 290:
+                history.add(timestamp=t, data={"close": closes[t]})
+            streamed.add(timestamp=t, data={"close": closes[t]})
+        for batch, stream in pairs:
+            self.assertEqual(300, batch.size())
+            for key in batch.time_series.keys:
+                np.testing.assert_almost_equal(stream.get_by_idx(slice(275, 290), key),
+                                               batch.get_by_idx(slice(275, 290), key))
+                np.testing.assert_array_equal(stream.get_by_idx(slice(290, None), key),
+                                              batch.get_by_idx(slice(290, None), key))
+
+    def test_rsi(self):
+        values = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42,
+                  45.84, 46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.00]
+        close = self.app_context.inst_data_mgr.get_series("close")
+        close.start(self.app_context)
+        rsi = RSI(inputs=close, input_keys='close', length=14)
+        rsi.start(self.app_context)
+        for t, value in enumerate(values[:15]):
+            close.add(timestamp=t, data={"close": value})
+        self.assertTrue(np.isnan(rsi.ago(1)))
+        self.assertAlmostEqual(70.46413502, rsi.now(), places=8)
+
+        # updates of the latest row are smoothed once
+        close.add(timestamp=15, data={"close": 47.00})
+        close.add(timestamp=15, data={"close": values[15]})
+        self.assertAlmostEqual(66.24961855, rsi.now(), places=8)
+
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        history.extend(timestamps=np.arange(len(values)), columns={"close": np.array(values)})
+        backfilled = RSI(inputs=history, input_keys='close', length=14)
+        backfilled.start(self.app_context)
+        np.testing.assert_almost_equal(rsi.get_by_idx(slice(None), 'value'),
+                                       backfilled.get_by_idx(slice(None), 'value'))
+
+    def test_rsi_after_backfill(self):
+        closes = np.cumsum(np.random.RandomState(3).normal(0, 1.0, 5000)) + 100
+        closes[[10, 3000]] = np.nan
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        history.extend(timestamps=np.arange(4990), columns={"close": closes[:4990]})
+        streamed = self.app_context.inst_data_mgr.get_series("streamed")
+        streamed.start(self.app_context)
+        for length in [2, 14, 30]:
+            backfilled = RSI(inputs=history, input_keys='close', length=length)
+            backfilled.start(self.app_context)
+            stream = RSI(inputs=streamed, input_keys='close', length=length)
+            stream.start(self.app_context)
+        for t in range(4990):
+            streamed.add(timestamp=t, data={"close": closes[t]})
+
+        # an update of the latest backfilled row, then new rows, give exactly the streamed values
+        for input in [history, streamed]:
+            input.add(timestamp=4989, data={"close": 90.0})
+            for t in range(4990, 5000):
+                input.add(timestamp=t, data={"close": closes[t]})
+        for length in [2, 14, 30]:
+            name = "RSI(%s[close],length=%s)"
+            backfilled = self.app_context.inst_data_mgr.get_series(name % ("history", length))
+            stream = self.app_context.inst_data_mgr.get_series(name % ("streamed", length))
+            self.assertEqual(5000, backfilled.size())
+            self.assertEqual(5000, stream.size())
+            np.testing.assert_array_equal(stream.get_by_idx(slice(4989, None), 'value'),
+                                          backfilled.get_by_idx(slice(4989, None), 'value'))
+            np.testing.assert_almost_equal(stream.get_by_idx(slice(None, 4989), 'value'),
+                                           backfilled.get_by_idx(slice(None, 4989), 'value'))
+
+    def test_restore_state(self):
+        closes = np.random.RandomState(1).uniform(50, 150, 120)
+        closes[[30, 95]] = np.nan
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+
+        indicators = []
+        for cls, kwargs in [(SMA, {}), (STD, {}), (VAR, {"ddof": 1}), (MAX, {}), (MIN, {}),
+                            (HistoricalVolatility, {}), (ROC, {"length": 3}), (RSI, {}), (Skew, {}), (Kurt, {}),
+                            (RollingApply, {"kernel": "quantile", "q": 0.3}), (RollingApply, {"kernel": "ewm"})]:
+            kwargs.setdefault("length", 7)
+            indicator = cls(inputs=history, input_keys='close', **kwargs)
+            indicator.start(self.app_context)
+            indicators.append(indicator)
+        for t in range(100):
+            history.add(timestamp=t, data={"close": closes[t]})
+        saved = []
+        for indicator in indicators:
+            time_series = TimeSeries()
+            time_series.CopyFrom(indicator.sync_time_series())
+            self.assertIn("timestamp", time_series.state)
+            saved.append(time_series)
+
+        # restart with the recent input history only, which is not enough to replay the streaming state
+        restarted = ApplicationContext()
+        recent = restarted.inst_data_mgr.get_series("history")
+        recent.start(restarted)
+        recent.extend(timestamps=np.arange(80, 100), columns={"close": closes[80:100]})
+        restored = []
+        for indicator, time_series in zip(indicators, saved):
+            restored_indicator = indicator.__class__(time_series=time_series)
+            restored_indicator.start(restarted)
+            self.assertEqual(100, restored_indicator.size())
+            restored.append(restored_indicator)
+
+        for t in range(100, 120):
+            history.add(timestamp=t, data={"close": closes[t]})
+            recent.add(timestamp=t, data={"close": closes[t]})
+        recent.add(timestamp=119, data={"close": 80.0})
+        history.add(timestamp=119, data={"close": 80.0})
+        for indicator, restored_indicator in zip(indicators, restored):
+            for key in indicator.time_series.keys:
+                np.testing.assert_array_equal(indicator.get_by_idx(slice(100, None), key),
+                                              restored_indicator.get_by_idx(slice(100, None), key))
+
+    def test_restore_state_after_input_moved_on(self):
+        closes = np.random.RandomState(2).uniform(50, 150, 40)
+        closes[25] = np.nan
+        classes = [(SMA, {}), (STD, {}), (VAR, {"ddof": 1}), (MAX, {}), (MIN, {}), (HistoricalVolatility, {}),
+                   (ROC, {"length": 3}), (RSI, {}), (Skew, {}), (Kurt, {}),
+                   (RollingApply, {"kernel": "quantile", "q": 0.3}), (RollingApply, {"kernel": "ewm"})]
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        saved = []
+        for cls, kwargs in classes:
+            kwargs.setdefault("length", 7)
+            indicator = cls(inputs=history, input_keys='close', **kwargs)
+            indicator.start(self.app_context)
+            saved.append(indicator)
+        for t in range(20):
+            history.add(timestamp=t, data={"close": closes[t]})
+        saved = [TimeSeries.FromString(indicator.sync_time_series().SerializeToString()) for indicator in saved]
+
+        # the input got rows 20 to 29 while the indicators were down, they are replayed after the restore
+        restarted = ApplicationContext()
+        recent = restarted.inst_data_mgr.get_series("history")
+        recent.start(restarted)
+        recent.extend(timestamps=np.arange(10, 30), columns={"close": closes[10:30]})
+        restored = []
+        for (cls, kwargs), time_series in zip(classes, saved):
+            restored_indicator = cls(time_series=time_series)
+            restored_indicator.start(restarted)
+            restored.append(restored_indicator)
+
+        fresh_context = ApplicationContext()
+        streamed = fresh_context.inst_data_mgr.get_series("history")
+        streamed.start(fresh_context)
+        fresh = []
+        for cls, kwargs in classes:
+            indicator = cls(inputs=streamed, input_keys='close', **kwargs)
+            indicator.start(fresh_context)
+            fresh.append(indicator)
+
+        for t in range(40):
+            streamed.add(timestamp=t, data={"close": closes[t]})
+            if t >= 30:
+                recent.add(timestamp=t, data={"close": closes[t]})
+        for indicator, restored_indicator in zip(fresh, restored):
+            self.assertEqual(40, restored_indicator.size())
+            for key in indicator.time_series.keys:
+                np.testing.assert_array_equal(indicator.get_by_idx(slice(20, None), key),
+                                              restored_indicator.get_by_idx(slice(20, None), key))
+
+    def test_parse(self):
+        bar = parse_series(self.app_context.inst_data_mgr, "bar")
+        bar.start(self.app_context)
+
+        sma1 = parse_series(self.app_context.inst_data_mgr, "SMA(bar[close],length=3)")
+        sma1.start(self.app_context)
+
+        sma2 = parse_series(self.app_context.inst_data_mgr, "SMA(SMA(bar[close],length=3)[value],length=10)")
+        sma2.start(self.app_context)
+
+        self.assertEqual("SMA(bar[close],length=3)", sma1.name)
+        self.assertIs(bar, sma1.first_input)
+        self.assertEqual(3, sma1.length)
+
+        self.assertIs(sma1, sma2.first_input)
+        self.assertEqual(10, sma2.length)
+
+    def test_parse_shared_subexpressions(self):
+        inst_data_mgr = self.app_context.inst_data_mgr
+        bar = inst_data_mgr.get_series("Bar.X.Time.86400")
+        bar.start(self.app_context)
+
+        series = parse_all_series(inst_data_mgr, [
+            "BB(Bar.X.Time.86400[close],length=5,num_std=2)",
+            "SMA(STD(Bar.X.Time.86400[close],length=5)[value],length=3)",
+            "ROC(SMA(Bar.X.Time.86400[close],length=5), length=2)",
+            "Rank(SMA(Bar.X.Time.86400[close],length=5)[value],STD(Bar.X.Time.86400[close],length=5)[value],"
+            "ascending=True)"], app_context=self.app_context)
+
+        sma = inst_data_mgr.get_series("SMA(Bar.X.Time.86400[close],length=5)")
+        std = inst_data_mgr.get_series("STD(Bar.X.Time.86400[close],length=5)")
+        self.assertIs(std, series["SMA(STD(Bar.X.Time.86400[close],length=5)[value],length=3)"].first_input)
+        self.assertIs(sma, series["ROC(SMA(Bar.X.Time.86400[close],length=5), length=2)"].first_input)
+        self.assertEqual("ROC(SMA(Bar.X.Time.86400[close],length=5),length=2)",
+                         series["ROC(SMA(Bar.X.Time.86400[close],length=5), length=2)"].name)
+        self.assertEqual([sma, std], series["Rank(SMA(Bar.X.Time.86400[close],length=5)[value],"
+                                            "STD(Bar.X.Time.86400[close],length=5)[value],ascending=True)"].input_series)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 20)
+        for t, close in enumerate(closes):
+            bar.add(timestamp=t, data={"close": close})
+        self.assertEqual(20, sma.size())
+        np.testing.assert_array_equal(sma.get_by_idx(slice(None), 'value'),
+                                      series["BB(Bar.X.Time.86400[close],length=5,num_std=2)"].get_by_idx(
+                                          slice(None), 'value'))
+
+        # compiling again creates nothing
+        self.assertIs(sma, parse_series(inst_data_mgr, "SMA(Bar.X.Time.86400[close],length=5)"))
+        self.assertIs(sma, parse_series(inst_data_mgr, " SMA( Bar.X.Time.86400[close], length=5 )"))
+
+    def test_fail_parse(self):
+        with self.assertRaises(AssertionError):
+            parse_series(self.app_context.inst_data_mgr, "SMA(bar[close],length=3")
+
+        with self.assertRaises(AssertionError):
+            parse_series(self.app_context.inst_data_mgr, "SMA(SMA(bar[close],length=3),length=10")
+
+        with self.assertRaises(AssertionError):
+            parse_series(self.app_context.inst_data_mgr, "NoSuchIndicator(bar[close],length=3)")
@@ -0,0 +1,121 @@
+import numpy as np
+from typing import Dict
+from unittest import TestCase
+
+from algotrader.technical import Indicator
+from algotrader.technical.atr import ATR
+from algotrader.technical.bb import BB
+from algotrader.technical.ma import SMA
+from algotrader.technical.stats import STD
+from algotrader.trading.context import ApplicationContext
+
+
+class Spread(Indicator):
+    """
+    difference of two indicators of the same input, records the timestamps it read them at
+    """
+
+    def __init__(self, time_series=None, inputs=None, input_keys=None, desc="Spread"):
+        super(Spread, self).__init__(time_series=time_series, inputs=inputs, input_keys=input_keys, desc=desc)
+        self.seen = []
+
+    def _process_update(self, source: str, timestamp: int, data: Dict[str, float]):
+        self.seen.append((timestamp, self.input_series[0].current_time(), self.input_series[1].current_time()))
+        self.add(timestamp=timestamp, data={Indicator.VALUE: self.input_series[0].now(Indicator.VALUE) -
+                                                             self.input_series[1].now(Indicator.VALUE)})
+
+
+class IndicatorGraphTest(TestCase):
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.graph = self.app_context.inst_data_mgr.graph
+        self.bar = self.app_context.inst_data_mgr.get_series("bar")
+        self.bar.start(self.app_context)
+
+    def add_bars(self, count):
+        closes = np.random.RandomState(0).uniform(50, 150, count)
+        for t, close in enumerate(closes):
+            self.bar.add(timestamp=t, data={"high": close + 2.0, "low": close - 2.0, "close": close})
+        return closes
+
+    def test_get_or_create(self):
+        sma = self.graph.get_or_create(self.app_context, SMA, inputs=self.bar, input_keys='close', length=5)
+        self.assertTrue(sma.started)
+        self.assertIs(sma, self.graph.get_or_create(self.app_context, SMA, inputs='bar', input_keys='close',
+                                                    length=5))
+        self.assertIs(sma, self.graph.get_node("SMA(bar[close],length=5)"))
+
+        bb = BB(inputs=self.bar, input_keys='close', length=5)
+        bb.start(self.app_context)
+        self.assertEqual(2, self.graph.get_rank(bb))
+        self.assertEqual(1, self.graph.get_rank(sma))
+        self.assertEqual(0, self.graph.get_rank(self.bar))
+
+        self.add_bars(10)
+        # the SMA of the bands is the same node
+        self.assertEqual(10, sma.size())
+        np.testing.assert_array_equal(sma.get_by_idx(slice(None), 'value'), bb.get_by_idx(slice(None), 'value'))
+
+    def test_topological_order(self):
+        # started before the indicators it reads, it still runs after them
+        bb = BB(inputs=self.bar, input_keys='close', length=5, num_std=2)
+        bb.start(self.app_context)
+        closes = self.add_bars(30)
+
+        for pos in range(4, 30):
+            window = closes[pos - 4:pos + 1]
+            self.assertAlmostEqual(np.mean(window) + 2 * np.std(window), bb.get_by_idx(pos, BB.UPPER))
+            self.assertAlmostEqual(np.mean(window) - 2 * np.std(window), bb.get_by_idx(pos, BB.LOWER))
+
+    def test_diamond(self):
+        sma = SMA(inputs=self.bar, input_keys='close', length=3)
+        std = STD(inputs=self.bar, input_keys='close', length=3)
+        spread = Spread(inputs=[sma, std])
+        # inputs started after their dependent are moved ahead of it
+        spread.start(self.app_context)
+        sma.start(self.app_context)
+        std.start(self.app_context)
+
+        self.add_bars(10)
+        self.assertEqual(2, self.graph.get_rank(spread))
+        for timestamp, sma_time, std_time in spread.seen:
+            self.assertEqual(timestamp, sma_time)
+            self.assertEqual(timestamp, std_time)
+        np.testing.assert_almost_equal(np.array(sma.get_by_idx(slice(None), 'value')) -
+                                       np.array(std.get_by_idx(slice(None), 'value')),
+                                       spread.get_by_idx(slice(-10, None), 'value'))
+
+    def test_atr(self):
+        atr = ATR(inputs=self.bar, length=3)
+        atr.start(self.app_context)
+        closes = self.add_bars(20)
+
+        true_range = self.graph.get_node("TrueRange(bar[high,low,close])")
+        expected = [4.0] + [max(4.0, abs(closes[pos] - closes[pos - 1]) + 2.0) for pos in range(1, 20)]
+        np.testing.assert_almost_equal(expected, true_range.get_by_idx(slice(None), 'value'))
+        self.assertTrue(np.isnan(atr.get_by_idx(1, 'value')))
+        np.testing.assert_almost_equal([np.mean(expected[pos - 2:pos + 1]) for pos in range(2, 20)],
+                                       atr.get_by_idx(slice(2, None), 'value'))
+
+        # a second ATR over a longer history reuses the true range and backfills from it
+        atr5 = ATR(inputs=self.bar, length=5)
+        atr5.start(self.app_context)
+        self.assertIs(true_range, self.graph.get_node("TrueRange(bar[high,low,close])"))
+        np.testing.assert_almost_equal([np.mean(expected[pos - 4:pos + 1]) for pos in range(4, 20)],
+                                       atr5.get_by_idx(slice(4, None), 'value'))
+
+    def test_backfill_from_shared_node_with_longer_history(self):
+        sma = self.graph.get_or_create(self.app_context, SMA, inputs=self.bar, input_keys='close', length=5)
+        std = self.graph.get_or_create(self.app_context, STD, inputs=self.bar, input_keys='close', length=5)
+        closes = self.add_bars(30)
+        self.bar.set_retention(max_length=10)
+        self.assertEqual(20, self.bar.get_timestamp()[0])
+
+        # the shared nodes still start at the first bar, the bands are read at the timestamps of the bars
+        bb = BB(inputs=self.bar, input_keys='close', length=5, num_std=2)
+        bb.start(self.app_context)
+        np.testing.assert_array_equal(sma.get_by_idx(slice(20, 30), 'value'), bb.get_by_idx(slice(None), 'value'))
+        for pos in range(20, 30):
+            window = closes[pos - 4:pos + 1]
+            self.assertAlmostEqual(np.mean(window) + 2 * np.std(window), bb.get_by_time(pos, BB.UPPER))
+        self.assertEqual(30, std.size())
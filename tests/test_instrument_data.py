@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase
 
 from algotrader.model.model_factory import *
@@ -35,6 +37,46 @@ class InstrumentDataTest(TestCase):
         trade = self.inst_data_mgr.get_trade("1")
         self.assertEqual(trade1, trade)
 
+    def test_apply_retention(self):
+        self.inst_data_mgr.series_max_length = 2
+        series = self.inst_data_mgr.get_series("Trade.1")
+        self.assertEqual(2, series.get_int_config("max_length"))
+
+        for t in range(5):
+            self.inst_data_mgr.on_trade(ModelFactory.build_trade(timestamp=t, inst_id="1", price=20 + t, size=200))
+        self.assertEqual(2, series.size())
+        self.assertEqual(24, series.now("price"))
+        self.assertEqual(23, series.ago(1, "price"))
+
+    def test_preload_series(self):
+        series = self.inst_data_mgr.preload_series("Bar.1.Time.86400", [0, 1, 2],
+                                                   {"close": [20.0, 20.5, 21.0], "vol": [100, 200, 300]})
+        self.assertIs(series, self.inst_data_mgr.get_series("Bar.1.Time.86400"))
+        self.assertEqual(3, series.size())
+
+        self.inst_data_mgr.on_bar(ModelFactory.build_bar(timestamp=3, inst_id="1", type=Bar.Time, size=86400,
+                                                         open=21, high=22, low=20, close=21.5, vol=400))
+        self.assertEqual(4, series.size())
+        self.assertEqual(21.5, series.now("close"))
+        self.assertEqual(21.0, series.ago(1, "close"))
+
+    def test_get_memmap_series(self):
+        with tempfile.TemporaryDirectory() as root:
+            self.inst_data_mgr.series_memmap_path = root
+            series = self.inst_data_mgr.get_series("Trade.1", memmap=True)
+            self.assertTrue(series.is_memmap())
+            for t in range(3):
+                self.inst_data_mgr.on_trade(ModelFactory.build_trade(timestamp=t, inst_id="1", price=20 + t, size=200))
+            self.inst_data_mgr.save_all()
+
+            inst_data_mgr = InstrumentDataManager()
+            inst_data_mgr.series_memmap_path = root
+            opened = inst_data_mgr.get_series("Trade.1")
+            self.assertTrue(opened.is_memmap())
+            self.assertEqual(3, opened.size())
+            self.assertEqual(22, opened.now("price"))
+            self.assertFalse(inst_data_mgr.get_series("Trade.2").is_memmap())
+
     def get_latest_price(self):
         price = self.inst_data_mgr.get_latest_price(1)
         self.assertIsNone(price)
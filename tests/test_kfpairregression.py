@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+from pykalman import KalmanFilter
+from unittest import TestCase
+
+from algotrader.technical.kfpairregression import BatchKalmanRegression, KalmanFilteringPairRegression, \
+    KalmanRegression
+from algotrader.trading.context import ApplicationContext
+
+
+class KalmanPairRegressionTest(TestCase):
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        random = np.random.RandomState(0)
+        self.x = np.cumsum(random.normal(0, 1, 200)) + 50
+        self.y = 1.5 * self.x + 3 + random.normal(0, 0.5, 200)
+
+    def pykalman_state_means(self, x, y):
+        delta = 1e-5
+        obs_mat = np.vstack([x, np.ones(x.shape)]).T[:, np.newaxis]
+        model = KalmanFilter(n_dim_obs=1, n_dim_state=2,
+                             initial_state_mean=np.zeros(2),
+                             initial_state_covariance=np.ones((2, 2)),
+                             transition_matrices=np.eye(2),
+                             observation_matrices=obs_mat,
+                             observation_covariance=1.0,
+                             transition_covariance=delta / (1 - delta) * np.eye(2))
+        state_means, state_covs = model.filter(y)
+        return state_means
+
+    def test_matches_pykalman(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        kf = KalmanFilteringPairRegression(inputs=bar, input_keys=['x', 'y'], length=10)
+        kf.start(self.app_context)
+
+        for t in range(len(self.x)):
+            bar.add(timestamp=t, data={"x": self.x[t], "y": self.y[t]})
+
+        state_means = self.pykalman_state_means(self.x, self.y)
+        self.assertTrue(math.isnan(kf.get_by_idx(8, 'slope')))
+        np.testing.assert_almost_equal(state_means[9:, 0], kf.get_by_idx(slice(9, None), 'slope'))
+        np.testing.assert_almost_equal(state_means[9:, 1], kf.get_by_idx(slice(9, None), 'intercept'))
+        np.testing.assert_almost_equal(state_means[9:, 0], kf.get_by_idx(slice(9, None), 'value'))
+
+    def test_replace(self):
+        kernel = KalmanRegression()
+        for x, y in zip(self.x[:20], self.y[:20]):
+            kernel.update(x, y)
+        kernel.update(1.0, 1.0)
+        kernel.replace(self.x[20], self.y[20])
+
+        state_means = self.pykalman_state_means(self.x[:21], self.y[:21])
+        self.assertAlmostEqual(state_means[-1, 0], kernel.get_slope())
+        self.assertEqual(21, kernel.get_steps())
+
+    def test_batch(self):
+        xs = np.vstack([self.x, self.x * 2, self.x + 10])
+        ys = np.vstack([self.y, self.y * 0.5, self.y])
+        xs[1, 30] = np.nan
+
+        batch = BatchKalmanRegression(3)
+        kernels = [KalmanRegression() for _ in range(3)]
+        for t in range(xs.shape[1]):
+            batch.update(xs[:, t], ys[:, t])
+            for kernel, x, y in zip(kernels, xs[:, t], ys[:, t]):
+                kernel.update(x, y)
+
+        np.testing.assert_almost_equal([kernel.get_slope() for kernel in kernels], batch.slope)
+        np.testing.assert_almost_equal([kernel.get_intercept() for kernel in kernels], batch.intercept)
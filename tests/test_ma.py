@@ -89,3 +89,83 @@ class MovingAverageTest(TestCase):
         self.assertEquals(2.4, sma.get_by_time(t3, 'value'))
         self.assertEquals(2.8, sma.get_by_time(t4, 'value'))
         self.assertEquals(3.2, sma.get_by_time(t5, 'value'))
+
+    def test_attach_to_existing_history(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+
+        for t, close in enumerate([2.0, 2.4, 2.8, 3.2]):
+            bar.add(timestamp=t, data={"close": close, "open": 0})
+
+        sma = SMA(inputs=bar, input_keys='close', length=3)
+        sma.start(self.app_context)
+
+        self.assertEquals(4, sma.size())
+        self.assertTrue(math.isnan(sma.get_by_idx(0, 'value')))
+        self.assertTrue(math.isnan(sma.get_by_idx(1, 'value')))
+        self.assertEquals(2.4, sma.get_by_idx(2, 'value'))
+        self.assertEquals(2.8, sma.now('value'))
+
+        bar.add(timestamp=4, data={"close": 3.6, "open": 0})
+        self.assertEquals(5, sma.size())
+        self.assertEquals(3.2, sma.now('value'))
+
+    def test_nan_in_window(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+
+        sma = SMA(inputs=bar, input_keys='close', length=2)
+        sma.start(self.app_context)
+
+        for t, close in enumerate([1.0, np.nan, 3.0, 5.0]):
+            bar.add(timestamp=t, data={"close": close})
+
+        self.assertTrue(math.isnan(sma.get_by_idx(1, 'value')))
+        self.assertTrue(math.isnan(sma.get_by_idx(2, 'value')))
+        self.assertEquals(4.0, sma.now('value'))
+
+    def test_update_last_bar(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+
+        sma = SMA(inputs=bar, input_keys='close', length=2)
+        sma.start(self.app_context)
+
+        bar.add(timestamp=1, data={"close": 1.0})
+        bar.add(timestamp=2, data={"close": 2.0})
+        bar.add(timestamp=2, data={"close": 4.0})
+        self.assertEquals(2, sma.size())
+        self.assertEquals(2.5, sma.now('value'))
+
+        bar.add(timestamp=3, data={"close": 6.0})
+        self.assertEquals(5.0, sma.now('value'))
+
+    def test_matches_rolling_mean(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+
+        sma = SMA(inputs=bar, input_keys='close', length=5)
+        sma.start(self.app_context)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 200)
+        for t, close in enumerate(closes):
+            bar.add(timestamp=t, data={"close": close})
+
+        expected = np.convolve(closes, np.ones(5) / 5, mode='valid')
+        np.testing.assert_almost_equal(expected, sma.get_by_idx(slice(4, None), 'value'), 8)
+
+    def test_resume(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        for t, close in enumerate([2.0, 2.4, 2.8, 3.2]):
+            bar.add(timestamp=t, data={"close": close})
+
+        sma = SMA(inputs=bar, input_keys='close', length=3)
+        sma.start(self.app_context)
+        sma.stop()
+
+        restored = SMA(time_series=sma.sync_time_series(), inputs=bar, input_keys='close', length=3)
+        bar.add(timestamp=4, data={"close": 3.6})
+        restored.start(self.app_context)
+        self.assertEquals(5, restored.size())
+        self.assertEquals(3.2, restored.now('value'))
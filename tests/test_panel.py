@@ -0,0 +1,146 @@
+import numpy as np
+from unittest import TestCase
+
+from algotrader.model.time_series_pb2 import TimeSeries
+from algotrader.technical.ma import SMA
+from algotrader.technical.panel import PanelMAX, PanelMIN, PanelROC, PanelRSI, PanelSMA, PanelSTD
+from algotrader.technical.roc import ROC
+from algotrader.technical.stats import MAX, MIN, STD
+from algotrader.trading.context import ApplicationContext
+
+
+class PanelTest(TestCase):
+    names = ["Bar.A.Time.86400", "Bar.B.Time.86400", "Bar.C.Time.86400"]
+
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.bars = [self.app_context.inst_data_mgr.get_series(name) for name in self.names]
+        for bar in self.bars:
+            bar.start(self.app_context)
+        self.closes = np.cumsum(np.random.RandomState(0).normal(0, 2.0, (60, 3)), axis=0) + 100
+
+    def add_bars(self, start, end):
+        for t in range(start, end):
+            for idx, bar in enumerate(self.bars):
+                bar.add(timestamp=t, data={"close": self.closes[t, idx]})
+
+    def test_name_and_views(self):
+        sma = PanelSMA(inputs=self.names, input_keys='close', length=5)
+        sma.start(self.app_context)
+        self.assertEqual("PanelSMA(Bar.A.Time.86400[close],Bar.B.Time.86400[close],Bar.C.Time.86400[close],length=5)",
+                         sma.name)
+        self.add_bars(0, 10)
+
+        view = sma.get_series("Bar.B.Time.86400")
+        self.assertEqual("SMA(Bar.B.Time.86400[close],length=5)", view.name)
+        self.assertIs(view, self.app_context.inst_data_mgr.get_series("SMA(Bar.B.Time.86400[close],length=5)"))
+        self.assertIs(view, sma.get_series(1))
+        self.add_bars(10, 20)
+        self.assertEqual(20, view.size())
+        np.testing.assert_array_equal(sma.get_by_idx(slice(None), "Bar.B.Time.86400"),
+                                      view.get_by_idx(slice(None), 'value'))
+        np.testing.assert_array_equal(sma.now_values(), [sma.now(name) for name in self.names])
+
+    def test_same_as_single_instrument_indicators(self):
+        panels = [PanelSMA(inputs=self.names, input_keys='close', length=5),
+                  PanelSTD(inputs=self.names, input_keys='close', length=5),
+                  PanelMAX(inputs=self.names, input_keys='close', length=5),
+                  PanelMIN(inputs=self.names, input_keys='close', length=5),
+                  PanelROC(inputs=self.names, input_keys='close', length=3)]
+        singles = []
+        for name, bar in zip(self.names, self.bars):
+            singles.append([SMA(inputs=bar, input_keys='close', length=5), STD(inputs=bar, input_keys='close', length=5),
+                            MAX(inputs=bar, input_keys='close', length=5), MIN(inputs=bar, input_keys='close', length=5),
+                            ROC(inputs=bar, input_keys='close', length=3)])
+        # panels started on history, the single instrument ones streaming
+        self.add_bars(0, 30)
+        for panel in panels:
+            panel.start(self.app_context)
+        for indicators in singles:
+            for indicator in indicators:
+                indicator.start(self.app_context)
+        self.add_bars(30, 60)
+
+        for idx, name in enumerate(self.names):
+            for panel, single in zip(panels, singles[idx]):
+                self.assertEqual(60, panel.size())
+                np.testing.assert_almost_equal(single.get_by_idx(slice(None), 'value'),
+                                               panel.get_by_idx(slice(None), name), err_msg=single.name)
+
+    def test_rsi(self):
+        rsi = PanelRSI(inputs=self.names, input_keys='close', length=5)
+        rsi.start(self.app_context)
+        self.add_bars(0, 60)
+
+        for idx, name in enumerate(self.names):
+            changes = np.diff(self.closes[:, idx])
+            gains = np.where(changes > 0, changes, 0.0)
+            losses = np.where(changes < 0, -changes, 0.0)
+            avg_gain = gains[:5].mean()
+            avg_loss = losses[:5].mean()
+            expected = [np.nan] * 5 + [100 - 100 / (1 + avg_gain / avg_loss)]
+            for pos in range(5, 59):
+                avg_gain = (avg_gain * 4 + gains[pos]) / 5.0
+                avg_loss = (avg_loss * 4 + losses[pos]) / 5.0
+                expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+            np.testing.assert_almost_equal(expected, rsi.get_by_idx(slice(None), name))
+
+    def test_missing_and_updated_rows(self):
+        sma = PanelSMA(inputs=self.names, input_keys='close', length=2)
+        sma.start(self.app_context)
+
+        for t, values in enumerate([[1.0, 2.0, 3.0], [3.0, 4.0, 5.0]]):
+            for bar, value in zip(self.bars, values):
+                bar.add(timestamp=t, data={"close": value})
+        np.testing.assert_array_equal([2.0, 3.0, 4.0], sma.now_values())
+
+        # the latest row is recomputed in place
+        self.bars[1].add(timestamp=1, data={"close": 8.0})
+        self.assertEqual(2, sma.size())
+        np.testing.assert_array_equal([2.0, 5.0, 4.0], sma.now_values())
+
+        # B has no bar at 2, the row is computed when A moves on
+        self.bars[0].add(timestamp=2, data={"close": 5.0})
+        self.bars[2].add(timestamp=2, data={"close": 7.0})
+        self.assertEqual(2, sma.size())
+        self.bars[0].add(timestamp=3, data={"close": 7.0})
+        self.assertEqual(3, sma.size())
+        self.assertEqual(4.0, sma.get_by_idx(2, "Bar.A.Time.86400"))
+        self.assertTrue(np.isnan(sma.get_by_idx(2, "Bar.B.Time.86400")))
+        sma.flush()
+        self.assertEqual(6.0, sma.now("Bar.A.Time.86400"))
+
+    def test_restore_state(self):
+        panels = [PanelSMA(inputs=self.names, input_keys='close', length=5),
+                  PanelRSI(inputs=self.names, input_keys='close', length=5),
+                  PanelMAX(inputs=self.names, input_keys='close', length=5)]
+        for panel in panels:
+            panel.start(self.app_context)
+        self.add_bars(0, 40)
+        saved = []
+        for panel in panels:
+            time_series = TimeSeries()
+            time_series.CopyFrom(panel.sync_time_series())
+            saved.append(time_series)
+
+        # restart without the input history
+        restarted = ApplicationContext()
+        bars = [restarted.inst_data_mgr.get_series(name) for name in self.names]
+        for bar in bars:
+            bar.start(restarted)
+        restored = [panel.__class__(time_series=time_series) for panel, time_series in zip(panels, saved)]
+        for panel in restored:
+            panel.start(restarted)
+            self.assertEqual(40, panel.size())
+
+        # the latest row updated after the restart, then new rows
+        self.bars[1].add(timestamp=39, data={"close": 90.0})
+        bars[1].add(timestamp=39, data={"close": 90.0})
+        self.add_bars(40, 60)
+        for t in range(40, 60):
+            for idx, bar in enumerate(bars):
+                bar.add(timestamp=t, data={"close": self.closes[t, idx]})
+        for panel, restored_panel in zip(panels, restored):
+            for name in self.names:
+                np.testing.assert_array_equal(panel.get_by_idx(slice(39, None), name),
+                                              restored_panel.get_by_idx(slice(39, None), name))
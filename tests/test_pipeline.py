@@ -1,13 +1,14 @@
 import numpy as np
+import pandas as pd
 from unittest import TestCase
 
 from algotrader.technical import Indicator
 from algotrader.technical.pipeline import PipeLine
-from algotrader.technical.pipeline.cross_sessional_apply import Average, Abs, Tail, Sign, DecayLinear, Scale
+from algotrader.technical.pipeline.cross_sessional_apply import Average, Abs, Tail, Sign, DecayLinear, Scale, TsRank
 from algotrader.technical.pipeline.cross_sessional_apply import Sum as GSSum
 from algotrader.technical.pipeline.make_vector import MakeVector
 from algotrader.technical.pipeline.pairwise import Minus
-from algotrader.technical.pipeline.rank import Rank
+from algotrader.technical.pipeline.rank import Rank, rank_last, rankdata
 from algotrader.technical.talib_wrapper import SMA
 from algotrader.trading.context import ApplicationContext
 
@@ -91,7 +92,7 @@ class PipelineTest(TestCase):
         try:
             np.testing.assert_almost_equal(np.array([1, 3]), rank.shape(), 5)
         except AssertionError as e:
-            self.fail(e.message)
+            self.fail(str(e))
 
     def test_with_spread(self):
         bar0 = self.app_context.inst_data_mgr.get_series("bar0")
@@ -103,7 +104,7 @@ class PipelineTest(TestCase):
         try:
             np.testing.assert_almost_equal(target, output, precision)
         except AssertionError as e:
-            self.fail(e.message)
+            self.fail(str(e))
 
     def test_sync(self):
         bar0 = self.app_context.inst_data_mgr.get_series("bar0")
@@ -143,18 +144,18 @@ class PipelineTest(TestCase):
 
         t1 = 1
         bar0.add(data={"timestamp": t1, "close": 80.0, "open": 0})
-        self.__np_assert_almost_equal(nan_arr, basket.now()["value"])
+        self.__np_assert_almost_equal(nan_arr, basket.now("value"))
 
         bar1.add(data={"timestamp": t1, "close": 95.0, "open": 0})
-        self.__np_assert_almost_equal(nan_arr, basket.now()["value"])
+        self.__np_assert_almost_equal(nan_arr, basket.now("value"))
 
         bar2.add(data={"timestamp": t1, "close": 102.0, "open": 0})
-        self.__np_assert_almost_equal(nan_arr, basket.now()["value"])
+        self.__np_assert_almost_equal(nan_arr, basket.now("value"))
 
         sync_vec = np.array([[80.0, 95.0, 102.0, 105.0]])
 
         bar3.add(data={"timestamp": t1, "close": 105.0, "open": 0})
-        self.__np_assert_almost_equal(sync_vec, basket.now()["value"])
+        self.__np_assert_almost_equal(sync_vec, basket.now("value"))
 
         bar4.add(data={"timestamp": t1, "close": 102.0, "open": 0})
         bar5.add(data={"timestamp": t1, "close": 95.0, "open": 0})
@@ -162,11 +163,11 @@ class PipelineTest(TestCase):
         bar7.add(data={"timestamp": t1, "close": 101.0, "open": 0})
 
         sync_vec2 = np.array([[102.0, 95.0, 107.0, 101.0]])
-        self.__np_assert_almost_equal(sync_vec2, basket2.now()["value"])
+        self.__np_assert_almost_equal(sync_vec2, basket2.now("value"))
 
         target_spread = np.array([[22.0, 0.0, 5.0, -4.0]])
-        self.__np_assert_almost_equal(target_spread, cross_basket_spread.now()["value"])
-        self.__np_assert_almost_equal(sync_vec, basket.now()["value"])
+        self.__np_assert_almost_equal(target_spread, cross_basket_spread.now("value"))
+        self.__np_assert_almost_equal(sync_vec, basket.now("value"))
 
     # def test_nan_before_size(self):
     def test_with_multiple_bar(self):
@@ -222,7 +223,7 @@ class PipelineTest(TestCase):
         scale_target = bar_t1_array / np.sum(bar_t1_array)
         scale_target = scale_target.reshape(1, 4)
 
-        self.__np_assert_almost_equal(abs_target, absv.now()["value"])
+        self.__np_assert_almost_equal(abs_target, absv.now("value"))
         self.__np_assert_almost_equal(rank_target, rank.get_data()[0]["value"], 5)
         self.__np_assert_almost_equal(avg_target, avg.get_data()[0]["value"], 5)
         self.__np_assert_almost_equal(sum_target, gssum.get_data()[0]["value"], 5)
@@ -288,3 +289,58 @@ class PipelineTest(TestCase):
         bar0.add(data={"timestamp": t, "close": 90.0, "open": 0})
         bar1.add(data={"timestamp": t, "close": 95.0, "open": 0})
         print(rank.now(keys=PipeLine.VALUE))
+
+    def test_cache(self):
+        bars = [self.app_context.inst_data_mgr.get_series("bar%s" % idx) for idx in range(3)]
+        for bar in bars:
+            bar.start(self.app_context)
+        decaylinear = DecayLinear(inputs=bars, input_keys='close', length=2)
+        basket = MakeVector(inputs=bars, input_keys='close')
+        decaylinear.start(self.app_context)
+        basket.start(self.app_context)
+
+        bars[0].add(timestamp=1, data={"close": 1.0})
+        bars[1].add(timestamp=1, data={"close": 2.0})
+        self.assertFalse(basket.all_filled())
+        bars[2].add(timestamp=1, data={"close": 3.0})
+        self.assertTrue(basket.all_filled())
+        self.assertTrue(basket.is_full())
+        self.assertFalse(decaylinear.is_full())
+        self.assertEqual((3, 2), decaylinear.cache.shape)
+        self.__np_assert_almost_equal(np.array([[1.0, 2.0, 3.0]]), basket.now(PipeLine.VALUE))
+
+        for idx, bar in enumerate(bars):
+            bar.add(timestamp=2, data={"close": 10.0 + idx})
+        # update of the latest value in place
+        bars[1].add(timestamp=2, data={"close": 20.0})
+        self.__np_assert_almost_equal(np.array([[1.0, 10.0], [2.0, 20.0], [3.0, 12.0]]), decaylinear.cache)
+        self.__np_assert_almost_equal(np.array([[10.0, 20.0, 12.0]]), basket.now(PipeLine.VALUE))
+        self.__np_assert_almost_equal(np.array([[1.0, 2.0, 3.0]]), basket.get_by_idx(0, PipeLine.VALUE))
+        self.__np_assert_almost_equal((np.array([1.0, 2.0, 3.0]) * 2 + np.array([10.0, 20.0, 12.0])) / 3.0,
+                                      decaylinear.now(PipeLine.VALUE))
+
+    def test_rankdata(self):
+        values = np.random.RandomState(0).randint(0, 6, (20, 30)).astype(np.float64)
+        values[values == 5] = np.nan
+        for ascending in [True, False]:
+            df = pd.DataFrame(values)
+            np.testing.assert_array_equal(df.rank(axis=1, ascending=ascending).values,
+                                          rankdata(values, ascending=ascending))
+            np.testing.assert_array_equal(df.rank(axis=0, ascending=ascending).values[-1],
+                                          rank_last(values, ascending=ascending))
+
+    def test_rank_and_ts_rank(self):
+        bars = [self.app_context.inst_data_mgr.get_series("bar%s" % idx) for idx in range(4)]
+        for bar in bars:
+            bar.start(self.app_context)
+        rank = Rank(inputs=bars, input_keys='close', ascending=False)
+        ts_rank = TsRank(inputs=bars, input_keys='close', length=3)
+        rank.start(self.app_context)
+        ts_rank.start(self.app_context)
+
+        closes = np.array([[3.0, 1.0, 2.0, 2.0], [1.0, 1.0, 4.0, 5.0], [2.0, 1.0, 3.0, 9.0]])
+        for t, row in enumerate(closes):
+            for bar, close in zip(bars, row):
+                bar.add(timestamp=t, data={"close": close})
+        self.__np_assert_almost_equal(np.array([[2.0, 3.0, 1.0, 0.0]]) / 3.0, rank.now(PipeLine.VALUE))
+        self.__np_assert_almost_equal(np.array([[0.5, 0.5, 0.5, 1.0]]), ts_rank.now(PipeLine.VALUE))
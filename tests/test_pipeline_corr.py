@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from unittest import TestCase
+
+from algotrader.technical.pipeline import PipeLine
+from algotrader.technical.pipeline.corr import Corr, Cov
+from algotrader.technical.pipeline.pairwise import PairCorrelation
+from algotrader.trading.context import ApplicationContext
+
+
+class CorrTest(TestCase):
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.bars = [self.app_context.inst_data_mgr.get_series("bar%s" % idx) for idx in range(4)]
+        for bar in self.bars:
+            bar.start(self.app_context)
+        random = np.random.RandomState(0)
+        self.closes = np.cumsum(random.normal(0, 1.0, (80, 4)), axis=0) + 100
+        self.closes[:, 1] += 0.5 * self.closes[:, 0]
+
+    def add_bars(self, start, end):
+        for t in range(start, end):
+            for idx, bar in enumerate(self.bars):
+                bar.add(timestamp=t, data={"close": self.closes[t, idx]})
+
+    def test_rolling(self):
+        self.closes[[30, 31], 2] = np.nan
+        corr = Corr(inputs=self.bars, input_keys='close', length=10)
+        cov = Cov(inputs=self.bars, input_keys='close', length=10)
+        corr.start(self.app_context)
+        cov.start(self.app_context)
+        self.add_bars(0, 80)
+
+        df = pd.DataFrame(self.closes)
+        self.assertTrue(np.isnan(corr.get_by_idx(8, PipeLine.VALUE)).all())
+        for t in [9, 30, 35, 79]:
+            window = df.iloc[t - 9:t + 1]
+            np.testing.assert_almost_equal(window.corr(min_periods=2).values, corr.get_by_idx(t, PipeLine.VALUE))
+            np.testing.assert_almost_equal(window.cov(min_periods=2).values, cov.get_by_idx(t, PipeLine.VALUE))
+
+        # update of the latest row
+        self.bars[3].add(timestamp=79, data={"close": 50.0})
+        window = df.iloc[70:80].copy()
+        window.iloc[-1, 3] = 50.0
+        np.testing.assert_almost_equal(window.corr().values, corr.now(PipeLine.VALUE))
+        self.assertEqual(80, corr.size())
+
+    def test_ewm(self):
+        corr = Corr(inputs=self.bars, input_keys='close', length=5, span=10)
+        cov = Cov(inputs=self.bars, input_keys='close', length=5, span=10)
+        self.assertEqual("Corr(bar0[close],bar1[close],bar2[close],bar3[close],length=5,span=10)", corr.name)
+        corr.start(self.app_context)
+        cov.start(self.app_context)
+        self.add_bars(0, 80)
+
+        ewm = pd.DataFrame(self.closes).ewm(span=10)
+        expected_corr = ewm.corr().values.reshape(80, 4, 4)
+        expected_cov = ewm.cov().values.reshape(80, 4, 4)
+        self.assertTrue(np.isnan(corr.get_by_idx(3, PipeLine.VALUE)).all())
+        for t in [4, 40, 79]:
+            np.testing.assert_almost_equal(expected_corr[t], corr.get_by_idx(t, PipeLine.VALUE))
+            np.testing.assert_almost_equal(expected_cov[t], cov.get_by_idx(t, PipeLine.VALUE))
+
+    def test_pair_correlation(self):
+        pcorr = PairCorrelation(inputs=self.bars[:2], input_keys='close', length=20)
+        pcorr.start(self.app_context)
+        self.add_bars(0, 80)
+        for t in [19, 50, 79]:
+            self.assertAlmostEqual(np.corrcoef(self.closes[t - 19:t + 1, 0], self.closes[t - 19:t + 1, 1])[0, 1],
+                                   pcorr.get_by_idx(t, PipeLine.VALUE))
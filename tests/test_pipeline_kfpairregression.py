@@ -0,0 +1,52 @@
+import numpy as np
+from unittest import TestCase
+
+from algotrader.technical.kfpairregression import KalmanFilteringPairRegression, KalmanRegression
+from algotrader.technical.pipeline import PipeLine
+from algotrader.technical.pipeline.kfpairregression import KalmanPairRegression
+from algotrader.trading.context import ApplicationContext
+
+
+class KalmanPairRegressionPipeLineTest(TestCase):
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.bars = [self.app_context.inst_data_mgr.get_series("bar%s" % idx) for idx in range(3)]
+        for bar in self.bars:
+            bar.start(self.app_context)
+        random = np.random.RandomState(0)
+        self.closes = np.cumsum(random.normal(0, 1.0, (60, 3)), axis=0) + 50
+        self.closes[:, 1] = 1.5 * self.closes[:, 0] + 3 + random.normal(0, 0.5, 60)
+
+    def add_bars(self, start, end):
+        for t in range(start, end):
+            for idx, bar in enumerate(self.bars):
+                bar.add(timestamp=t, data={"close": self.closes[t, idx]})
+
+    def test_pairs(self):
+        self.closes[30, 2] = np.nan
+        regression = KalmanPairRegression(inputs=self.bars, input_keys='close', length=10)
+        regression.start(self.app_context)
+        self.add_bars(0, 60)
+
+        self.assertEqual(60, regression.size())
+        self.assertTrue(np.isnan(regression.get_by_idx(8, PipeLine.VALUE)).all())
+        kernels = [[KalmanRegression() for _ in range(3)] for _ in range(3)]
+        for t in range(60):
+            for i in range(3):
+                for j in range(3):
+                    kernels[i][j].update(self.closes[t, i], self.closes[t, j])
+        np.testing.assert_almost_equal([[kernel.get_slope() for kernel in row] for row in kernels],
+                                       regression.now(KalmanFilteringPairRegression.SLOPE))
+        np.testing.assert_almost_equal([[kernel.get_intercept() for kernel in row] for row in kernels],
+                                       regression.now(KalmanFilteringPairRegression.INTERCEPT))
+
+        # update of the latest row
+        self.bars[0].add(timestamp=59, data={"close": 40.0})
+        closes = self.closes[59].copy()
+        closes[0] = 40.0
+        for i in range(3):
+            for j in range(3):
+                kernels[i][j].replace(closes[i], closes[j])
+        np.testing.assert_almost_equal([[kernel.get_slope() for kernel in row] for row in kernels],
+                                       regression.now(PipeLine.VALUE))
+        self.assertEqual(60, regression.size())
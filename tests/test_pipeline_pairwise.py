@@ -80,7 +80,7 @@ class PairwiseTest(TestCase):
         now = 1
         x = np.array([80.0, 102.0, 101.0, 99.0])
         y = np.array([95.0, 98.0, 105.2, 103.3])
-        ts = [now + 3 for i in range(4)]
+        ts = [now + i for i in range(4)]
         x_p_y = x + y
         x_m_y = x - y
         x_t_y = x * y
@@ -108,4 +108,4 @@ class PairwiseTest(TestCase):
         bar0.add(data={"timestamp": ts[3], "close": x[3], "open": 0})
         bar1.add(data={"timestamp": ts[3], "close": y[3], "open": 0})
 
-        self.assertEqual(pcorr.now('value'), np.corrcoef(x, y)[0, 1])
+        self.assertAlmostEqual(pcorr.now('value'), np.corrcoef(x, y)[0, 1])
@@ -1,7 +1,8 @@
 import numpy as np
+import pandas as pd
 from unittest import TestCase
 
-from algotrader.technical.rolling_apply import StdDev
+from algotrader.technical.rolling_apply import Kurt, RollingApply, Skew, StdDev
 from algotrader.trading.context import ApplicationContext
 
 
@@ -57,6 +58,118 @@ class RollingApplyTest(TestCase):
                            {'value': np.std(ts)}],
                           stddev.get_data())
 
+    def add_bars(self, bar, closes):
+        for t, close in enumerate(closes):
+            bar.add(timestamp=t, data={"close": close})
+
+    def test_skew_and_kurt(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        skew = Skew(inputs=bar, input_keys='close', length=20)
+        skew.start(self.app_context)
+        kurt = Kurt(inputs=bar, input_keys='close', length=20)
+        kurt.start(self.app_context)
+        self.assertEqual("Skew(bar[close],length=20)", skew.name)
+
+        closes = np.cumsum(np.random.RandomState(0).normal(0, 2.0, 200)) + 100
+        self.add_bars(bar, closes)
+
+        self.assertTrue(np.isnan(skew.get_by_idx(18, 'value')))
+        windows = [pd.Series(closes[pos - 19:pos + 1]) for pos in range(19, len(closes))]
+        np.testing.assert_almost_equal([w.skew() for w in windows], skew.get_by_idx(slice(19, None), 'value'))
+        np.testing.assert_almost_equal([w.kurt() for w in windows], kurt.get_by_idx(slice(19, None), 'value'))
+
+    def test_skew_and_kurt_of_flat_windows(self):
+        closes = np.concatenate((np.full(30, 101.3), np.random.RandomState(1).uniform(50, 150, 30), np.full(30, 77.7)))
+        closes[70] = np.nan
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        history.extend(timestamps=np.arange(80), columns={"close": closes[:80]})
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        pairs = []
+        for cls, flat_value in [(Skew, 0.0), (Kurt, -3.0)]:
+            backfilled = cls(inputs=history, input_keys='close', length=10)
+            backfilled.start(self.app_context)
+            streamed = cls(inputs=bar, input_keys='close', length=10)
+            streamed.start(self.app_context)
+            pairs.append((backfilled, streamed, flat_value))
+
+        self.add_bars(bar, closes)
+        for t in range(80, len(closes)):
+            history.add(timestamp=t, data={"close": closes[t]})
+        for backfilled, streamed, flat_value in pairs:
+            values = streamed.get_by_idx(slice(None), 'value')
+            np.testing.assert_almost_equal(values, backfilled.get_by_idx(slice(None), 'value'))
+            np.testing.assert_array_equal(np.full(21, flat_value), values[9:30])
+            np.testing.assert_array_equal(np.full(10, flat_value), values[80:])
+
+    def test_kernels(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        quantile = RollingApply(inputs=bar, input_keys='close', length=10, kernel='quantile', q=0.25)
+        quantile.start(self.app_context)
+        ewm = RollingApply(inputs=bar, input_keys='close', length=10, kernel='ewm')
+        ewm.start(self.app_context)
+        self.assertEqual("RollingApply(bar[close],length=10,kernel=quantile,q=0.25)", quantile.name)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 100)
+        closes[30] = np.nan
+        self.add_bars(bar, closes)
+
+        expected = pd.Series(closes).rolling(10, min_periods=1).quantile(0.25).values
+        np.testing.assert_almost_equal(expected[9:], quantile.get_by_idx(slice(9, None), 'value'))
+        expected = pd.Series(closes).ewm(span=10).mean().values
+        np.testing.assert_almost_equal(expected[9:], ewm.get_by_idx(slice(9, None), 'value'))
+
+        bar.add(timestamp=99, data={"close": 10.0})
+        closes[99] = 10.0
+        self.assertAlmostEqual(np.quantile(closes[90:], 0.25), quantile.now('value'))
+        self.assertAlmostEqual(pd.Series(closes).ewm(span=10).mean().values[-1], ewm.now('value'))
+
+    def test_ewm_after_backfill(self):
+        closes = np.random.RandomState(2).uniform(50, 150, 300)
+        closes[[3, 200]] = np.nan
+        history = self.app_context.inst_data_mgr.get_series("history")
+        history.start(self.app_context)
+        history.extend(timestamps=np.arange(290), columns={"close": closes[:290]})
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        backfilled = RollingApply(inputs=history, input_keys='close', length=10, kernel='ewm')
+        backfilled.start(self.app_context)
+        streamed = RollingApply(inputs=bar, input_keys='close', length=10, kernel='ewm')
+        streamed.start(self.app_context)
+        self.add_bars(bar, closes[:290])
+        np.testing.assert_array_equal(streamed.get_by_idx(slice(None), 'value'),
+                                      backfilled.get_by_idx(slice(None), 'value'))
+
+        # the kernel is seeded from the last row of the history, an update of that row then new rows
+        for input in [history, bar]:
+            input.add(timestamp=289, data={"close": 90.0})
+            for t in range(290, 300):
+                input.add(timestamp=t, data={"close": closes[t]})
+        self.assertEqual(300, backfilled.size())
+        np.testing.assert_array_equal(streamed.get_by_idx(slice(None), 'value'),
+                                      backfilled.get_by_idx(slice(None), 'value'))
+
+    def test_unknown_kernel(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        with self.assertRaises(AssertionError):
+            RollingApply(inputs=bar, input_keys='close', length=10, kernel='mode')
+
+    def test_func(self):
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        spread = RollingApply(inputs=bar, input_keys='close', length=5, func=lambda x: x.max() - x.min())
+        spread.start(self.app_context)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 50)
+        self.add_bars(bar, closes)
+
+        self.assertTrue(np.isnan(spread.get_by_idx(3, 'value')))
+        np.testing.assert_almost_equal([np.ptp(closes[pos - 4:pos + 1]) for pos in range(4, len(closes))],
+                                       spread.get_by_idx(slice(4, None), 'value'))
+
         # def test_moving_average_calculation(self):
         #     inst_data_mgr.clear()
         #     bar = inst_data_mgr.get_series("bar")
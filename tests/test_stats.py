@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+from unittest import TestCase
+
+from algotrader.technical.historical_volatility import HistoricalVolatility
+from algotrader.technical.stats import MAX, MIN, STD, VAR
+from algotrader.trading.context import ApplicationContext
+
+
+class StatsTest(TestCase):
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.bar = self.app_context.inst_data_mgr.get_series("bar")
+        self.bar.start(self.app_context)
+
+    def add_bars(self, closes):
+        for t, close in enumerate(closes):
+            self.bar.add(timestamp=t, data={"close": close})
+
+    def test_std_and_var(self):
+        std = STD(inputs=self.bar, input_keys='close', length=5)
+        std.start(self.app_context)
+        var = VAR(inputs=self.bar, input_keys='close', length=5)
+        var.start(self.app_context)
+        sample_std = STD(inputs=self.bar, input_keys='close', length=5, ddof=1)
+        sample_std.start(self.app_context)
+        self.assertEqual("STD(bar[close],length=5)", std.name)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 100)
+        self.add_bars(closes)
+
+        self.assertTrue(math.isnan(std.get_by_idx(3, 'value')))
+        windows = [closes[pos - 4:pos + 1] for pos in range(4, len(closes))]
+        np.testing.assert_almost_equal([np.std(w) for w in windows], std.get_by_idx(slice(4, None), 'value'))
+        np.testing.assert_almost_equal([np.var(w) for w in windows], var.get_by_idx(slice(4, None), 'value'))
+        np.testing.assert_almost_equal([np.std(w, ddof=1) for w in windows],
+                                       sample_std.get_by_idx(slice(4, None), 'value'))
+
+    def test_std_skip_nan(self):
+        std = STD(inputs=self.bar, input_keys='close', length=3)
+        std.start(self.app_context)
+
+        self.add_bars([1.0, np.nan, 3.0, 5.0, 7.0])
+        self.assertAlmostEqual(1.0, std.get_by_idx(2, 'value'))
+        self.assertAlmostEqual(1.0, std.get_by_idx(3, 'value'))
+        self.assertAlmostEqual(np.std([3.0, 5.0, 7.0]), std.now('value'))
+
+        self.bar.add(timestamp=4, data={"close": 5.0})
+        self.assertAlmostEqual(np.std([3.0, 5.0, 5.0]), std.now('value'))
+
+    def test_historical_volatility(self):
+        hv = HistoricalVolatility(inputs=self.bar, input_keys='close', length=5)
+        hv.start(self.app_context)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 50)
+        self.add_bars(closes)
+
+        self.assertTrue(math.isnan(hv.get_by_idx(3, 'value')))
+        for pos in range(4, len(closes)):
+            returns = np.log(closes[pos - 3:pos + 1] / closes[pos - 4:pos])
+            self.assertAlmostEqual(math.sqrt(252 * np.sum(returns ** 2) / 5), hv.get_by_idx(pos, 'value'))
+
+    def test_max_and_min(self):
+        highest = MAX(inputs=self.bar, input_keys='close', length=5)
+        highest.start(self.app_context)
+        lowest = MIN(inputs=self.bar, input_keys='close', length=5)
+        lowest.start(self.app_context)
+
+        closes = np.random.RandomState(0).uniform(50, 150, 100)
+        self.add_bars(closes)
+
+        self.assertTrue(math.isnan(highest.get_by_idx(3, 'value')))
+        windows = [closes[pos - 4:pos + 1] for pos in range(4, len(closes))]
+        np.testing.assert_array_equal([np.max(w) for w in windows], highest.get_by_idx(slice(4, None), 'value'))
+        np.testing.assert_array_equal([4 - np.argmax(w) for w in windows], highest.get_by_idx(slice(4, None), 'argmax'))
+        np.testing.assert_array_equal([np.min(w) for w in windows], lowest.get_by_idx(slice(4, None), 'value'))
+        np.testing.assert_array_equal([4 - np.argmin(w) for w in windows], lowest.get_by_idx(slice(4, None), 'argmin'))
+
+    def test_max_update_last_bar(self):
+        highest = MAX(inputs=self.bar, input_keys='close', length=3)
+        highest.start(self.app_context)
+
+        self.add_bars([3.0, np.nan, 1.0])
+        self.assertEqual(3.0, highest.now('value'))
+        self.assertEqual(2, highest.now('argmax'))
+
+        self.bar.add(timestamp=2, data={"close": 4.0})
+        self.assertEqual(4.0, highest.now('value'))
+        self.assertEqual(0, highest.now('argmax'))
+
+        self.bar.add(timestamp=2, data={"close": 2.0})
+        self.assertEqual(3.0, highest.now('value'))
+        self.assertEqual(2, highest.now('argmax'))
+
+        self.bar.add(timestamp=3, data={"close": 1.0})
+        self.assertEqual(2.0, highest.now('value'))
+        self.assertEqual(1, highest.now('argmax'))
@@ -0,0 +1,150 @@
+import numpy as np
+from unittest import TestCase
+
+from algotrader.model.time_series_pb2 import TimeSeries
+from algotrader.technical.ma import SMA
+from algotrader.technical.rolling_apply import RollingApply
+from algotrader.technical.stats import STD
+from algotrader.technical.sweep import SweepEMA, SweepSMA, SweepSTD
+from algotrader.trading.context import ApplicationContext
+from algotrader.utils.indicator import parse_series
+
+
+class SweepTest(TestCase):
+    lengths = [3, 5, 8, 13]
+
+    def setUp(self):
+        self.app_context = ApplicationContext()
+        self.closes = np.cumsum(np.random.RandomState(0).normal(0, 2.0, 120)) + 100
+        self.closes[[10, 50]] = np.nan
+        self.history = self.app_context.inst_data_mgr.get_series("history")
+        self.history.start(self.app_context)
+        self.streamed = self.app_context.inst_data_mgr.get_series("streamed")
+        self.streamed.start(self.app_context)
+
+    def test_name_and_views(self):
+        sma = SweepSMA(inputs=self.streamed, input_keys='close', lengths=self.lengths)
+        sma.start(self.app_context)
+        self.assertEqual("SweepSMA(streamed[close],lengths=3:5:8:13)", sma.name)
+        self.assertEqual(['3', '5', '8', '13'], list(sma.time_series.keys))
+        for t in range(20):
+            self.streamed.add(timestamp=t, data={"close": self.closes[t]})
+
+        view = sma.get_series(5)
+        self.assertEqual("SMA(streamed[close],length=5)", view.name)
+        self.assertIs(view, self.app_context.inst_data_mgr.get_series("SMA(streamed[close],length=5)"))
+        for t in range(20, 30):
+            self.streamed.add(timestamp=t, data={"close": self.closes[t]})
+        self.assertEqual(30, view.size())
+        np.testing.assert_array_equal(sma.get_by_idx(slice(None), '5'), view.get_by_idx(slice(None), 'value'))
+
+        ema = SweepEMA(inputs=self.streamed, input_keys='close', lengths=self.lengths)
+        ema.start(self.app_context)
+        self.assertEqual("RollingApply(streamed[close],length=8,kernel=ewm)", ema.get_series(8).name)
+        np.testing.assert_array_equal(ema.now_values(), [ema.now(key) for key in ['3', '5', '8', '13']])
+
+    def test_same_as_single_length_indicators(self):
+        self.history.extend(timestamps=np.arange(60), columns={"close": self.closes[:60]})
+        sweeps = []
+        singles = []
+        for input in [self.history, self.streamed]:
+            sweeps.append([SweepSMA(inputs=input, input_keys='close', lengths=self.lengths),
+                           SweepSTD(inputs=input, input_keys='close', lengths=self.lengths, ddof=1),
+                           SweepEMA(inputs=input, input_keys='close', lengths=self.lengths)])
+            singles.append([[SMA(inputs=input, input_keys='close', length=length),
+                             STD(inputs=input, input_keys='close', length=length, ddof=1),
+                             RollingApply(inputs=input, input_keys='close', length=length, kernel='ewm')]
+                            for length in self.lengths])
+            for indicator in sweeps[-1] + [single for group in singles[-1] for single in group]:
+                indicator.start(self.app_context)
+
+        for t in range(60):
+            self.streamed.add(timestamp=t, data={"close": self.closes[t]})
+        for t in range(60, 120):
+            for input in [self.history, self.streamed]:
+                input.add(timestamp=t, data={"close": self.closes[t]})
+                if t % 7 == 0:
+                    # update of the latest row
+                    input.add(timestamp=t, data={"close": self.closes[t] + 1.0})
+
+        for input_sweeps, input_singles in zip(sweeps, singles):
+            for idx, length in enumerate(self.lengths):
+                for sweep, single in zip(input_sweeps, input_singles[idx]):
+                    self.assertEqual(120, sweep.size())
+                    np.testing.assert_almost_equal(sweep.get_by_idx(slice(None), str(length)),
+                                                   single.get_by_idx(slice(None), 'value'))
+        # the sweep on the history continues exactly like the streamed one
+        for history_sweep, streamed_sweep in zip(*sweeps):
+            for key in history_sweep.time_series.keys:
+                np.testing.assert_array_equal(history_sweep.get_by_idx(slice(60, None), key),
+                                              streamed_sweep.get_by_idx(slice(60, None), key))
+
+    def test_long_history(self):
+        # the prefix sums restart every block, their rounding errors do not grow with the history
+        closes = np.cumsum(np.random.RandomState(1).normal(0, 2.0, 200000)) + 10000
+        closes[[5, 4100, 150000]] = np.nan
+        lengths = self.lengths + [300]
+        self.history.extend(timestamps=np.arange(len(closes)), columns={"close": closes})
+        sweeps = [SweepSMA(inputs=self.history, input_keys='close', lengths=lengths),
+                  SweepSTD(inputs=self.history, input_keys='close', lengths=lengths)]
+        streamed_sweep = SweepSMA(inputs=self.streamed, input_keys='close', lengths=self.lengths)
+        for sweep in sweeps + [streamed_sweep]:
+            sweep.start(self.app_context)
+        for t in range(len(closes) - 1000, len(closes)):
+            self.streamed.add(timestamp=t, data={"close": closes[t]})
+
+        for length in lengths:
+            for sweep, cls in zip(sweeps, [SMA, STD]):
+                single = cls(inputs=self.history, input_keys='close', length=length)
+                single.start(self.app_context)
+                np.testing.assert_almost_equal(single.get_by_idx(slice(None), 'value'),
+                                               sweep.get_by_idx(slice(None), str(length)), decimal=8)
+        for length in self.lengths:
+            np.testing.assert_almost_equal(streamed_sweep.get_by_idx(slice(length - 1, None), str(length)),
+                                           sweeps[0].get_by_idx(slice(len(closes) - 1001 + length, None),
+                                                                str(length)), decimal=8)
+
+    def test_ema_backfill(self):
+        self.history.extend(timestamps=np.arange(60), columns={"close": self.closes[:60]})
+        backfilled = SweepEMA(inputs=self.history, input_keys='close', lengths=self.lengths)
+        backfilled.start(self.app_context)
+        streamed = SweepEMA(inputs=self.streamed, input_keys='close', lengths=self.lengths)
+        streamed.start(self.app_context)
+        for t in range(60):
+            self.streamed.add(timestamp=t, data={"close": self.closes[t]})
+        for key in backfilled.time_series.keys:
+            np.testing.assert_array_equal(streamed.get_by_idx(slice(None), key),
+                                          backfilled.get_by_idx(slice(None), key))
+
+        # the state is seeded from the last row of the history, an update of that row then new rows
+        for input in [self.history, self.streamed]:
+            input.add(timestamp=59, data={"close": 90.0})
+            for t in range(60, 80):
+                input.add(timestamp=t, data={"close": self.closes[t]})
+        for key in backfilled.time_series.keys:
+            np.testing.assert_array_equal(streamed.get_by_idx(slice(59, None), key),
+                                          backfilled.get_by_idx(slice(59, None), key))
+
+    def test_parse_and_restore(self):
+        name = "SweepSTD(history[close],lengths=5:10)"
+        sweep = parse_series(self.app_context.inst_data_mgr, name, self.app_context)
+        self.assertIsInstance(sweep, SweepSTD)
+        self.assertEqual(name, sweep.name)
+        self.assertEqual([5, 10], sweep.lengths)
+        for t in range(80):
+            self.history.add(timestamp=t, data={"close": self.closes[t]})
+        time_series = TimeSeries()
+        time_series.CopyFrom(sweep.sync_time_series())
+
+        restarted = ApplicationContext()
+        history = restarted.inst_data_mgr.get_series("history")
+        history.start(restarted)
+        restored = SweepSTD(time_series=time_series)
+        restored.start(restarted)
+        self.assertEqual(80, restored.size())
+        for t in range(80, 120):
+            self.history.add(timestamp=t, data={"close": self.closes[t]})
+            history.add(timestamp=t, data={"close": self.closes[t]})
+        for key in sweep.time_series.keys:
+            np.testing.assert_array_equal(sweep.get_by_idx(slice(80, None), key),
+                                          restored.get_by_idx(slice(80, None), key))
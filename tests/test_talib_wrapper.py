@@ -4,7 +4,8 @@ import numpy as np
 import talib
 from unittest import TestCase
 
-from algotrader.technical.talib_wrapper import SMA
+from algotrader.technical import talib_wrapper
+from algotrader.technical.talib_wrapper import ATR, BBANDS, EMA, SMA
 from algotrader.trading.context import ApplicationContext
 from algotrader.trading.data_series import DataSeries
 from algotrader.model.model_factory import ModelFactory
@@ -142,3 +143,60 @@ class TALibSMATest(TestCase):
             np.testing.assert_almost_equal(target, result, 5)
         except AssertionError as e:
             self.fail(e.message)
+
+    def create_bars(self, count):
+        rw = np.cumsum(np.random.RandomState(0).normal(0, 2, count)) + 100
+        bar = self.app_context.inst_data_mgr.get_series("bar")
+        bar.start(self.app_context)
+        return bar, {"high": rw + 1, "low": rw - 1, "close": rw}
+
+    def test_generated_family(self):
+        for func_name in talib.get_functions():
+            self.assertEqual(func_name, getattr(talib_wrapper, func_name).__name__)
+        bb = BBANDS(inputs="bar", input_keys='close', length=20, nbdevup=1.5)
+        self.assertEqual("BBANDS(bar[close],length=20,nbdevup=1.5)", bb.name)
+        self.assertEqual({'timeperiod': 20, 'nbdevup': 1.5, 'nbdevdn': 2.0, 'matype': 0}, dict(bb.params))
+        self.assertEqual(["upperband", "middleband", "lowerband"], list(bb.time_series.keys))
+
+    def test_streaming_matches_talib(self):
+        bar, columns = self.create_bars(300)
+        ema = EMA(inputs=bar, input_keys='close', length=20)
+        ema.start(self.app_context)
+        bb = BBANDS(inputs=bar, input_keys='close', length=20)
+        bb.start(self.app_context)
+        atr = ATR(inputs=bar, length=14)
+        atr.start(self.app_context)
+
+        for t in range(300):
+            bar.add(timestamp=t, data={key: values[t] for key, values in columns.items()})
+
+        np.testing.assert_almost_equal(talib.EMA(columns["close"], 20), ema.get_by_idx(slice(None), 'value'))
+        for key, values in zip(["upperband", "middleband", "lowerband"], talib.BBANDS(columns["close"], 20)):
+            np.testing.assert_almost_equal(values, bb.get_by_idx(slice(None), key))
+        np.testing.assert_almost_equal(talib.ATR(columns["high"], columns["low"], columns["close"], 14),
+                                       atr.get_by_idx(slice(None), 'value'))
+
+    def test_update_last_bar(self):
+        bar, columns = self.create_bars(50)
+        ema = EMA(inputs=bar, input_keys='close', length=10)
+        ema.start(self.app_context)
+
+        for t in range(50):
+            bar.add(timestamp=t, data={"close": columns["close"][t]})
+        bar.add(timestamp=49, data={"close": 100.0})
+        bar.add(timestamp=50, data={"close": 101.0})
+
+        closes = np.append(columns["close"][:49], [100.0, 101.0])
+        np.testing.assert_almost_equal(talib.EMA(closes, 10)[-2:], ema.get_by_idx(slice(-2, None), 'value'))
+
+    def test_backfill(self):
+        bar, columns = self.create_bars(300)
+        bar.extend(timestamps=np.arange(250), columns={key: values[:250] for key, values in columns.items()})
+        atr = ATR(inputs=bar, length=14)
+        atr.start(self.app_context)
+        self.assertEqual(250, atr.size())
+
+        for t in range(250, 300):
+            bar.add(timestamp=t, data={key: values[t] for key, values in columns.items()})
+        np.testing.assert_almost_equal(talib.ATR(columns["high"], columns["low"], columns["close"], 14),
+                                       atr.get_by_idx(slice(None), 'value'))